@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import pandas as pd
+
+from youtube_success_ml.data.loader import load_dataset
+from youtube_success_ml.data.rollups import (
+    ROLLUP_COLUMNS,
+    build_analytics_rollup,
+    category_performance,
+    country_metrics,
+    upload_bucket_labels,
+    upload_growth_buckets,
+)
+from youtube_success_ml.visualization.maps import build_country_metrics
+
+
+def _groupby_queries(df: pd.DataFrame) -> None:
+    """The per-request row-level aggregations the analytics endpoints used to run."""
+    df.groupby("category", as_index=False).agg(
+        channel_count=("youtuber", "count"),
+        avg_subscribers=("subscribers", "mean"),
+        avg_earnings=("highest_yearly_earnings", "mean"),
+        avg_growth=("growth_target", "mean"),
+        total_subscribers=("subscribers", "sum"),
+        total_earnings=("highest_yearly_earnings", "sum"),
+    ).sort_values("total_subscribers", ascending=False).head(12).to_dict(orient="records")
+    bucketed = df.assign(upload_bucket=upload_bucket_labels(df["uploads"]))
+    bucketed.groupby("upload_bucket", as_index=False).agg(
+        channel_count=("youtuber", "count"),
+        avg_growth=("growth_target", "mean"),
+        avg_earnings=("highest_yearly_earnings", "mean"),
+        avg_subscribers=("subscribers", "mean"),
+    ).sort_values("upload_bucket").to_dict(orient="records")
+    build_country_metrics(df)
+
+
+def _timed(label: str, fn, repeats: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeats
+    print(f"[bench] {label:<30} {elapsed * 1000:9.2f} ms per request set")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark rollup slicing against groupbys")
+    parser.add_argument("--rows", type=int, nargs="+", default=[995, 100_000, 1_000_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    original = load_dataset(columns=ROLLUP_COLUMNS)
+    for rows in args.rows:
+        repeats = -(-rows // len(original))
+        df = pd.concat([original] * repeats, ignore_index=True).head(rows)
+        start = time.perf_counter()
+        rollup = build_analytics_rollup(df)
+        build_s = time.perf_counter() - start
+        print(f"[bench] rows={rows} cube_cells={len(rollup.cells)} build={build_s:.3f}s")
+        _timed("row-level groupbys", lambda df=df: _groupby_queries(df), args.repeats)
+        _timed(
+            "rollup slices",
+            lambda rollup=rollup: (
+                category_performance(rollup, 12),
+                upload_growth_buckets(rollup),
+                country_metrics(rollup),
+            ),
+            args.repeats,
+        )
+
+
+if __name__ == "__main__":
+    main()
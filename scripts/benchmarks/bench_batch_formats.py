@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from fastapi.encoders import jsonable_encoder
+
+from youtube_success_ml.api.serialization import (
+    JSON_ENCODER,
+    arrow_available,
+    dumps_arrow,
+    dumps_json,
+    loads_arrow_columns,
+)
+from youtube_success_ml.config import INFERENCE_ENGINES, MODEL_DIR
+from youtube_success_ml.data.loader import load_dataset
+from youtube_success_ml.models.supervised import (
+    FEATURE_COLUMNS,
+    load_supervised_bundle,
+)
+from youtube_success_ml.schemas import (
+    BatchPredictionRequest,
+    BatchPredictionResponse,
+    ColumnarPredictionRequest,
+)
+from youtube_success_ml.services.intelligence_service import IntelligenceService
+
+
+def _time_ms(fn: Callable[[], object], repeats: int) -> tuple[float, float]:
+    fn()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(0.95 * (len(samples) - 1))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare row and columnar /predict/batch handling, body in to body out"
+    )
+    parser.add_argument("--model-dir", type=Path, default=MODEL_DIR)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    bundle = load_supervised_bundle(args.model_dir)
+    payloads = load_dataset(columns=FEATURE_COLUMNS).to_dict(orient="records")
+    batch = (payloads * (args.batch_size // len(payloads) + 1))[: args.batch_size]
+    row_body = json.dumps({"items": batch}).encode()
+    feature_columns = {key: [row[key] for row in batch] for key in FEATURE_COLUMNS}
+    column_body = json.dumps(feature_columns).encode()
+    arrow_body = dumps_arrow(feature_columns) if arrow_available() else None
+    print(
+        f"[bench] batch={len(batch)} request bytes rows={len(row_body)} "
+        f"columns={len(column_body)} arrow={len(arrow_body) if arrow_body else '-'} "
+        f"encoder={JSON_ENCODER}"
+    )
+
+    for engine in INFERENCE_ENGINES:
+        # No prediction cache, so repeated row batches are scored every time like columns.
+        service = IntelligenceService(
+            supervised=bundle, clustering=None, baseline=None, engine=engine
+        )
+
+        def rows(service: IntelligenceService = service) -> bytes:
+            request = BatchPredictionRequest.model_validate(json.loads(row_body))
+            response = BatchPredictionResponse(**service.predict_batch(request.items))
+            return json.dumps(jsonable_encoder(response)).encode()
+
+        def columns(service: IntelligenceService = service) -> bytes:
+            request = ColumnarPredictionRequest.model_validate(json.loads(column_body))
+            return dumps_json(service.predict_columns(request))
+
+        def arrow(service: IntelligenceService = service) -> bytes:
+            request = ColumnarPredictionRequest.from_arrays(loads_arrow_columns(arrow_body))
+            result = service.predict_columns(request)
+            summary = result.pop("summary")
+            return dumps_arrow(result, {"summary": summary})
+
+        cases = [(f"{engine} rows", rows), (f"{engine} columns", columns)]
+        if arrow_body is not None:
+            cases.append((f"{engine} arrow", arrow))
+        for label, fn in cases:
+            p50, p95 = _time_ms(fn, args.repeats)
+            print(
+                f"[bench] {label:<20} p50={p50:9.3f} ms  p95={p95:9.3f} ms  "
+                f"response={len(fn())} bytes"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import pandas as pd
+
+from youtube_success_ml.data import loader
+
+
+def _mb(df: pd.DataFrame) -> float:
+    return df.memory_usage(deep=True).sum() / 1e6
+
+
+def _timed(label: str, fn) -> pd.DataFrame:
+    start = time.perf_counter()
+    df = fn()
+    elapsed = time.perf_counter() - start
+    print(f"[bench] {label:<28} {elapsed:7.3f}s  {_mb(df):8.1f} MB in memory")
+    return df
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the columnar dataset cache")
+    parser.add_argument("--rows", type=int, default=500_000, help="Rows in the scaled-up CSV")
+    args = parser.parse_args()
+
+    source = loader.resolve_data_path()
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        scaled = tmp_dir / source.name
+        original = pd.read_csv(source, encoding="latin-1")
+        repeats = -(-args.rows // len(original))
+        pd.concat([original] * repeats, ignore_index=True).head(args.rows).to_csv(
+            scaled, index=False, encoding="latin-1"
+        )
+        print(f"[bench] rows={args.rows} csv={scaled.stat().st_size / 1e6:.1f} MB")
+
+        loader.DATASET_CACHE_DIR = tmp_dir / "cache"
+        typed = _timed("csv parse (no cache)", lambda: loader._parse_csv(scaled))
+        untyped = typed.astype({col: str for col in loader.CATEGORICAL_COLUMNS})
+        print(
+            f"[bench] {'  same frame, str columns':<28} {'':>8}  {_mb(untyped):8.1f} MB in memory"
+        )
+        _timed("cold (parse + write cache)", lambda: loader.load_raw_dataset(scaled))
+        _timed("warm (read cache)", lambda: loader.load_raw_dataset(scaled))
+        (cache_file,) = loader.DATASET_CACHE_DIR.glob("*.parquet")
+        print(f"[bench] parquet cache size          {cache_file.stat().st_size / 1e6:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
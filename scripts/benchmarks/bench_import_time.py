@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from youtube_success_ml.config import COLD_START_BUDGET_SECONDS
+
+APP_MODULES = ("youtube_success_ml.api.fastapi_app", "youtube_success_ml.api.flask_app")
+# Loaded by the first request that needs them, never by importing an app.
+DEFERRED_MODULES = ("sklearn", "scipy", "joblib", "pandas", "pyarrow", "plotly", "folium")
+
+
+def _import_report(module: str) -> tuple[float, list[tuple[str, int, int]], list[str]]:
+    """Wall time, ``-X importtime`` rows and deferred modules loaded by importing ``module``."""
+    probe = (
+        f"import sys; import {module}; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(SRC_DIR), os.getenv("PYTHONPATH", "")])}
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    elapsed = time.perf_counter() - start
+
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        rows.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    loaded = [name for name in out.stdout.strip().split(",") if name]
+    return elapsed, rows, loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Per-module import-time report for the API apps against the cold-start budget"
+    )
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget", type=float, default=COLD_START_BUDGET_SECONDS)
+    args = parser.parse_args()
+
+    for module in APP_MODULES:
+        elapsed, rows, loaded = _import_report(module)
+        verdict = "ok" if elapsed <= args.budget and not loaded else "OVER"
+        print(
+            f"[bench] {module} cold_start={elapsed:.3f} s budget={args.budget:.3f} s "
+            f"deferred_loaded={','.join(loaded) or '-'} {verdict}"
+        )
+        for name, self_us, cumulative_us in sorted(rows, key=lambda row: -row[2])[: args.top]:
+            print(
+                f"[bench]   {name.strip():<55} self={self_us / 1000:8.2f} ms  "
+                f"cumulative={cumulative_us / 1000:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from youtube_success_ml.config import MODEL_DIR
+from youtube_success_ml.data.loader import load_dataset
+from youtube_success_ml.models.compiled import (
+    batch_predict_compiled,
+    compile_supervised_bundle,
+    predict_compiled,
+)
+from youtube_success_ml.models.supervised import (
+    FEATURE_COLUMNS,
+    batch_predict_from_bundle,
+    load_supervised_bundle,
+    predict_from_bundle,
+)
+
+
+def _time_ms(fn: Callable[[], object], repeats: int) -> tuple[float, float]:
+    fn()
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return statistics.median(samples), samples[int(0.95 * (len(samples) - 1))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare sklearn and compiled inference latency")
+    parser.add_argument("--model-dir", type=Path, default=MODEL_DIR)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    bundle = load_supervised_bundle(args.model_dir)
+    start = time.perf_counter()
+    compiled = compile_supervised_bundle(bundle)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    payloads = load_dataset(columns=FEATURE_COLUMNS).to_dict(orient="records")
+    batch = (payloads * (args.batch_size // len(payloads) + 1))[: args.batch_size]
+    single = batch[0]
+
+    reference = batch_predict_from_bundle(bundle, batch)
+    candidate = batch_predict_compiled(compiled, batch)
+    max_rel_err = max(
+        abs(a[k] - b[k]) / max(abs(a[k]), 1.0)
+        for a, b in zip(reference, candidate, strict=True)
+        for k in a
+    )
+
+    print(
+        f"[bench] compiled {compiled.forest.n_trees} trees / {compiled.forest.n_nodes} nodes "
+        f"in {compile_ms:.1f} ms (max relative error {max_rel_err:.2e})"
+    )
+    rows = [
+        ("single sklearn", lambda: predict_from_bundle(bundle, single)),
+        ("single compiled", lambda: predict_compiled(compiled, single)),
+        (f"batch[{len(batch)}] sklearn", lambda: batch_predict_from_bundle(bundle, batch)),
+        (f"batch[{len(batch)}] compiled", lambda: batch_predict_compiled(compiled, batch)),
+    ]
+    for label, fn in rows:
+        p50, p95 = _time_ms(fn, args.repeats)
+        print(f"[bench] {label:<24} p50={p50:9.3f} ms  p95={p95:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
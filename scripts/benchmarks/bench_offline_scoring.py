@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import numpy as np
+
+from youtube_success_ml.config import MODEL_DIR
+from youtube_success_ml.data.loader import load_dataset
+from youtube_success_ml.score import score_file
+
+
+def _write_synthetic(path: Path, rows: int, seed: int) -> None:
+    """Resample real feature rows (with jittered uploads) into a large CSV, in blocks."""
+    source = load_dataset(columns=["uploads", "category", "country", "age"]).reset_index(drop=True)
+    rng = np.random.default_rng(seed)
+    block = 1_000_000
+    for start in range(0, rows, block):
+        n = min(block, rows - start)
+        sample = source.iloc[rng.integers(0, len(source), size=n)].reset_index(drop=True)
+        sample["uploads"] = (sample["uploads"] * rng.uniform(0.5, 1.5, size=n)).round()
+        sample.insert(0, "channel_id", np.arange(start, start + n))
+        sample.to_csv(path, mode="a", header=start == 0, index=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Measure offline scoring throughput by workers")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Synthetic rows (e.g. 10M)")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+        help="Worker counts to compare",
+    )
+    parser.add_argument("--model-dir", type=Path, default=MODEL_DIR)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "synthetic.csv"
+        _write_synthetic(input_path, args.rows, args.seed)
+        print(f"[bench] rows={args.rows} chunksize={args.chunksize} cores={os.cpu_count()}")
+
+        baseline = None
+        for workers in args.workers:
+            report = score_file(
+                input_path,
+                Path(tmp) / f"scored_{workers}.csv",
+                model_dir=args.model_dir,
+                chunksize=args.chunksize,
+                workers=workers,
+                restart=True,
+            )
+            rate = report["rows_per_second"]
+            baseline = baseline or rate
+            print(
+                f"[bench] workers={workers:<3} {rate:12.1f} rows/s  "
+                f"score={report['score_seconds']:8.2f}s  speedup={rate / baseline:5.2f}x"
+            )
+            (Path(tmp) / f"scored_{workers}.csv").unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+import numpy as np
+import pandas as pd
+
+from youtube_success_ml.data.loader import resolve_data_path
+from youtube_success_ml.mlops.quality import build_data_quality_report_streaming
+
+
+def _write_scaled_csv(path: Path, rows: int, chunk_rows: int = 250_000) -> None:
+    """Repeat the source rows with unique channel names, so true duplicates are zero."""
+    source = pd.read_csv(resolve_data_path(), encoding="latin-1")
+    name_col = source.columns[1]
+    written = 0
+    while written < rows:
+        n = min(chunk_rows, rows - written)
+        chunk = source.iloc[np.arange(written, written + n) % len(source)].copy()
+        chunk[name_col] = [f"channel-{i}" for i in range(written, written + n)]
+        chunk.to_csv(path, mode="a", header=written == 0, index=False, encoding="latin-1")
+        written += n
+
+
+def _profile(path: str, chunksize: int) -> None:
+    start = time.perf_counter()
+    report = build_data_quality_report_streaming(path, chunksize=chunksize)
+    result = {
+        "seconds": round(time.perf_counter() - start, 2),
+        "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024,
+        "rows": report["raw"]["rows"],
+        "raw_duplicates": report["raw"]["duplicates"],
+        "bound": report["error_bounds"]["raw_duplicates"],
+    }
+    print(json.dumps(result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the streaming quality profiler")
+    parser.add_argument("--rows", type=int, nargs="+", default=[500_000, 2_000_000])
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--profile", type=str, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.profile:
+        _profile(args.profile, args.chunksize)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = Path(tmp) / f"channels-{rows}.csv"
+            _write_scaled_csv(path, rows)
+            # Fresh interpreter per size so peak RSS reflects only that run.
+            out = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--profile",
+                    str(path),
+                    "--chunksize",
+                    str(args.chunksize),
+                ],
+                check=True,
+                capture_output=True,
+                text=True,
+            )
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            print(
+                f"[bench] rows={rows:>10,} csv={path.stat().st_size / 1e6:8.1f} MB "
+                f"time={result['seconds']:7.2f}s peak_rss={result['max_rss_mb']:5d} MB "
+                f"duplicates={result['raw_duplicates']} (+/-{result['bound']})"
+            )
+            path.unlink()
+
+
+if __name__ == "__main__":
+    main()
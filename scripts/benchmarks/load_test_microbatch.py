@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+SRC_DIR = ROOT_DIR / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+# Distinct payloads per request; keep the prediction cache out of the measurement.
+os.environ.setdefault("YTS_PREDICTION_CACHE_SIZE", "0")
+
+import httpx
+
+from youtube_success_ml.api import dependencies
+from youtube_success_ml.api.batching import MicroBatcher
+from youtube_success_ml.api.fastapi_app import app
+
+CATEGORIES = ["Music", "Entertainment", "Gaming", "Education", "People & Blogs"]
+COUNTRIES = ["United States", "India", "Brazil", "United Kingdom", "Japan"]
+
+
+async def _client(
+    client: httpx.AsyncClient, client_id: int, n_requests: int, latencies: list[float]
+) -> None:
+    for i in range(n_requests):
+        payload = {
+            "uploads": 50 + client_id * n_requests + i,
+            "category": CATEGORIES[(client_id + i) % len(CATEGORIES)],
+            "country": COUNTRIES[client_id % len(COUNTRIES)],
+            "age": 1 + i % 15,
+        }
+        start = time.perf_counter()
+        response = await client.post("/predict", json=payload)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+
+
+async def _run(clients: int, n_requests: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post(
+            "/predict", json={"uploads": 1, "category": "Music", "country": "India", "age": 1}
+        )
+        start = time.perf_counter()
+        await asyncio.gather(*(_client(client, c, n_requests, latencies) for c in range(clients)))
+        elapsed = time.perf_counter() - start
+    return elapsed, latencies
+
+
+def _report(label: str, elapsed: float, latencies: list[float]) -> float:
+    latencies.sort()
+    throughput = len(latencies) / elapsed
+    print(
+        f"[bench] {label:<10} {throughput:9.1f} req/s  "
+        f"p50={statistics.median(latencies):8.2f} ms  "
+        f"p95={latencies[int(0.95 * (len(latencies) - 1))]:8.2f} ms"
+    )
+    return throughput
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Load test /predict with and without micro-batching"
+    )
+    parser.add_argument("--clients", type=int, default=128)
+    parser.add_argument("--requests-per-client", type=int, default=10)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    total = args.clients * args.requests_per_client
+    print(f"[bench] {args.clients} concurrent clients, {total} requests per mode")
+
+    dependencies.MICROBATCH_ENABLED = False
+    direct = _report("direct", *asyncio.run(_run(args.clients, args.requests_per_client)))
+
+    dependencies.MICROBATCH_ENABLED = True
+    dependencies._prediction_batcher = MicroBatcher(
+        dependencies._score_prediction_batch,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+    )
+    batched = _report("batched", *asyncio.run(_run(args.clients, args.requests_per_client)))
+
+    histogram = dependencies._prediction_batcher.batch_size_histogram
+    print(f"[bench] mean batch size: {histogram.mean:.1f}")
+    print(f"[bench] throughput gain: {batched / direct:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
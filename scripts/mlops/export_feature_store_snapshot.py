@@ -4,8 +4,12 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from youtube_success_ml.data.loader import load_dataset
-from youtube_success_ml.mlops.feature_store import save_feature_snapshot
+from youtube_success_ml.data.loader import iter_dataset, load_dataset
+from youtube_success_ml.mlops.feature_store import (
+    SNAPSHOT_COLUMNS,
+    save_feature_snapshot,
+    save_feature_snapshot_streaming,
+)
 
 
 def main() -> None:
@@ -22,10 +26,20 @@ def main() -> None:
         default=Path("artifacts/reports/feature_store_snapshot.csv"),
         help="Output snapshot CSV",
     )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="Stream the input in chunks of this many rows instead of loading it whole",
+    )
     args = parser.parse_args()
 
-    df = load_dataset(path=args.input)
-    output = save_feature_snapshot(df, args.output)
+    if args.chunksize:
+        chunks = iter_dataset(path=args.input, chunksize=args.chunksize, columns=SNAPSHOT_COLUMNS)
+        output = save_feature_snapshot_streaming(chunks, args.output)
+    else:
+        df = load_dataset(path=args.input, columns=SNAPSHOT_COLUMNS)
+        output = save_feature_snapshot(df, args.output)
     print(f"[feature-store] snapshot exported to {output}")
 
 
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from starlette.concurrency import run_in_threadpool
+
+DEFAULT_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class Histogram:
+    """Minimal cumulative histogram rendered in Prometheus text format."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self._counts = [0] * len(self.buckets)
+        self._sum = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self._sum += value
+            self._count += 1
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    self._counts[i] += 1
+
+    @property
+    def mean(self) -> float:
+        with self._lock:
+            return self._sum / self._count if self._count else 0.0
+
+    def render(self, name: str, help_text: str) -> list[str]:
+        with self._lock:
+            lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+            for bound, count in zip(self.buckets, self._counts, strict=True):
+                lines.append(f'{name}_bucket{{le="{bound:g}"}} {count}')
+            lines.append(f'{name}_bucket{{le="+Inf"}} {self._count}')
+            lines.append(f"{name}_sum {self._sum:g}")
+            lines.append(f"{name}_count {self._count}")
+            return lines
+
+
+class MicroBatcher:
+    """Coalesce concurrent single-item calls into one vectorized ``score`` call.
+
+    Callers ``await submit(item)``; a worker task drains the queue into batches
+    of at most ``max_batch_size`` items, waiting at most ``max_wait_ms`` after
+    the first item for more to arrive, and scores each batch in the threadpool.
+    The queue is bound to the running event loop and rebuilt if the loop changes.
+    """
+
+    def __init__(
+        self,
+        score: Callable[[list[Any]], list[Any]],
+        max_batch_size: int = 64,
+        max_wait_ms: float = 2.0,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        self.score = score
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max(max_wait_ms, 0.0) / 1000
+        self.batch_size_histogram = Histogram()
+        self.queue_depth_histogram = Histogram()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[tuple[Any, asyncio.Future[Any]]] | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    def _ensure_worker(self) -> asyncio.Queue[tuple[Any, asyncio.Future[Any]]]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._queue is None or self._worker is None:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        elif self._worker.done():
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def submit(self, item: Any) -> Any:
+        queue = self._ensure_worker()
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self.queue_depth_histogram.observe(queue.qsize())
+        queue.put_nowait((item, future))
+        return await future
+
+    async def _collect(
+        self, queue: asyncio.Queue[tuple[Any, asyncio.Future[Any]]]
+    ) -> list[tuple[Any, asyncio.Future[Any]]]:
+        batch = [await queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self, queue: asyncio.Queue[tuple[Any, asyncio.Future[Any]]]) -> None:
+        while True:
+            batch = await self._collect(queue)
+            live = [(item, future) for item, future in batch if not future.cancelled()]
+            if not live:
+                continue
+            self.batch_size_histogram.observe(len(live))
+            try:
+                results = await run_in_threadpool(self.score, [item for item, _ in live])
+            except Exception as exc:  # noqa: BLE001
+                for _, future in live:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), result in zip(live, results, strict=True):
+                if not future.done():
+                    future.set_result(result)
+
+    def render_metrics(self) -> list[str]:
+        return [
+            *self.batch_size_histogram.render(
+                "prediction_microbatch_size", "Items scored per micro-batch"
+            ),
+            *self.queue_depth_histogram.render(
+                "prediction_microbatch_queue_depth", "Queued items seen by each new request"
+            ),
+        ]
@@ -1,16 +1,47 @@
 from __future__ import annotations
 
+import json
+import threading
 import time
 from collections import defaultdict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Request, Response
+from fastapi.encoders import jsonable_encoder
 
-from youtube_success_ml.services.intelligence_service import IntelligenceService
+from youtube_success_ml.api.batching import MicroBatcher
+from youtube_success_ml.api.http_cache import get_response_cache
+from youtube_success_ml.api.serialization import (
+    ARROW_STREAM_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    dumps_arrow,
+    negotiate_media_type,
+)
+from youtube_success_ml.api.warmup import ServiceWarmup
+from youtube_success_ml.config import (
+    MICROBATCH_ENABLED,
+    MICROBATCH_MAX_BATCH_SIZE,
+    MICROBATCH_MAX_WAIT_MS,
+)
+from youtube_success_ml.lazy import LazyModule
+from youtube_success_ml.schemas import PredictionRequest
+
+if TYPE_CHECKING:
+    from youtube_success_ml.services.intelligence_service import IntelligenceService
+
+# Loading the service pulls in scikit-learn and pandas; defer that to the first request.
+intelligence_service = LazyModule("youtube_success_ml.services.intelligence_service")
 
 request_count_by_path: dict[str, int] = defaultdict(int)
 request_latency_sum_by_path: dict[str, float] = defaultdict(float)
 
 _service: IntelligenceService | None = None
+# Serializes loads so a request racing the startup warm-up waits for, and then shares,
+# the instance being loaded instead of loading the bundles a second time.
+_service_lock = threading.Lock()
+_prediction_batcher: MicroBatcher | None = None
+_service_warmup: ServiceWarmup | None = None
 
 
 def track_request(path: str, elapsed_seconds: float) -> None:
@@ -21,13 +52,108 @@ def track_request(path: str, elapsed_seconds: float) -> None:
 def get_service() -> IntelligenceService:
     global _service
     if _service is None:
-        try:
-            _service = IntelligenceService.from_artifacts()
-        except FileNotFoundError as exc:
-            raise HTTPException(status_code=503, detail="Model artifacts unavailable") from exc
+        with _service_lock:
+            if _service is None:
+                try:
+                    _service = intelligence_service.IntelligenceService.from_artifacts()
+                except FileNotFoundError as exc:
+                    raise HTTPException(
+                        status_code=503, detail="Model artifacts unavailable"
+                    ) from exc
+    return _service
+
+
+def loaded_service() -> IntelligenceService | None:
+    """The service if it has already been loaded, without triggering a load."""
     return _service
 
 
+def get_service_warmup() -> ServiceWarmup:
+    """Shared background loader and warm-up for ``get_service``, started at app startup."""
+    global _service_warmup
+    if _service_warmup is None:
+        _service_warmup = ServiceWarmup(get_service)
+    return _service_warmup
+
+
 def invalidate_service_cache() -> None:
     global _service
     _service = None
+
+
+def _score_prediction_batch(requests: list[PredictionRequest]) -> list[dict[str, float]]:
+    # Resolved per batch so a service reload is picked up by the next batch.
+    return get_service().predict_many(requests)
+
+
+def get_prediction_batcher() -> MicroBatcher | None:
+    """Shared single-row prediction batcher; ``None`` when micro-batching is disabled."""
+    global _prediction_batcher
+    if not MICROBATCH_ENABLED:
+        return None
+    if _prediction_batcher is None:
+        _prediction_batcher = MicroBatcher(
+            _score_prediction_batch,
+            max_batch_size=MICROBATCH_MAX_BATCH_SIZE,
+            max_wait_ms=MICROBATCH_MAX_WAIT_MS,
+        )
+    return _prediction_batcher
+
+
+def _render_json(content: Any) -> str:
+    # Same serialization as FastAPI's default JSONResponse.
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    )
+
+
+def response_media_type(request: Request) -> str:
+    """JSON or Arrow IPC stream, per the request's Accept header; 406 if neither."""
+    media_type = negotiate_media_type(request.headers.get("accept"))
+    if media_type is None:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Supported response types: {JSON_MEDIA_TYPE}, {ARROW_STREAM_MEDIA_TYPE}",
+        )
+    return media_type
+
+
+def arrow_response(columns: Any, metadata: dict[str, Any] | None = None) -> Response:
+    return Response(
+        dumps_arrow(columns, metadata),
+        media_type=ARROW_STREAM_MEDIA_TYPE,
+        headers={"Vary": "Accept"},
+    )
+
+
+def cached_json_response(
+    request: Request,
+    key: str,
+    version: str,
+    build: Callable[[], Any],
+    last_modified: float | None = None,
+    build_arrow: Callable[[], bytes] | None = None,
+) -> Response:
+    """JSON response served from the shared response cache until ``version`` changes.
+
+    With ``build_arrow`` the representation is negotiated on Accept, and each one is
+    cached under its own key (and so its own ETag).
+    """
+    media_type, render = JSON_MEDIA_TYPE, lambda: _render_json(build())
+    if build_arrow is not None and response_media_type(request) == ARROW_STREAM_MEDIA_TYPE:
+        media_type, render, key = ARROW_STREAM_MEDIA_TYPE, build_arrow, f"arrow:{key}"
+    status, payload, headers = get_response_cache().respond(
+        f"fastapi:{key}",
+        version,
+        render,
+        request.headers,
+        last_modified=last_modified,
+        media_type=media_type,
+    )
+    if build_arrow is not None:
+        headers["Vary"] = f"Accept, {headers['Vary']}"
+    return Response(payload, status_code=status, headers=headers, media_type=media_type)
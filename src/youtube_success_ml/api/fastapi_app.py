@@ -1,21 +1,32 @@
 from __future__ import annotations
 
 import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from youtube_success_ml.api.dependencies import track_request
+from youtube_success_ml.api.dependencies import get_service_warmup, track_request
 from youtube_success_ml.api.routers import (
     analytics_router,
     health_router,
     mlops_router,
     predictions_router,
 )
+from youtube_success_ml.config import WARMUP_ENABLED
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Warm in the background so the server accepts connections (and /ready) right away.
+    if WARMUP_ENABLED:
+        get_service_warmup().start()
+    yield
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="YouTube Success Prediction ML API", version="2.0.0")
+    app = FastAPI(title="YouTube Success Prediction ML API", version="2.0.0", lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
@@ -1,39 +1,71 @@
 from __future__ import annotations
 
 import importlib.util
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
-from flask import Flask, jsonify, request
-
-from youtube_success_ml.data.loader import load_dataset, load_raw_dataset
+from flask import Flask, Response, jsonify, request, stream_with_context
+
+from youtube_success_ml.api.http_cache import (
+    JSON_MEDIA_TYPE,
+    conditional_response,
+    current_run_version,
+    dataset_version,
+    get_map_page_cache,
+    get_response_cache,
+)
+from youtube_success_ml.api.serialization import dumps_json
+from youtube_success_ml.api.warmup import ServiceWarmup
+from youtube_success_ml.config import STREAM_CHUNK_SIZE, WARMUP_ENABLED
+from youtube_success_ml.lazy import LazyModule
 from youtube_success_ml.mlops.registry import check_artifacts_ready, load_manifest, load_registry
 from youtube_success_ml.schemas import (
     BatchPredictionRequest,
+    ClusterAssignRequest,
+    ColumnarPredictionRequest,
     DriftCheckRequest,
     PredictionRequest,
     SimulationRequest,
 )
-from youtube_success_ml.services.intelligence_service import IntelligenceService
-from youtube_success_ml.visualization.maps import (
-    build_category_dominance_map_html,
-    build_country_metrics,
-    build_earnings_choropleth_html,
-    build_influence_map_html,
-)
+from youtube_success_ml.services.stream_scoring import NDJSONPredictionStream
+
+if TYPE_CHECKING:
+    from youtube_success_ml.services.intelligence_service import IntelligenceService
+
+# pandas, scikit-learn and joblib load with the first request that needs them.
+data_cache = LazyModule("youtube_success_ml.data.cache")
+rollups = LazyModule("youtube_success_ml.data.rollups")
+intelligence_service = LazyModule("youtube_success_ml.services.intelligence_service")
 
 app = Flask(__name__)
 
 service: IntelligenceService | None = None
+_service_lock = threading.Lock()
 
 
 def _service() -> IntelligenceService:
     global service
     if service is None:
-        service = IntelligenceService.from_artifacts()
+        # One load shared by the warm-up thread and any request that arrives during it.
+        with _service_lock:
+            if service is None:
+                service = intelligence_service.IntelligenceService.from_artifacts()
     return service
 
 
+warmup = ServiceWarmup(_service)
+
+
+@app.before_request
+def start_warmup():
+    # Flask has no startup event, so under a WSGI server the first request (normally the
+    # orchestrator's /ready probe) starts the warm-up; ``__main__`` starts it up front.
+    if WARMUP_ENABLED and warmup.state == "idle":
+        warmup.start()
+
+
 @app.get("/health")
 def health():
     return jsonify({"status": "ok"})
@@ -42,9 +74,13 @@ def health():
 @app.get("/ready")
 def ready():
     status = check_artifacts_ready()
-    if status["ready"]:
-        return jsonify({"status": "ready", "missing": []}), 200
-    return jsonify({"status": "not_ready", "missing": status["missing"]}), 503
+    if not status["ready"]:
+        return jsonify({"status": "not_ready", "missing": status["missing"]}), 503
+    if warmup.state == "failed":
+        warmup.start()
+    if warmup.ready or not WARMUP_ENABLED:
+        return jsonify({"status": "ready", "missing": [], "warmup": warmup.status()}), 200
+    return jsonify({"status": "not_ready", "missing": [], "warmup": warmup.status()}), 503
 
 
 @app.post("/predict")
@@ -71,6 +107,54 @@ def predict_batch():
         return jsonify({"error": f"Invalid payload: {exc}"}), 400
 
 
+@app.post("/predict/batch/columnar")
+def predict_batch_columnar():
+    try:
+        payload = ColumnarPredictionRequest.model_validate(request.get_json(force=True))
+        result = _service().predict_columns(payload)
+        return Response(dumps_json(result), mimetype=JSON_MEDIA_TYPE)
+    except FileNotFoundError:
+        return jsonify({"error": "Model artifacts unavailable"}), 503
+    except Exception as exc:  # noqa: BLE001
+        return jsonify({"error": f"Invalid payload: {exc}"}), 400
+
+
+@app.post("/predict/stream")
+def predict_stream():
+    try:
+        scorer = NDJSONPredictionStream(
+            _service(),
+            chunk_size=STREAM_CHUNK_SIZE,
+            compressed=request.headers.get("Content-Encoding", "").lower() == "gzip",
+        )
+    except FileNotFoundError:
+        return jsonify({"error": "Model artifacts unavailable"}), 503
+
+    # Hold the response until the scorer has output, so a body rejected before any
+    # result is sent (bad gzip, trailing data) gets a 400 rather than a 200 error line.
+    first, closed = b"", False
+    while not first:
+        chunk = request.stream.read(64 * 1024)
+        if not chunk:
+            first, closed = scorer.close(), True
+        else:
+            first = scorer.feed(chunk)
+    if scorer.error is not None:
+        return jsonify({"error": scorer.error}), 400
+
+    def results():
+        yield first
+        if closed:
+            return
+        while chunk := request.stream.read(64 * 1024):
+            output = scorer.feed(chunk)
+            if output:
+                yield output
+        yield scorer.close()
+
+    return Response(stream_with_context(results()), mimetype="application/x-ndjson")
+
+
 @app.post("/predict/simulate")
 def predict_simulate():
     try:
@@ -95,13 +179,29 @@ def predict_recommendation():
         return jsonify({"error": f"Invalid payload: {exc}"}), 400
 
 
+@app.post("/predict/recommendation/batch")
+def predict_recommendation_batch():
+    try:
+        payload = BatchPredictionRequest.model_validate(request.get_json(force=True))
+        result = _service().recommendation_batch(payload.items)
+        return jsonify(result)
+    except FileNotFoundError:
+        return jsonify({"error": "Model artifacts unavailable"}), 503
+    except Exception as exc:  # noqa: BLE001
+        return jsonify({"error": f"Invalid payload: {exc}"}), 400
+
+
 @app.get("/predict/feature-importance")
 def predict_feature_importance():
     target = request.args.get("target", "subscribers")
     top_n = int(request.args.get("top_n", 15))
     try:
-        result = _service().feature_importance(target=target, top_n=top_n)
-        return jsonify(result)
+        svc = _service()
+        return _cached_json(
+            f"/predict/feature-importance?target={target}&top_n={top_n}",
+            svc.model_token,
+            lambda: svc.feature_importance(target=target, top_n=top_n),
+        )
     except FileNotFoundError:
         return jsonify({"error": "Model artifacts unavailable"}), 503
     except Exception as exc:  # noqa: BLE001
@@ -111,39 +211,74 @@ def predict_feature_importance():
 @app.get("/clusters/summary")
 def clusters():
     try:
-        return jsonify({"records": _service().clustering.cluster_profiles})
+        svc = _service()
+        return _cached_json(
+            "/clusters/summary",
+            svc.model_token,
+            lambda: {"records": svc.clustering.cluster_profiles},
+        )
+    except FileNotFoundError:
+        return jsonify({"error": "Cluster artifacts unavailable"}), 503
+
+
+@app.post("/clusters/assign")
+def clusters_assign():
+    try:
+        payload = ClusterAssignRequest.model_validate(request.get_json(force=True))
+        return jsonify(_service().assign_clusters(payload.items))
     except FileNotFoundError:
         return jsonify({"error": "Cluster artifacts unavailable"}), 503
+    except Exception as exc:  # noqa: BLE001
+        return jsonify({"error": f"Invalid payload: {exc}"}), 400
 
 
 @app.get("/maps/country-metrics")
 def map_metrics():
-    df = load_dataset()
-    return jsonify({"records": build_country_metrics(df)})
+    return jsonify({"records": rollups.country_metrics(rollups.cached_rollup())})
+
+
+def _cached_json(key: str, version: str, build, last_modified: float | None = None):
+    """JSON response served from the shared response cache until ``version`` changes."""
+    status, payload, headers = get_response_cache().respond(
+        f"flask:{key}",
+        version,
+        lambda: app.json.response(build()).get_data(as_text=True),
+        request.headers,
+        last_modified=last_modified,
+    )
+    if status == 304:
+        return "", 304, headers
+    return payload, status, {**headers, "Content-Type": JSON_MEDIA_TYPE}
+
+
+def _map_page(name: str):
+    body = get_map_page_cache().get(name)
+    status, payload, headers = conditional_response(
+        body, request.headers.get("Accept-Encoding"), request.headers.get("If-None-Match")
+    )
+    if status == 304:
+        return "", 304, headers
+    return payload, status, {**headers, "Content-Type": body.media_type}
 
 
 @app.get("/maps/influence-map")
 def map_influence():
-    df = load_dataset()
-    return build_influence_map_html(df), 200, {"Content-Type": "text/html; charset=utf-8"}
+    return _map_page("influence_map")
 
 
 @app.get("/maps/earnings-choropleth")
 def map_earnings_choropleth():
-    df = load_dataset()
-    return build_earnings_choropleth_html(df), 200, {"Content-Type": "text/html; charset=utf-8"}
+    return _map_page("earnings_choropleth")
 
 
 @app.get("/maps/category-dominance")
 def map_category_dominance():
-    df = load_dataset()
-    return build_category_dominance_map_html(df), 200, {"Content-Type": "text/html; charset=utf-8"}
+    return _map_page("category_dominance_map")
 
 
 @app.get("/data/raw-sample")
 def raw_sample():
     limit = max(1, min(int(request.args.get("limit", 10)), 200))
-    df = load_raw_dataset()
     fields = [
         "youtuber",
         "uploads",
@@ -154,15 +289,21 @@ def raw_sample():
         "subscribers_for_last_30_days",
         "created_year",
     ]
-    sample_df = df[fields].head(limit)
-    sample = sample_df.replace([np.nan, np.inf, -np.inf], None).to_dict(orient="records")
-    return jsonify({"records": sample})
+
+    def build():
+        sample_df = data_cache.cached_raw_dataset(columns=fields).head(limit)
+        sample = sample_df.replace([np.nan, np.inf, -np.inf], None).to_dict(orient="records")
+        return {"records": sample}
+
+    version = dataset_version()
+    return _cached_json(
+        f"/data/raw-sample?limit={limit}", version.token, build, version.last_modified
+    )
 
 
 @app.get("/data/processed-sample")
 def processed_sample():
     limit = max(1, min(int(request.args.get("limit", 10)), 1000))
-    df = load_dataset()
     fields = [
         "youtuber",
         "uploads",
@@ -173,72 +314,55 @@ def processed_sample():
         "highest_yearly_earnings",
         "growth_target",
     ]
-    sample = df[fields].head(limit).to_dict(orient="records")
-    return jsonify({"records": sample})
+
+    def build():
+        return {
+            "records": data_cache.cached_dataset(columns=fields)
+            .head(limit)
+            .to_dict(orient="records")
+        }
+
+    version = dataset_version()
+    return _cached_json(
+        f"/data/processed-sample?limit={limit}", version.token, build, version.last_modified
+    )
 
 
 @app.get("/analytics/category-performance")
 def category_performance():
     top_n = max(3, min(int(request.args.get("top_n", 12)), 30))
-    df = load_dataset()
-    agg = (
-        df.groupby("category", as_index=False)
-        .agg(
-            channel_count=("youtuber", "count"),
-            avg_subscribers=("subscribers", "mean"),
-            avg_earnings=("highest_yearly_earnings", "mean"),
-            avg_growth=("growth_target", "mean"),
-            total_subscribers=("subscribers", "sum"),
-            total_earnings=("highest_yearly_earnings", "sum"),
-        )
-        .sort_values("total_subscribers", ascending=False)
-        .head(top_n)
-    )
-    return jsonify({"records": agg.to_dict(orient="records")})
+    return jsonify({"records": rollups.category_performance(rollups.cached_rollup(), top_n)})
 
 
 @app.get("/analytics/upload-growth-buckets")
 def upload_growth_buckets():
-    df = load_dataset().copy()
-    labels = ["0-100", "101-500", "501-2k", "2k-10k", "10k+"]
-    df["upload_bucket"] = np.select(
-        [
-            (df["uploads"] >= 0) & (df["uploads"] <= 100),
-            (df["uploads"] > 100) & (df["uploads"] <= 500),
-            (df["uploads"] > 500) & (df["uploads"] <= 2000),
-            (df["uploads"] > 2000) & (df["uploads"] <= 10000),
-            (df["uploads"] > 10000),
-        ],
-        labels,
-        default="unknown",
-    )
-    agg = (
-        df.groupby("upload_bucket", as_index=False)
-        .agg(
-            channel_count=("youtuber", "count"),
-            avg_growth=("growth_target", "mean"),
-            avg_earnings=("highest_yearly_earnings", "mean"),
-            avg_subscribers=("subscribers", "mean"),
-        )
-        .sort_values("upload_bucket")
-    )
-    return jsonify({"records": agg.to_dict(orient="records")})
+    return jsonify({"records": rollups.upload_growth_buckets(rollups.cached_rollup())})
+
+
+def _run_document(key: str, load, missing: str):
+    def build():
+        data = load()
+        if data is None:
+            raise LookupError(missing)
+        return data
+
+    version = current_run_version()
+    try:
+        if version is None:
+            return jsonify(build())
+        return _cached_json(key, version.token, build, version.last_modified)
+    except LookupError:
+        return jsonify({"error": missing}), 404
 
 
 @app.get("/mlops/manifest")
 def mlops_manifest():
-    manifest = load_manifest()
-    if manifest is None:
-        return jsonify({"error": "Manifest not found"}), 404
-    return jsonify(manifest)
+    return _run_document("/mlops/manifest", load_manifest, "Manifest not found")
 
 
 @app.get("/mlops/registry")
 def mlops_registry():
-    registry = load_registry()
-    if registry is None:
-        return jsonify({"error": "Registry not found"}), 404
-    return jsonify(registry)
+    return _run_document("/mlops/registry", load_registry, "Registry not found")
 
 
 @app.post("/mlops/drift-check")
@@ -292,4 +416,6 @@ def mlops_capabilities():
 
 
 if __name__ == "__main__":
+    if WARMUP_ENABLED:
+        warmup.start()
     app.run(host="0.0.0.0", port=5000, debug=False)
@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from functools import cached_property
+from pathlib import Path
+
+from youtube_success_ml import config
+from youtube_success_ml.api.serialization import JSON_MEDIA_TYPE, quality_weights
+from youtube_success_ml.lazy import LazyModule
+from youtube_success_ml.mlops.registry import (
+    default_manifest_path,
+    default_registry_path,
+    load_manifest,
+    load_registry,
+)
+
+# pandas-backed and plotting layers, imported on the first request that needs them.
+data_cache = LazyModule("youtube_success_ml.data.cache")
+loader = LazyModule("youtube_success_ml.data.loader")
+maps = LazyModule("youtube_success_ml.visualization.maps")
+
+try:
+    import brotli
+except Exception:  # noqa: BLE001
+    brotli = None
+
+HTML_MEDIA_TYPE = "text/html; charset=utf-8"
+# Preferred order when a client accepts several content codings equally.
+ENCODING_PREFERENCE = ("br", "gzip")
+AVAILABLE_ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """A rendered response body with precompressed variants and a content hash."""
+
+    identity: bytes
+    encoded: dict[str, bytes]
+    digest: str
+    media_type: str = HTML_MEDIA_TYPE
+
+    @classmethod
+    def from_text(
+        cls, text: str, media_type: str = HTML_MEDIA_TYPE, digest: str | None = None
+    ) -> CachedBody:
+        return cls.from_bytes(text.encode("utf-8"), media_type, digest)
+
+    @classmethod
+    def from_bytes(
+        cls, data: bytes, media_type: str = HTML_MEDIA_TYPE, digest: str | None = None
+    ) -> CachedBody:
+        """Compress ``data``; ``digest`` defaults to a hash of the body itself."""
+        encoded = {"gzip": gzip.compress(data, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            encoded["br"] = brotli.compress(data, quality=11)
+        return cls(data, encoded, digest or hashlib.sha256(data).hexdigest()[:32], media_type)
+
+    def etag(self, encoding: str | None) -> str:
+        # Strong validators must differ between content codings of the same resource.
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+
+def negotiate_encoding(accept_encoding: str | None, available: dict[str, bytes]) -> str | None:
+    """Best content coding in ``available`` allowed by an Accept-Encoding header."""
+    if not accept_encoding:
+        return None
+    weights = quality_weights(accept_encoding)
+    wildcard = weights.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in ENCODING_PREFERENCE:
+        quality = weights.get(coding, wildcard)
+        if coding in available and quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against ``etag`` (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified_since(if_modified_since: str | None, last_modified: float | None) -> bool:
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return int(last_modified) <= since
+
+
+def conditional_response(
+    body: CachedBody,
+    accept_encoding: str | None,
+    if_none_match: str | None,
+    last_modified: float | None = None,
+    if_modified_since: str | None = None,
+) -> tuple[int, bytes, dict[str, str]]:
+    """Status, payload and headers for a cached body under the request's validators.
+
+    If-Modified-Since is only consulted when the request has no If-None-Match.
+    """
+    encoding = negotiate_encoding(accept_encoding, body.encoded)
+    etag = body.etag(encoding)
+    headers = {"ETag": etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(int(last_modified), usegmt=True)
+    if etag_matches(if_none_match, etag) or (
+        not if_none_match and not_modified_since(if_modified_since, last_modified)
+    ):
+        return 304, b"", headers
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+        return 200, body.encoded[encoding], headers
+    return 200, body.identity, headers
+
+
+class MapPageCache:
+    """Rendered map pages keyed by the dataset's content hash.
+
+    A page is rendered at most once per dataset version. On a miss, pages exported by
+    training for the same hash are loaded first (prewarming all of them at once);
+    only pages still missing are rendered. Entries for older hashes are dropped.
+    """
+
+    def __init__(self, map_dir: Path | None = None) -> None:
+        self._map_dir = map_dir
+        self._entries: dict[tuple[str, str], CachedBody] = {}
+        self._key_locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.renders = 0
+        self.prewarmed = 0
+
+    @property
+    def map_dir(self) -> Path:
+        return self._map_dir or config.MAP_DIR
+
+    def _store(self, name: str, digest: str, html: str) -> CachedBody:
+        body = CachedBody.from_text(html)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == name and key[1] != digest]:
+                del self._entries[key]
+            self._entries[(name, digest)] = body
+        return body
+
+    def prewarm(self, path: Path | str | None = None) -> int:
+        """Load exported pages matching the current dataset; returns how many were added."""
+        digest = data_cache.file_digest(loader.resolve_data_path(path))
+        added = 0
+        for name, html in maps.load_exported_map_pages(digest, self.map_dir).items():
+            if (name, digest) not in self._entries:
+                self._store(name, digest, html)
+                added += 1
+        self.prewarmed += added
+        return added
+
+    def get(self, name: str, path: Path | str | None = None) -> CachedBody:
+        if name not in maps.MAP_PAGES:
+            raise KeyError(f"Unknown map page: {name}")
+        path = loader.resolve_data_path(path)
+        digest = data_cache.file_digest(path)
+        body = self._entries.get((name, digest))
+        if body is not None:
+            self.hits += 1
+            return body
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(name, threading.Lock())
+        with key_lock:
+            body = self._entries.get((name, digest))
+            if body is None:
+                self.prewarm(path)
+                body = self._entries.get((name, digest))
+            if body is None:
+                html = maps.MAP_PAGES[name](data_cache.cached_dataset(path, maps.MAP_COLUMNS))
+                body = self._store(name, digest, html)
+                self.renders += 1
+            else:
+                self.hits += 1
+        return body
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "renders": self.renders, "prewarmed": self.prewarmed}
+
+
+_shared_map_cache = MapPageCache()
+
+
+def get_map_page_cache() -> MapPageCache:
+    return _shared_map_cache
+
+
+class ResponseCache:
+    """Serialized response bodies held in memory until their version token changes.
+
+    ETags are derived from the route key and version rather than from the body, so a
+    request whose validators match the current version is answered with 304 without
+    building (or re-reading) the response at all.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[str, CachedBody]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+        self.not_modified = 0
+
+    def respond(
+        self,
+        key: str,
+        version: str,
+        build: Callable[[], str | bytes],
+        headers: Mapping[str, str],
+        last_modified: float | None = None,
+        media_type: str = JSON_MEDIA_TYPE,
+    ) -> tuple[int, bytes, dict[str, str]]:
+        """Answer a GET for ``key`` given the request ``headers`` (case-insensitive)."""
+        validators = (
+            headers.get("accept-encoding"),
+            headers.get("if-none-match"),
+            last_modified,
+            headers.get("if-modified-since"),
+        )
+        digest = hashlib.sha256(f"{key}\0{version}".encode()).hexdigest()[:32]
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            return conditional_response(entry[1], *validators)
+
+        placeholder = CachedBody(b"", dict.fromkeys(AVAILABLE_ENCODINGS, b""), digest, media_type)
+        status, payload, response_headers = conditional_response(placeholder, *validators)
+        if status == 304:
+            self.not_modified += 1
+            return status, payload, response_headers
+        rendered = build()
+        if isinstance(rendered, str):
+            body = CachedBody.from_text(rendered, media_type, digest=digest)
+        else:
+            body = CachedBody.from_bytes(rendered, media_type, digest=digest)
+        with self._lock:
+            self._entries[key] = (version, body)
+        self.builds += 1
+        return conditional_response(body, *validators)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "builds": self.builds, "not_modified": self.not_modified}
+
+
+_shared_response_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    return _shared_response_cache
+
+
+@dataclass(frozen=True)
+class ResourceVersion:
+    token: str
+    last_modified: float
+
+
+class RunVersionTracker:
+    """Version of the registered training run, derived from the registry's active run
+    and the manifest's run id and artifact hashes.
+
+    The JSON files are only re-read when their mtime or size changes.
+    """
+
+    def __init__(
+        self, manifest_path: Path | None = None, registry_path: Path | None = None
+    ) -> None:
+        self._paths = (manifest_path, registry_path)
+        self._signature: tuple[tuple[int, int] | None, ...] | None = None
+        self._current: ResourceVersion | None = None
+
+    @cached_property
+    def paths(self) -> tuple[Path, Path]:
+        manifest_path, registry_path = self._paths
+        return (
+            manifest_path or default_manifest_path(),
+            registry_path or default_registry_path(),
+        )
+
+    def current(self) -> ResourceVersion | None:
+        stats = [path.stat() if path.exists() else None for path in self.paths]
+        signature = tuple(None if st is None else (st.st_mtime_ns, st.st_size) for st in stats)
+        if signature == self._signature:
+            return self._current
+        manifest = load_manifest(self.paths[0]) or {}
+        registry = load_registry(self.paths[1]) or {}
+        current = None
+        if manifest or registry:
+            identity = {
+                "active_run_id": registry.get("active_run_id"),
+                "run_id": manifest.get("run_id"),
+                "artifact_hashes": manifest.get("artifact_hashes"),
+            }
+            token = hashlib.sha256(json.dumps(identity, sort_keys=True).encode()).hexdigest()
+            last_modified = max(st.st_mtime for st in stats if st is not None)
+            current = ResourceVersion(token=token[:16], last_modified=last_modified)
+        self._signature, self._current = signature, current
+        return current
+
+
+_run_version_tracker = RunVersionTracker()
+
+
+def current_run_version() -> ResourceVersion | None:
+    return _run_version_tracker.current()
+
+
+def dataset_version(path: Path | str | None = None) -> ResourceVersion:
+    """Version of the dataset file the sample endpoints read."""
+    path = loader.resolve_data_path(path)
+    return ResourceVersion(
+        token=data_cache.file_digest(path)[:16], last_modified=path.stat().st_mtime
+    )
@@ -1,54 +1,83 @@
 from __future__ import annotations
 
 import numpy as np
-from fastapi import APIRouter, Query
-from fastapi.responses import HTMLResponse
-
-from youtube_success_ml.api.dependencies import get_service
-from youtube_success_ml.data.loader import load_dataset, load_raw_dataset
-from youtube_success_ml.visualization.maps import (
-    build_category_dominance_map_html,
-    build_country_metrics,
-    build_earnings_choropleth_html,
-    build_influence_map_html,
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import HTMLResponse, Response
+
+from youtube_success_ml.api.dependencies import (
+    arrow_response,
+    cached_json_response,
+    get_service,
+    response_media_type,
 )
+from youtube_success_ml.api.http_cache import (
+    conditional_response,
+    dataset_version,
+    get_map_page_cache,
+)
+from youtube_success_ml.api.serialization import ARROW_STREAM_MEDIA_TYPE, dumps_arrow
+from youtube_success_ml.lazy import LazyModule
+from youtube_success_ml.schemas import ClusterAssignRequest, ClusterAssignResponse
 
 router = APIRouter(tags=["analytics"])
 
+data_cache = LazyModule("youtube_success_ml.data.cache")
+rollups = LazyModule("youtube_success_ml.data.rollups")
+
 
 @router.get("/clusters/summary")
-def cluster_summary():
+def cluster_summary(request: Request):
     service = get_service()
-    return {"records": service.clustering.cluster_profiles}
+    return cached_json_response(
+        request,
+        "/clusters/summary",
+        service.model_token,
+        lambda: {"records": service.clustering.cluster_profiles},
+    )
+
+
+@router.post("/clusters/assign", response_model=ClusterAssignResponse)
+def cluster_assign(payload: ClusterAssignRequest) -> ClusterAssignResponse:
+    service = get_service()
+    return ClusterAssignResponse(**service.assign_clusters(payload.items))
+
+
+def _records_response(request: Request, records: list[dict]):
+    if response_media_type(request) == ARROW_STREAM_MEDIA_TYPE:
+        return arrow_response(records)
+    return {"records": records}
 
 
 @router.get("/maps/country-metrics")
-def country_metrics():
-    df = load_dataset()
-    return {"records": build_country_metrics(df)}
+def country_metrics(request: Request):
+    return _records_response(request, rollups.country_metrics(rollups.cached_rollup()))
+
+
+def _map_page(name: str, request: Request) -> Response:
+    body = get_map_page_cache().get(name)
+    status, payload, headers = conditional_response(
+        body, request.headers.get("accept-encoding"), request.headers.get("if-none-match")
+    )
+    return Response(payload, status_code=status, headers=headers, media_type=body.media_type)
 
 
 @router.get("/maps/influence-map", response_class=HTMLResponse)
-def influence_map():
-    df = load_dataset()
-    return build_influence_map_html(df)
+def influence_map(request: Request):
+    return _map_page("influence_map", request)
 
 
 @router.get("/maps/earnings-choropleth", response_class=HTMLResponse)
-def earnings_choropleth_map():
-    df = load_dataset()
-    return build_earnings_choropleth_html(df)
+def earnings_choropleth_map(request: Request):
+    return _map_page("earnings_choropleth", request)
 
 
 @router.get("/maps/category-dominance", response_class=HTMLResponse)
-def category_dominance_map():
-    df = load_dataset()
-    return build_category_dominance_map_html(df)
+def category_dominance_map(request: Request):
+    return _map_page("category_dominance_map", request)
 
 
 @router.get("/data/raw-sample")
-def raw_sample(limit: int = Query(default=10, ge=1, le=200)):
-    df = load_raw_dataset()
+def raw_sample(request: Request, limit: int = Query(default=10, ge=1, le=200)):
     fields = [
         "youtuber",
         "uploads",
@@ -59,14 +88,25 @@ def raw_sample(limit: int = Query(default=10, ge=1, le=200)):
         "subscribers_for_last_30_days",
         "created_year",
     ]
-    sample_df = df[fields].head(limit)
-    sample = sample_df.replace([np.nan, np.inf, -np.inf], None).to_dict(orient="records")
-    return {"records": sample}
+
+    def build():
+        sample_df = data_cache.cached_raw_dataset(columns=fields).head(limit)
+        sample = sample_df.replace([np.nan, np.inf, -np.inf], None).to_dict(orient="records")
+        return {"records": sample}
+
+    version = dataset_version()
+    return cached_json_response(
+        request,
+        f"/data/raw-sample?limit={limit}",
+        version.token,
+        build,
+        version.last_modified,
+        build_arrow=lambda: dumps_arrow(data_cache.cached_raw_dataset(columns=fields).head(limit)),
+    )
 
 
 @router.get("/data/processed-sample")
-def processed_sample(limit: int = Query(default=10, ge=1, le=1000)):
-    df = load_dataset()
+def processed_sample(request: Request, limit: int = Query(default=10, ge=1, le=1000)):
     fields = [
         "youtuber",
         "uploads",
@@ -77,52 +117,30 @@ def processed_sample(limit: int = Query(default=10, ge=1, le=1000)):
         "highest_yearly_earnings",
         "growth_target",
     ]
-    sample = df[fields].head(limit).to_dict(orient="records")
-    return {"records": sample}
+
+    def build():
+        return {
+            "records": data_cache.cached_dataset(columns=fields)
+            .head(limit)
+            .to_dict(orient="records")
+        }
+
+    version = dataset_version()
+    return cached_json_response(
+        request,
+        f"/data/processed-sample?limit={limit}",
+        version.token,
+        build,
+        version.last_modified,
+        build_arrow=lambda: dumps_arrow(data_cache.cached_dataset(columns=fields).head(limit)),
+    )
 
 
 @router.get("/analytics/category-performance")
-def category_performance(top_n: int = Query(default=12, ge=3, le=30)):
-    df = load_dataset()
-    agg = (
-        df.groupby("category", as_index=False)
-        .agg(
-            channel_count=("youtuber", "count"),
-            avg_subscribers=("subscribers", "mean"),
-            avg_earnings=("highest_yearly_earnings", "mean"),
-            avg_growth=("growth_target", "mean"),
-            total_subscribers=("subscribers", "sum"),
-            total_earnings=("highest_yearly_earnings", "sum"),
-        )
-        .sort_values("total_subscribers", ascending=False)
-        .head(top_n)
-    )
-    return {"records": agg.to_dict(orient="records")}
+def category_performance(request: Request, top_n: int = Query(default=12, ge=3, le=30)):
+    return _records_response(request, rollups.category_performance(rollups.cached_rollup(), top_n))
 
 
 @router.get("/analytics/upload-growth-buckets")
-def upload_growth_buckets():
-    df = load_dataset().copy()
-    labels = ["0-100", "101-500", "501-2k", "2k-10k", "10k+"]
-    df["upload_bucket"] = np.select(
-        [
-            (df["uploads"] >= 0) & (df["uploads"] <= 100),
-            (df["uploads"] > 100) & (df["uploads"] <= 500),
-            (df["uploads"] > 500) & (df["uploads"] <= 2000),
-            (df["uploads"] > 2000) & (df["uploads"] <= 10000),
-            (df["uploads"] > 10000),
-        ],
-        labels,
-        default="unknown",
-    )
-    agg = (
-        df.groupby("upload_bucket", as_index=False)
-        .agg(
-            channel_count=("youtuber", "count"),
-            avg_growth=("growth_target", "mean"),
-            avg_earnings=("highest_yearly_earnings", "mean"),
-            avg_subscribers=("subscribers", "mean"),
-        )
-        .sort_values("upload_bucket")
-    )
-    return {"records": agg.to_dict(orient="records")}
+def upload_growth_buckets(request: Request):
+    return _records_response(request, rollups.upload_growth_buckets(rollups.cached_rollup()))
@@ -3,6 +3,7 @@ from __future__ import annotations
 from fastapi import APIRouter
 from fastapi.responses import PlainTextResponse
 
+from youtube_success_ml.api.dependencies import get_service_warmup
 from youtube_success_ml.mlops.registry import check_artifacts_ready
 from youtube_success_ml.schemas import HealthResponse
 
@@ -17,10 +18,18 @@ def health() -> HealthResponse:
 @router.get("/ready")
 def ready():
     status = check_artifacts_ready()
-    code = 200 if status["ready"] else 503
+    if not status["ready"]:
+        return PlainTextResponse(
+            f"not_ready missing={','.join(status['missing'])}\n", status_code=503
+        )
+    warmup = get_service_warmup()
+    if warmup.state == "failed":
+        # The artifacts are present now, so try again.
+        warmup.start()
+    if warmup.state == "idle":
+        return PlainTextResponse("ready\n")
+    if not warmup.ready:
+        return PlainTextResponse(f"not_ready warmup={warmup.state}\n", status_code=503)
     return PlainTextResponse(
-        content=(
-            "ready\n" if status["ready"] else f"not_ready missing={','.join(status['missing'])}\n"
-        ),
-        status_code=code,
+        f"ready load_seconds={warmup.load_seconds:.3f} warmup_seconds={warmup.warmup_seconds:.3f}\n"
     )
@@ -3,38 +3,59 @@ from __future__ import annotations
 import importlib.util
 from pathlib import Path
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import PlainTextResponse
 
 from youtube_success_ml.api.dependencies import (
+    cached_json_response,
+    get_prediction_batcher,
     get_service,
+    get_service_warmup,
+    loaded_service,
     request_count_by_path,
     request_latency_sum_by_path,
 )
+from youtube_success_ml.api.http_cache import (
+    current_run_version,
+    get_map_page_cache,
+    get_response_cache,
+)
+from youtube_success_ml.lazy import LazyModule
 from youtube_success_ml.mlops.registry import load_manifest, load_registry
 from youtube_success_ml.schemas import (
     DriftCheckRequest,
     DriftCheckResponse,
     MlopsCapabilitiesResponse,
 )
+from youtube_success_ml.services.prediction_cache import get_prediction_cache
 
 router = APIRouter(tags=["mlops"])
 
+data_cache = LazyModule("youtube_success_ml.data.cache")
+rollups = LazyModule("youtube_success_ml.data.rollups")
+
+
+def _run_document(request: Request, key: str, load, missing: str):
+    def build():
+        data = load()
+        if data is None:
+            raise HTTPException(status_code=404, detail=missing)
+        return data
+
+    version = current_run_version()
+    if version is None:
+        return build()
+    return cached_json_response(request, key, version.token, build, version.last_modified)
+
 
 @router.get("/mlops/manifest")
-def manifest():
-    data = load_manifest()
-    if data is None:
-        raise HTTPException(status_code=404, detail="Manifest not found")
-    return data
+def manifest(request: Request):
+    return _run_document(request, "/mlops/manifest", load_manifest, "Manifest not found")
 
 
 @router.get("/mlops/registry")
-def registry():
-    data = load_registry()
-    if data is None:
-        raise HTTPException(status_code=404, detail="Registry not found")
-    return data
+def registry(request: Request):
+    return _run_document(request, "/mlops/registry", load_registry, "Registry not found")
 
 
 @router.post("/mlops/drift-check", response_model=DriftCheckResponse)
@@ -102,4 +123,81 @@ def metrics():
         lines.append(
             f'http_request_latency_seconds_sum{{path="{path}"}} {request_latency_sum_by_path[path]:.6f}'
         )
+    cache = get_prediction_cache()
+    if cache is not None:
+        stats = cache.stats()
+        for name, kind, help_text in (
+            ("hits", "counter", "Prediction cache hits"),
+            ("misses", "counter", "Prediction cache misses"),
+            ("evictions", "counter", "Prediction cache LRU evictions"),
+            ("expirations", "counter", "Prediction cache TTL expirations"),
+            ("size", "gauge", "Prediction cache entries"),
+        ):
+            metric = f"prediction_cache_{name}" + ("_total" if kind == "counter" else "")
+            lines.extend(
+                [
+                    f"# HELP {metric} {help_text}",
+                    f"# TYPE {metric} {kind}",
+                    f"{metric} {stats[name]}",
+                ]
+            )
+    dataset_stats = data_cache.get_dataset_cache().stats()
+    for name, help_text in (
+        ("hits", "Dataset cache hits"),
+        ("loads", "Dataset parses (cache misses and file changes)"),
+    ):
+        lines.extend(
+            [
+                f"# HELP dataset_cache_{name}_total {help_text}",
+                f"# TYPE dataset_cache_{name}_total counter",
+                f"dataset_cache_{name}_total {dataset_stats[name]}",
+            ]
+        )
+    rollup_stats = rollups.get_rollup_store().stats()
+    for name, help_text in (
+        ("builds", "Analytics rollups rebuilt from the dataset"),
+        ("artifact_loads", "Analytics rollups loaded from the training artifact"),
+    ):
+        lines.extend(
+            [
+                f"# HELP analytics_rollup_{name}_total {help_text}",
+                f"# TYPE analytics_rollup_{name}_total counter",
+                f"analytics_rollup_{name}_total {rollup_stats[name]}",
+            ]
+        )
+    map_stats = get_map_page_cache().stats()
+    for name, help_text in (
+        ("hits", "Map pages served from the rendered-page cache"),
+        ("renders", "Map pages rendered (cache misses and dataset changes)"),
+        ("prewarmed", "Map pages loaded from exported training assets"),
+    ):
+        lines.extend(
+            [
+                f"# HELP map_page_cache_{name}_total {help_text}",
+                f"# TYPE map_page_cache_{name}_total counter",
+                f"map_page_cache_{name}_total {map_stats[name]}",
+            ]
+        )
+    response_stats = get_response_cache().stats()
+    for name, help_text in (
+        ("hits", "Cached JSON responses served without rebuilding"),
+        ("builds", "Cached JSON responses built (misses and version changes)"),
+        ("not_modified", "Conditional requests answered 304 before building a body"),
+    ):
+        lines.extend(
+            [
+                f"# HELP response_cache_{name}_total {help_text}",
+                f"# TYPE response_cache_{name}_total counter",
+                f"response_cache_{name}_total {response_stats[name]}",
+            ]
+        )
+    warmup = get_service_warmup()
+    if warmup.state != "idle":
+        lines.extend(warmup.render_metrics())
+    batcher = get_prediction_batcher()
+    if batcher is not None:
+        lines.extend(batcher.render_metrics())
+    service = loaded_service()
+    if service is not None and service.drift_monitor is not None:
+        lines.extend(service.drift_monitor.render_metrics())
     return "\n".join(lines) + "\n"
@@ -1,11 +1,37 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Query
+from collections.abc import AsyncIterator
+from typing import Annotated
 
-from youtube_success_ml.api.dependencies import get_service
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+from youtube_success_ml.api.dependencies import (
+    arrow_response,
+    cached_json_response,
+    get_prediction_batcher,
+    get_service,
+    response_media_type,
+)
+from youtube_success_ml.api.serialization import (
+    ARROW_STREAM_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    arrow_available,
+    dumps_json,
+    loads_arrow_columns,
+)
+from youtube_success_ml.config import STREAM_CHUNK_SIZE
 from youtube_success_ml.schemas import (
     BatchPredictionRequest,
     BatchPredictionResponse,
+    BatchRecommendationResponse,
+    ColumnarPredictionRequest,
+    ColumnarPredictionResponse,
     FeatureImportanceResponse,
     PredictionRequest,
     PredictionResponse,
@@ -13,24 +39,140 @@ from youtube_success_ml.schemas import (
     SimulationRequest,
     SimulationResponse,
 )
+from youtube_success_ml.services.stream_scoring import NDJSONPredictionStream
 
 router = APIRouter(prefix="/predict", tags=["prediction"])
 
+PREDICTION_KEYS = ("predicted_subscribers", "predicted_earnings", "predicted_growth")
+# The columnar body is parsed by hand (JSON or Arrow), so it is declared for OpenAPI here.
+_COLUMNAR_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            JSON_MEDIA_TYPE: {"schema": ColumnarPredictionRequest.model_json_schema()},
+            ARROW_STREAM_MEDIA_TYPE: {"schema": {"type": "string", "format": "binary"}},
+        },
+    }
+}
+
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """Streaming response whose body iterator is still reading the request body.
+
+    The stock response listens for disconnects on ``receive`` concurrently, which
+    would steal request-body messages; here the iterator owns ``receive`` and a
+    disconnect surfaces from ``request.stream()`` as ``ClientDisconnect``.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as exc:
+            raise ClientDisconnect() from exc
+        if self.background is not None:
+            await self.background()
+
 
 @router.post("", response_model=PredictionResponse)
-def predict(payload: PredictionRequest) -> PredictionResponse:
-    service = get_service()
-    result = service.predict(payload)
+async def predict(payload: PredictionRequest) -> PredictionResponse:
+    batcher = get_prediction_batcher()
+    if batcher is not None:
+        result = await batcher.submit(payload)
+    else:
+        service = await run_in_threadpool(get_service)
+        result = await run_in_threadpool(service.predict, payload)
     return PredictionResponse(**result)
 
 
 @router.post("/batch", response_model=BatchPredictionResponse)
-def predict_batch(payload: BatchPredictionRequest) -> BatchPredictionResponse:
+def predict_batch(request: Request, payload: BatchPredictionRequest):
+    media_type = response_media_type(request)
     service = get_service()
     result = service.predict_batch(payload.items)
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        records = result["records"]
+        return arrow_response(
+            {key: [record[key] for record in records] for key in PREDICTION_KEYS},
+            {"summary": result["summary"]},
+        )
     return BatchPredictionResponse(**result)
 
 
+async def _columnar_payload(request: Request) -> ColumnarPredictionRequest:
+    """Validate a JSON or Arrow IPC stream body; errors surface as regular 422s."""
+    body = await request.body()
+    content_type = request.headers.get("content-type", "").partition(";")[0].strip().lower()
+    try:
+        if content_type == ARROW_STREAM_MEDIA_TYPE:
+            if not arrow_available():
+                raise HTTPException(status_code=415, detail="Arrow request bodies need pyarrow")
+            return ColumnarPredictionRequest.from_arrays(loads_arrow_columns(body))
+        return ColumnarPredictionRequest.model_validate_json(body)
+    except ValidationError as exc:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in exc.errors()]
+        raise RequestValidationError(errors) from exc
+    except ValueError as exc:
+        error = {"type": "value_error", "loc": ("body",), "msg": str(exc), "input": None}
+        raise RequestValidationError([error]) from exc
+
+
+ColumnarPayload = Annotated[ColumnarPredictionRequest, Depends(_columnar_payload)]
+
+
+@router.post(
+    "/batch/columnar",
+    response_model=ColumnarPredictionResponse,
+    openapi_extra=_COLUMNAR_REQUEST_BODY,
+)
+def predict_batch_columnar(request: Request, payload: ColumnarPayload) -> Response:
+    """Columnar ``/predict/batch``: one array per feature in, one array per target out."""
+    media_type = response_media_type(request)
+    service = get_service()
+    result = service.predict_columns(payload)
+    if media_type == ARROW_STREAM_MEDIA_TYPE:
+        return arrow_response(
+            {key: result[key] for key in PREDICTION_KEYS}, {"summary": result["summary"]}
+        )
+    return Response(dumps_json(result), media_type=JSON_MEDIA_TYPE)
+
+
+@router.post("/stream")
+async def predict_stream(request: Request) -> StreamingResponse:
+    """Score an NDJSON body (optionally gzip) in chunks, streaming NDJSON results back."""
+    service = await run_in_threadpool(get_service)
+    scorer = NDJSONPredictionStream(
+        service,
+        chunk_size=STREAM_CHUNK_SIZE,
+        compressed=request.headers.get("content-encoding", "").lower() == "gzip",
+    )
+
+    # Hold the response until the scorer has output, so a body rejected before any
+    # result is sent (bad gzip, trailing data) gets a 400 rather than a 200 error line.
+    body = request.stream()
+    first = b""
+    async for chunk in body:
+        first = await run_in_threadpool(scorer.feed, chunk)
+        if first:
+            break
+    else:
+        first = await run_in_threadpool(scorer.close)
+        body = None
+    if scorer.error is not None:
+        raise HTTPException(status_code=400, detail=scorer.error)
+
+    async def results() -> AsyncIterator[bytes]:
+        yield first
+        if body is None:
+            return
+        async for chunk in body:
+            output = await run_in_threadpool(scorer.feed, chunk)
+            if output:
+                yield output
+        yield await run_in_threadpool(scorer.close)
+
+    return _DuplexStreamingResponse(results(), media_type="application/x-ndjson")
+
+
 @router.post("/simulate", response_model=SimulationResponse)
 def simulate(payload: SimulationRequest) -> SimulationResponse:
     service = get_service()
@@ -45,11 +187,23 @@ def recommendation(payload: PredictionRequest) -> RecommendationResponse:
     return RecommendationResponse(**result)
 
 
+@router.post("/recommendation/batch", response_model=BatchRecommendationResponse)
+def recommendation_batch(payload: BatchPredictionRequest) -> BatchRecommendationResponse:
+    service = get_service()
+    result = service.recommendation_batch(payload.items)
+    return BatchRecommendationResponse(**result)
+
+
 @router.get("/feature-importance", response_model=FeatureImportanceResponse)
 def feature_importance(
+    request: Request,
     target: str = Query(default="subscribers", pattern="^(subscribers|earnings|growth)$"),
     top_n: int = Query(default=15, ge=1, le=50),
-) -> FeatureImportanceResponse:
+):
     service = get_service()
-    result = service.feature_importance(target=target, top_n=top_n)
-    return FeatureImportanceResponse(**result)
+    return cached_json_response(
+        request,
+        f"/predict/feature-importance?target={target}&top_n={top_n}",
+        service.model_token,
+        lambda: FeatureImportanceResponse(**service.feature_importance(target=target, top_n=top_n)),
+    )
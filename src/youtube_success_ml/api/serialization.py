@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from collections.abc import Mapping
+from functools import cache
+from typing import Any
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSON_ENCODER = "orjson" if orjson is not None else "json"
+JSON_MEDIA_TYPE = "application/json"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def _to_builtin(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Compact JSON for responses carrying numpy arrays, via orjson when installed.
+
+    Both encoders write floats as their shortest round-trip repr, so clients decode
+    the same values whichever one produced the body.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_to_builtin, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_to_builtin, separators=(",", ":")).encode()
+
+
+def quality_weights(header: str) -> dict[str, float]:
+    """``{token: q}`` for an Accept-style header; parameters other than ``q`` are ignored."""
+    weights: dict[str, float] = {}
+    for part in header.split(","):
+        token, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[token.strip().lower()] = quality
+    return weights
+
+
+@cache
+def arrow_available() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def negotiate_media_type(accept: str | None) -> str | None:
+    """JSON or an Arrow IPC stream, as ranked by an Accept header.
+
+    Arrow is only chosen when listed explicitly (wildcards mean JSON) and pyarrow is
+    installed. ``None`` means neither representation is acceptable.
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+    weights = quality_weights(accept)
+    wildcard = max(weights.get("*/*", 0.0), weights.get("application/*", 0.0))
+    json_quality = weights.get(JSON_MEDIA_TYPE, wildcard)
+    arrow_quality = weights.get(ARROW_STREAM_MEDIA_TYPE, 0.0) if arrow_available() else 0.0
+    if arrow_quality > 0 and arrow_quality >= json_quality:
+        return ARROW_STREAM_MEDIA_TYPE
+    return JSON_MEDIA_TYPE if json_quality > 0 else None
+
+
+def dumps_arrow(
+    columns: Any,
+    metadata: Mapping[str, Any] | None = None,
+) -> bytes:
+    """An Arrow IPC stream holding ``columns`` (a frame, arrays by name, or records).
+
+    ``metadata`` values are stored JSON-encoded in the schema metadata, which is how
+    scalars such as a batch summary travel alongside the record batch.
+    """
+    import pandas as pd
+    import pyarrow as pa
+
+    if isinstance(columns, pd.DataFrame):
+        table = pa.Table.from_pandas(columns, preserve_index=False)
+    elif isinstance(columns, list):
+        table = pa.Table.from_pylist(columns)
+    else:
+        table = pa.table(dict(columns))
+    if metadata:
+        table = table.replace_schema_metadata(
+            {
+                **(table.schema.metadata or {}),
+                **{key: json.dumps(value) for key, value in metadata.items()},
+            }
+        )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def loads_arrow_columns(body: bytes) -> dict[str, Any]:
+    """Columns of an Arrow IPC stream by name.
+
+    Numeric columns become NumPy arrays, without a copy when the stream holds a single
+    record batch; other columns become Python lists. Nulls are rejected, and a
+    malformed stream raises ``ValueError``.
+    """
+    import pyarrow as pa
+
+    table = pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+    columns: dict[str, Any] = {}
+    for name, column in zip(table.column_names, table.columns, strict=True):
+        if column.null_count:
+            raise ValueError(f"column '{name}' contains nulls")
+        if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+            # combine_chunks copies even a single chunk; one chunk is viewed directly.
+            array = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+            columns[name] = array.to_numpy(zero_copy_only=False)
+        else:
+            columns[name] = column.to_pylist()
+    return columns
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from youtube_success_ml.services.intelligence_service import IntelligenceService
+
+
+class ServiceWarmup:
+    """Load the intelligence service in a background thread, then warm every scoring path.
+
+    ``load`` is the app's own service accessor, so the instance warmed here is the one
+    requests get. The state is ``idle`` until ``start`` is called (readiness is then
+    left to the artifact check), and moves through ``loading`` and ``warming`` to
+    ``ready`` or ``failed``. A failed warm-up can be started again.
+    """
+
+    def __init__(self, load: Callable[[], IntelligenceService]) -> None:
+        self._load = load
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.state = "idle"
+        self.load_seconds: float | None = None
+        self.warmup_seconds: float | None = None
+        self.paths: dict[str, float] = {}
+        self.error: str | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self.state == "ready"
+
+    def start(self) -> bool:
+        """Begin warming in the background; ``False`` if already running or done."""
+        with self._lock:
+            if self._thread is not None and self.state != "failed":
+                return False
+            self.state, self.error = "loading", None
+            self._thread = threading.Thread(target=self._run, name="service-warmup", daemon=True)
+            self._thread.start()
+            return True
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the current warm-up finishes (or ``timeout``); whether it is ready."""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return self.ready
+
+    def _run(self) -> None:
+        try:
+            start = time.perf_counter()
+            service = self._load()
+            self.load_seconds = time.perf_counter() - start
+            self.state = "warming"
+            start = time.perf_counter()
+            self.paths = service.warm_up()
+            self.warmup_seconds = time.perf_counter() - start
+            self.state = "ready"
+        except Exception as exc:  # noqa: BLE001
+            self.error = str(exc) or type(exc).__name__
+            self.state = "failed"
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "state": self.state,
+            "load_seconds": self.load_seconds,
+            "warmup_seconds": self.warmup_seconds,
+            "paths": dict(self.paths),
+            "error": self.error,
+        }
+
+    def render_metrics(self) -> list[str]:
+        lines = [
+            "# HELP service_warmup_ready Whether model load and warm-up have finished",
+            "# TYPE service_warmup_ready gauge",
+            f"service_warmup_ready {int(self.ready)}",
+        ]
+        for name, value, help_text in (
+            ("service_load_seconds", self.load_seconds, "Seconds spent loading model bundles"),
+            ("service_warmup_seconds", self.warmup_seconds, "Seconds spent on warm-up scoring"),
+        ):
+            if value is not None:
+                lines.extend(
+                    [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value:.6f}"]
+                )
+        return lines
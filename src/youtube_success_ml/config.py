@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 DATASET_FILENAME = "Global YouTube Statistics.csv"
@@ -22,7 +24,13 @@ def _candidate_roots() -> list[Path]:
     return deduped
 
 
-def _resolve_project_root() -> Path:
+@cache
+def project_root() -> Path:
+    """Repository root, found by walking up from the working directory and this module.
+
+    Resolved on first use and memoized, so importing the package never touches the
+    filesystem; ``YTS_PROJECT_ROOT`` skips the walk entirely.
+    """
     env_root = os.getenv("YTS_PROJECT_ROOT")
     if env_root:
         return Path(env_root).expanduser().resolve()
@@ -40,14 +48,89 @@ def _resolve_project_root() -> Path:
     return Path.cwd().resolve()
 
 
-PROJECT_ROOT = _resolve_project_root()
-DEFAULT_DATA_PATH = Path(
-    os.getenv("YTS_DATA_PATH", str(PROJECT_ROOT / "data" / DATASET_FILENAME))
-).expanduser()
-ARTIFACT_DIR = Path(os.getenv("YTS_ARTIFACT_DIR", str(PROJECT_ROOT / "artifacts"))).expanduser()
-MODEL_DIR = Path(os.getenv("YTS_MODEL_DIR", str(ARTIFACT_DIR / "models"))).expanduser()
-REPORT_DIR = Path(os.getenv("YTS_REPORT_DIR", str(ARTIFACT_DIR / "reports"))).expanduser()
-MAP_DIR = Path(os.getenv("YTS_MAP_DIR", str(ARTIFACT_DIR / "maps"))).expanduser()
+def _env_path(name: str, default: Callable[[], Path]) -> Path:
+    value = os.getenv(name)
+    return Path(value).expanduser() if value else default().expanduser()
+
+
+def _artifact_dir() -> Path:
+    return _env_path("YTS_ARTIFACT_DIR", lambda: project_root() / "artifacts")
+
+
+# Data and artifact locations depend on the project root, so they are computed on first
+# attribute access (see ``__getattr__``) and then cached as ordinary module globals.
+_LAZY_PATHS: dict[str, Callable[[], Path]] = {
+    "PROJECT_ROOT": project_root,
+    "DEFAULT_DATA_PATH": lambda: _env_path(
+        "YTS_DATA_PATH", lambda: project_root() / "data" / DATASET_FILENAME
+    ),
+    "ARTIFACT_DIR": _artifact_dir,
+    "MODEL_DIR": lambda: _env_path("YTS_MODEL_DIR", lambda: _artifact_dir() / "models"),
+    "REPORT_DIR": lambda: _env_path("YTS_REPORT_DIR", lambda: _artifact_dir() / "reports"),
+    "MAP_DIR": lambda: _env_path("YTS_MAP_DIR", lambda: _artifact_dir() / "maps"),
+}
+
+
+def __getattr__(name: str) -> Path:
+    factory = _LAZY_PATHS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = globals()[name] = factory()
+    return value
+
+
+# Typed Parquet copy of the source CSV (needs pyarrow); defaults to <csv dir>/.yts_cache.
+DATASET_CACHE_ENABLED = os.getenv("YTS_DATASET_CACHE_ENABLED", "1").strip().lower() not in {
+    "0",
+    "false",
+    "no",
+}
+DATASET_CACHE_DIR = (
+    Path(os.environ["YTS_DATASET_CACHE_DIR"]).expanduser()
+    if os.getenv("YTS_DATASET_CACHE_DIR")
+    else None
+)
+
+# Supervised inference backend: "sklearn" (fitted pipelines) or "compiled" (NumPy node tables).
+INFERENCE_ENGINE = os.getenv("YTS_INFERENCE_ENGINE", "sklearn").strip().lower()
+INFERENCE_ENGINES = ("sklearn", "compiled")
+
+# Prediction memoization: max entries (0 disables) and optional TTL in seconds.
+PREDICTION_CACHE_SIZE = int(os.getenv("YTS_PREDICTION_CACHE_SIZE", "4096"))
+PREDICTION_CACHE_TTL_SECONDS = float(os.getenv("YTS_PREDICTION_CACHE_TTL_SECONDS", "0")) or None
+
+# Async micro-batching for single-row /predict: coalesce concurrent requests into
+# batches of at most MICROBATCH_MAX_BATCH_SIZE, waiting up to MICROBATCH_MAX_WAIT_MS.
+MICROBATCH_ENABLED = os.getenv("YTS_MICROBATCH_ENABLED", "1").strip().lower() not in {
+    "0",
+    "false",
+    "no",
+}
+MICROBATCH_MAX_BATCH_SIZE = int(os.getenv("YTS_MICROBATCH_MAX_BATCH_SIZE", "64"))
+MICROBATCH_MAX_WAIT_MS = float(os.getenv("YTS_MICROBATCH_MAX_WAIT_MS", "2"))
+
+# Rows validated and scored per chunk by the streaming NDJSON endpoint.
+STREAM_CHUNK_SIZE = int(os.getenv("YTS_STREAM_CHUNK_SIZE", "1000"))
+
+# Live drift monitor: sliding window of scored requests compared with the training baseline.
+DRIFT_MONITOR_ENABLED = os.getenv("YTS_DRIFT_MONITOR_ENABLED", "1").strip().lower() not in {
+    "0",
+    "false",
+    "no",
+}
+DRIFT_MONITOR_WINDOW = int(os.getenv("YTS_DRIFT_MONITOR_WINDOW", "10000"))
+
+# Load the model bundles and score warm-up samples when an API process starts; /ready
+# answers 503 until that has finished.
+WARMUP_ENABLED = os.getenv("YTS_WARMUP_ENABLED", "1").strip().lower() not in {
+    "0",
+    "false",
+    "no",
+}
+
+# Upper bound, in seconds, on importing an API app in a fresh interpreter (see
+# tests/test_cold_start.py and scripts/benchmarks/bench_import_time.py).
+COLD_START_BUDGET_SECONDS = float(os.getenv("YTS_COLD_START_BUDGET_SECONDS", "2.0"))
 
 
 @dataclass(frozen=True)
@@ -59,6 +142,7 @@ class TrainingConfig:
     n_clusters: int = 4
     dbscan_eps: float = 0.95
     dbscan_min_samples: int = 12
+    supervised_mode: str = "per_target"
 
     @classmethod
     def from_env(cls) -> "TrainingConfig":
@@ -70,4 +154,5 @@ class TrainingConfig:
             n_clusters=int(os.getenv("YTS_N_CLUSTERS", "4")),
             dbscan_eps=float(os.getenv("YTS_DBSCAN_EPS", "0.95")),
             dbscan_min_samples=int(os.getenv("YTS_DBSCAN_MIN_SAMPLES", "12")),
+            supervised_mode=os.getenv("YTS_SUPERVISED_MODE", "per_target").strip().lower(),
         )
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from youtube_success_ml.data.loader import (
+    load_raw_dataset,
+    prepare_dataset,
+    raw_columns_for,
+    resolve_data_path,
+)
+from youtube_success_ml.mlops.registry import file_sha256
+
+# (mtime_ns, size) of the source file a cached frame was built from.
+FileSignature = tuple[int, int]
+# (frame kind, resolved source path, projected columns or None for all).
+CacheKey = tuple[str, Path, tuple[str, ...] | None]
+
+
+def file_signature(path: Path) -> FileSignature:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+_digests: dict[Path, tuple[FileSignature, str]] = {}
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of ``path``, rehashed only when its mtime or size changes."""
+    signature = file_signature(path)
+    entry = _digests.get(path)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+    digest = file_sha256(path)
+    _digests[path] = (signature, digest)
+    return digest
+
+
+def read_only_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """``frame`` rebuilt on non-writeable copies of its NumPy and categorical-code arrays.
+
+    Other extension arrays (e.g. Arrow-backed strings) are immutable already.
+    """
+    columns: dict[str, object] = {}
+    for name, column in frame.items():
+        if isinstance(column.dtype, np.dtype):
+            values = column.to_numpy(copy=True)
+            values.flags.writeable = False
+            columns[name] = values
+        elif isinstance(column.dtype, pd.CategoricalDtype):
+            codes = column.cat.codes.to_numpy(copy=True)
+            codes.flags.writeable = False
+            columns[name] = pd.Categorical.from_codes(codes, dtype=column.dtype)
+        else:
+            columns[name] = column.array
+    return pd.DataFrame(columns, index=frame.index, copy=False)
+
+
+class DatasetCache:
+    """Process-wide cache of parsed dataset frames, revalidated by file mtime and size.
+
+    Loads are single-flight: concurrent misses for the same frame wait on one parse
+    instead of each reading the CSV. Cached frames are backed by read-only arrays (see
+    :func:`read_only_frame`) and callers receive shallow copies, so handlers can add or
+    replace columns, but a write into shared values raises instead of leaking into
+    other requests.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[CacheKey, tuple[FileSignature, pd.DataFrame]] = {}
+        self._key_locks: dict[CacheKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def _get(
+        self,
+        kind: str,
+        path: Path,
+        columns: list[str] | None,
+        build: Callable[[Path], pd.DataFrame],
+    ) -> pd.DataFrame:
+        key = (kind, path, None if columns is None else tuple(columns))
+        signature = file_signature(path)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1].copy(deep=False)
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have finished the same load while we waited.
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1].copy(deep=False)
+            frame = read_only_frame(build(path))
+            self._entries[key] = (signature, frame)
+            self.loads += 1
+        return frame.copy(deep=False)
+
+    def raw(self, path: Path | str | None = None, columns: list[str] | None = None) -> pd.DataFrame:
+        """Cached equivalent of :func:`load_raw_dataset`; each column set is its own entry."""
+        return self._get(
+            "raw", resolve_data_path(path), columns, lambda p: load_raw_dataset(p, columns)
+        )
+
+    def processed(
+        self, path: Path | str | None = None, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        """Cached equivalent of :func:`load_dataset`, built from the cached raw frame."""
+        raw_columns = None if columns is None else raw_columns_for(columns)
+        return self._get(
+            "processed",
+            resolve_data_path(path),
+            columns,
+            lambda p: prepare_dataset(self.raw(p, raw_columns), columns),
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "loads": self.loads, "size": len(self._entries)}
+
+
+_shared_cache = DatasetCache()
+
+
+def get_dataset_cache() -> DatasetCache:
+    return _shared_cache
+
+
+def cached_raw_dataset(
+    path: Path | str | None = None, columns: list[str] | None = None
+) -> pd.DataFrame:
+    return _shared_cache.raw(path, columns)
+
+
+def cached_dataset(
+    path: Path | str | None = None, columns: list[str] | None = None
+) -> pd.DataFrame:
+    return _shared_cache.processed(path, columns)
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import importlib.util
+import json
+import logging
+import os
 import re
-from collections.abc import Iterable
-from datetime import datetime
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
-from youtube_success_ml.config import DATASET_FILENAME, DEFAULT_DATA_PATH, PROJECT_ROOT
+from youtube_success_ml.config import (
+    DATASET_CACHE_DIR,
+    DATASET_CACHE_ENABLED,
+    DATASET_FILENAME,
+    DEFAULT_DATA_PATH,
+    PROJECT_ROOT,
+)
+from youtube_success_ml.mlops.registry import file_sha256
+
+logger = logging.getLogger(__name__)
 
 
 def _normalize_column_name(col: str) -> str:
@@ -59,57 +74,317 @@ def resolve_data_path(path: Path | str | None = None) -> Path:
     )
 
 
-def load_raw_dataset(path: Path | str | None = None) -> pd.DataFrame:
-    """Load source dataset and normalize schema without feature engineering."""
-    file_path = resolve_data_path(path)
-    df = pd.read_csv(file_path, encoding="latin-1")
+NUMERIC_COLUMNS = [
+    "subscribers",
+    "uploads",
+    "video_views",
+    "video_views_for_the_last_30_days",
+    "lowest_monthly_earnings",
+    "highest_monthly_earnings",
+    "lowest_yearly_earnings",
+    "highest_yearly_earnings",
+    "subscribers_for_last_30_days",
+    "created_year",
+    "latitude",
+    "longitude",
+    "population",
+    "urban_population",
+    "unemployment_rate",
+    "gross_tertiary_education_enrollment_pct",
+]
+CATEGORICAL_COLUMNS = ["category", "country", "abbreviation"]
+# Engineered columns of ``load_dataset`` and the raw columns each one is derived from.
+ENGINEERED_COLUMNS = {
+    "age": ["created_year"],
+    "growth_target": ["subscribers_for_last_30_days"],
+}
+
+DEFAULT_CHUNKSIZE = 100_000
+# Text encoding of the source CSV export.
+SOURCE_ENCODING = "latin-1"
+
+# Bump whenever the parse/normalization below changes so stale columnar caches are rebuilt.
+COLUMNAR_CACHE_VERSION = 1
+
+
+def _project(df: pd.DataFrame, columns: list[str] | None) -> pd.DataFrame:
+    if columns is None:
+        return df
+    return df[[col for col in columns if col in df.columns]]
+
+
+def _usecols(columns: list[str] | None) -> Callable[[str], bool] | None:
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return lambda name: _normalize_column_name(name) in wanted
+
+
+def _normalize_frame(
+    df: pd.DataFrame,
+    columns: list[str] | None = None,
+    categories: dict[str, list[str]] | None = None,
+) -> pd.DataFrame:
+    """Normalize names and dtypes; ``categories`` fixes the categorical levels (for chunks)."""
     df.columns = [_normalize_column_name(c) for c in df.columns]
 
-    numeric_columns = [
-        "subscribers",
-        "uploads",
-        "video_views",
-        "video_views_for_the_last_30_days",
-        "lowest_monthly_earnings",
-        "highest_monthly_earnings",
-        "lowest_yearly_earnings",
-        "highest_yearly_earnings",
-        "subscribers_for_last_30_days",
-        "created_year",
-        "latitude",
-        "longitude",
-        "population",
-        "urban_population",
-        "unemployment_rate",
-        "gross_tertiary_education_enrollment_pct",
-    ]
-    for col in numeric_columns:
+    for col in NUMERIC_COLUMNS:
         if col in df.columns:
             df[col] = pd.to_numeric(df[col], errors="coerce")
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            values = df[col]
+            levels = categories[col] if categories is not None else sorted(values.dropna().unique())
+            df[col] = pd.Categorical(values, categories=levels)
+    return _project(df, columns)
+
+
+def _parse_csv(file_path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+    df = pd.read_csv(file_path, encoding=SOURCE_ENCODING, usecols=_usecols(columns))
+    return _normalize_frame(df, columns)
+
+
+def _source_digest(file_path: Path, cache_dir: Path) -> str:
+    """SHA-256 of the source file, reused from a sidecar while its mtime and size match."""
+    stat = file_path.stat()
+    sidecar = cache_dir / f"{file_path.stem}.source.json"
+    signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if sidecar.exists():
+        try:
+            meta = json.loads(sidecar.read_text(encoding="utf-8"))
+            if {k: meta.get(k) for k in signature} == signature and meta.get("sha256"):
+                return str(meta["sha256"])
+        except (OSError, ValueError):
+            pass
+    digest = file_sha256(file_path)
+    _write_atomic(sidecar, json.dumps({**signature, "sha256": digest}).encode("utf-8"))
+    return digest
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _columnar_cache_enabled() -> bool:
+    return DATASET_CACHE_ENABLED and importlib.util.find_spec("pyarrow") is not None
+
+
+def _load_via_columnar_cache(file_path: Path, columns: list[str] | None) -> pd.DataFrame:
+    """Read the typed Parquet copy of ``file_path``, building it first if stale or missing.
+
+    The cache always holds every column; ``columns`` is pushed down into the Parquet read.
+    Only an unprojected read builds it: a projected miss parses just the CSV columns it needs.
+    """
+    cache_dir = DATASET_CACHE_DIR or file_path.parent / ".yts_cache"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        digest = _source_digest(file_path, cache_dir)
+    except OSError as exc:
+        logger.warning("Dataset cache unavailable at %s: %s", cache_dir, exc)
+        return _parse_csv(file_path, columns)
+
+    cache_path = cache_dir / f"{file_path.stem}.v{COLUMNAR_CACHE_VERSION}.{digest[:16]}.parquet"
+    if cache_path.exists():
+        try:
+            if columns is not None:
+                import pyarrow.parquet as pq
+
+                available = set(pq.read_schema(cache_path).names)
+                columns = [col for col in columns if col in available]
+            return pd.read_parquet(cache_path, columns=columns)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Discarding unreadable dataset cache %s: %s", cache_path, exc)
+
+    if columns is not None:
+        return _parse_csv(file_path, columns)
+    df = _parse_csv(file_path)
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, cache_path)
+        for stale in cache_dir.glob(f"{file_path.stem}.v*.parquet"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except OSError as exc:
+        logger.warning("Could not write dataset cache %s: %s", cache_path, exc)
+        tmp.unlink(missing_ok=True)
     return df
 
 
-def load_dataset(path: Path | str | None = None) -> pd.DataFrame:
-    """Load cleaned dataset with feature engineering for modeling."""
-    df = load_raw_dataset(path=path)
+def load_raw_dataset(
+    path: Path | str | None = None, columns: list[str] | None = None
+) -> pd.DataFrame:
+    """Load source dataset and normalize schema without feature engineering.
+
+    ``columns`` (normalized names) limits which columns are read; requested columns
+    missing from the source are skipped.
+
+    ``category``, ``country`` and ``abbreviation`` are returned as categoricals. When
+    pyarrow is installed the typed frame is also cached as Parquet next to the CSV
+    (keyed by the CSV's SHA-256 and ``COLUMNAR_CACHE_VERSION``) and reused while fresh.
+    """
+    file_path = resolve_data_path(path)
+    if _columnar_cache_enabled():
+        return _load_via_columnar_cache(file_path, columns)
+    return _parse_csv(file_path, columns)
+
+
+def raw_columns_for(columns: list[str]) -> list[str]:
+    """Raw source columns needed to produce ``columns`` of the processed dataset."""
+    raw: list[str] = []
+    for col in columns:
+        raw.extend(ENGINEERED_COLUMNS.get(col, [col]))
+    return list(dict.fromkeys(raw))
+
+
+def load_dataset(path: Path | str | None = None, columns: list[str] | None = None) -> pd.DataFrame:
+    """Load cleaned dataset with feature engineering for modeling.
+
+    With ``columns``, only the raw columns those outputs depend on are read and only
+    the requested engineered features are computed.
+    """
+    raw_columns = None if columns is None else raw_columns_for(columns)
+    return prepare_dataset(load_raw_dataset(path=path, columns=raw_columns), columns)
+
+
+@dataclass(frozen=True)
+class DatasetProfile:
+    """Whole-file statistics that keep chunked feature engineering consistent."""
+
+    age_median: float
+    categories: dict[str, list[str]]
+
+
+def _age(created_year: pd.Series, current_year: int) -> pd.Series:
+    return (current_year - created_year).clip(lower=0)
+
+
+def median_from_counts(counts: pd.Series) -> float:
+    """Median of the multiset ``{value: count}``, matching ``Series.median``."""
+    if counts.empty:
+        return float("nan")
+    counts = counts.sort_index()
+    cumulative = counts.cumsum().to_numpy()
+    values = counts.index.to_numpy(dtype=float)
+    total = int(cumulative[-1])
+    lower = values[np.searchsorted(cumulative, (total - 1) // 2, side="right")]
+    upper = values[np.searchsorted(cumulative, total // 2, side="right")]
+    return float((lower + upper) / 2)
+
+
+def profile_dataset(
+    path: Path | str | None = None, chunksize: int = DEFAULT_CHUNKSIZE
+) -> DatasetProfile:
+    """First pass over the source, reading only the columns the global statistics need.
+
+    Memory is bounded by the number of distinct creation years and category labels,
+    not by the number of rows.
+    """
+    file_path = resolve_data_path(path)
+    needed = ["created_year", *CATEGORICAL_COLUMNS]
+    year_counts = pd.Series(dtype="int64")
+    labels: dict[str, set[str]] = {col: set() for col in CATEGORICAL_COLUMNS}
+    for chunk in pd.read_csv(
+        file_path, encoding=SOURCE_ENCODING, usecols=_usecols(needed), chunksize=chunksize
+    ):
+        chunk.columns = [_normalize_column_name(c) for c in chunk.columns]
+        if "created_year" in chunk.columns:
+            years = pd.to_numeric(chunk["created_year"], errors="coerce").value_counts()
+            year_counts = year_counts.add(years, fill_value=0)
+        for col in CATEGORICAL_COLUMNS:
+            if col in chunk.columns:
+                labels[col].update(chunk[col].dropna().unique())
+
+    current_year = datetime.now(timezone.utc).year
+    ages = np.maximum(current_year - year_counts.index.to_numpy(dtype=float), 0)
+    age_counts = year_counts.groupby(ages).sum()
+    return DatasetProfile(
+        age_median=median_from_counts(age_counts),
+        categories={col: sorted(values) for col, values in labels.items()},
+    )
+
+
+def iter_raw_dataset(
+    path: Path | str | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    columns: list[str] | None = None,
+    profile: DatasetProfile | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Yield the normalized source in chunks of at most ``chunksize`` rows.
+
+    With a ``profile`` the categorical columns share its levels, so chunks concatenate
+    to the same dtypes as ``load_raw_dataset``. Without one the source is read in a
+    single pass and each chunk's categoricals only carry the levels it contains.
+    """
+    file_path = resolve_data_path(path)
+    categories = profile.categories if profile is not None else None
+    for chunk in pd.read_csv(
+        file_path, encoding=SOURCE_ENCODING, usecols=_usecols(columns), chunksize=chunksize
+    ):
+        yield _normalize_frame(chunk, columns, categories)
+
+
+def iter_dataset(
+    path: Path | str | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    columns: list[str] | None = None,
+    profile: DatasetProfile | None = None,
+) -> Iterator[pd.DataFrame]:
+    """Chunked :func:`load_dataset` for inputs that do not fit in memory.
+
+    ``age`` is imputed with the whole-file median from ``profile``, so every chunk is
+    engineered exactly as the corresponding rows of ``load_dataset`` would be.
+    """
+    file_path = resolve_data_path(path)
+    profile = profile or profile_dataset(file_path, chunksize)
+    raw_columns = None if columns is None else raw_columns_for(columns)
+    for chunk in iter_raw_dataset(file_path, chunksize, raw_columns, profile):
+        yield prepare_dataset(chunk, columns, age_median=profile.age_median)
+
 
-    df["country"] = df["country"].fillna("Unknown").astype(str)
-    df["category"] = df["category"].fillna("Unknown").astype(str)
-    df["abbreviation"] = df["abbreviation"].fillna("UN").astype(str)
+def _fill_text(values: pd.Series, fill: str) -> pd.Series:
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        categories = sorted({*values.cat.categories, fill})
+        return values.cat.set_categories(categories).fillna(fill)
+    return values.fillna(fill).astype(str)
 
-    current_year = datetime.utcnow().year
-    if "created_year" in df.columns:
-        df["age"] = (current_year - df["created_year"]).clip(lower=0)
-    else:
-        df["age"] = 0
 
-    df["age"] = df["age"].fillna(df["age"].median()).round().astype(int)
-    df["uploads"] = df["uploads"].fillna(0).clip(lower=0)
-    df["subscribers"] = df["subscribers"].fillna(0).clip(lower=0)
-    df["highest_yearly_earnings"] = df["highest_yearly_earnings"].fillna(0).clip(lower=0)
-    df["subscribers_for_last_30_days"] = df["subscribers_for_last_30_days"].fillna(0).clip(lower=0)
+def prepare_dataset(
+    df: pd.DataFrame, columns: list[str] | None = None, age_median: float | None = None
+) -> pd.DataFrame:
+    """Clean a normalized raw frame and add the engineered modeling columns (in place).
+
+    With ``columns``, cleaning is limited to the columns present, only the requested
+    engineered features are derived, and the result is projected onto ``columns``.
+    ``age_median`` overrides the frame's own median for imputing ``age`` (for chunks).
+    """
+    wanted = None if columns is None else set(columns)
+    for col, fill in (("country", "Unknown"), ("category", "Unknown"), ("abbreviation", "UN")):
+        if wanted is None or col in df.columns:
+            df[col] = _fill_text(df[col], fill)
+
+    if wanted is None or "age" in wanted:
+        current_year = datetime.now(timezone.utc).year
+        if "created_year" in df.columns:
+            df["age"] = _age(df["created_year"], current_year)
+        else:
+            df["age"] = 0
+        fill = df["age"].median() if age_median is None else age_median
+        df["age"] = df["age"].fillna(fill).round().astype(int)
+
+    for col in (
+        "uploads",
+        "subscribers",
+        "highest_yearly_earnings",
+        "subscribers_for_last_30_days",
+    ):
+        if wanted is None or col in df.columns:
+            df[col] = df[col].fillna(0).clip(lower=0)
 
     # Supervised learning target for growth.
-    df["growth_target"] = df["subscribers_for_last_30_days"]
+    if wanted is None or "growth_target" in wanted:
+        df["growth_target"] = df["subscribers_for_last_30_days"]
 
-    return df
+    return _project(df, columns)
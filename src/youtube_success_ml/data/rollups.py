@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from youtube_success_ml.config import REPORT_DIR
+from youtube_success_ml.data.cache import (
+    FileSignature,
+    cached_dataset,
+    file_digest,
+    file_signature,
+)
+from youtube_success_ml.data.loader import resolve_data_path
+
+ROLLUP_VERSION = 1
+ROLLUP_FILENAME = "analytics_rollup.joblib"
+UPLOAD_BUCKET_LABELS = ["0-100", "101-500", "501-2k", "2k-10k", "10k+"]
+ROLLUP_DIMENSIONS = ["country", "abbreviation", "category", "upload_bucket"]
+# Cube metric prefix -> processed-dataset column; each gets a ``_sum`` and a ``_count``.
+ROLLUP_METRICS = {
+    "subscribers": "subscribers",
+    "earnings": "highest_yearly_earnings",
+    "growth": "growth_target",
+}
+# Processed-dataset columns the rollup is built from.
+ROLLUP_COLUMNS = [
+    "youtuber",
+    "country",
+    "abbreviation",
+    "category",
+    "uploads",
+    "subscribers",
+    "highest_yearly_earnings",
+    "growth_target",
+    "latitude",
+    "longitude",
+]
+
+
+def upload_bucket_labels(uploads: pd.Series) -> np.ndarray:
+    return np.select(
+        [
+            (uploads >= 0) & (uploads <= 100),
+            (uploads > 100) & (uploads <= 500),
+            (uploads > 500) & (uploads <= 2000),
+            (uploads > 2000) & (uploads <= 10000),
+            (uploads > 10000),
+        ],
+        UPLOAD_BUCKET_LABELS,
+        default="unknown",
+    )
+
+
+@dataclass(frozen=True)
+class AnalyticsRollup:
+    """Country x abbreviation x category x upload-bucket cube of additive aggregates.
+
+    ``cells`` holds channel counts and per-metric sums and non-null counts, so any
+    roll-up over a subset of the dimensions reproduces the row-level groupby means.
+    Medians are not additive, so per-country coordinates are kept in ``countries``.
+    """
+
+    cells: pd.DataFrame
+    countries: pd.DataFrame
+    data_sha256: str | None = None
+    version: int = ROLLUP_VERSION
+
+
+def build_analytics_rollup(df: pd.DataFrame, data_sha256: str | None = None) -> AnalyticsRollup:
+    frame = df.assign(upload_bucket=upload_bucket_labels(df["uploads"]))
+    aggregations: dict[str, tuple[str, str]] = {"channel_count": ("youtuber", "count")}
+    for name, column in ROLLUP_METRICS.items():
+        aggregations[f"{name}_sum"] = (column, "sum")
+        aggregations[f"{name}_count"] = (column, "count")
+    # dropna=False keeps rows with a missing key; each slice drops them again itself.
+    cells = frame.groupby(ROLLUP_DIMENSIONS, as_index=False, observed=True, dropna=False).agg(
+        **aggregations
+    )
+    countries = frame.groupby(["country", "abbreviation"], as_index=False, observed=True).agg(
+        latitude=("latitude", "median"),
+        longitude=("longitude", "median"),
+    )
+    return AnalyticsRollup(cells=cells, countries=countries, data_sha256=data_sha256)
+
+
+def save_analytics_rollup(rollup: AnalyticsRollup, path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    joblib.dump(rollup, path)
+    return path
+
+
+def load_analytics_rollup(path: Path) -> AnalyticsRollup | None:
+    if not path.exists():
+        return None
+    rollup = joblib.load(path)
+    if not isinstance(rollup, AnalyticsRollup) or rollup.version != ROLLUP_VERSION:
+        return None
+    return rollup
+
+
+def _slice(cells: pd.DataFrame, keys: list[str], means: dict[str, str]) -> pd.DataFrame:
+    """Group cube cells by ``keys``; ``means`` maps output column -> metric prefix."""
+    sums = cells.groupby(keys, as_index=False, observed=True).sum(numeric_only=True)
+    for output, metric in means.items():
+        sums[output] = sums[f"{metric}_sum"] / sums[f"{metric}_count"]
+    return sums
+
+
+def category_performance(rollup: AnalyticsRollup, top_n: int) -> list[dict[str, Any]]:
+    agg = _slice(
+        rollup.cells,
+        ["category"],
+        {"avg_subscribers": "subscribers", "avg_earnings": "earnings", "avg_growth": "growth"},
+    ).rename(columns={"subscribers_sum": "total_subscribers", "earnings_sum": "total_earnings"})
+    agg = agg[
+        [
+            "category",
+            "channel_count",
+            "avg_subscribers",
+            "avg_earnings",
+            "avg_growth",
+            "total_subscribers",
+            "total_earnings",
+        ]
+    ]
+    agg = agg.sort_values("total_subscribers", ascending=False).head(top_n)
+    return agg.to_dict(orient="records")
+
+
+def upload_growth_buckets(rollup: AnalyticsRollup) -> list[dict[str, Any]]:
+    agg = _slice(
+        rollup.cells,
+        ["upload_bucket"],
+        {"avg_growth": "growth", "avg_earnings": "earnings", "avg_subscribers": "subscribers"},
+    )
+    agg = agg[["upload_bucket", "channel_count", "avg_growth", "avg_earnings", "avg_subscribers"]]
+    return agg.sort_values("upload_bucket").to_dict(orient="records")
+
+
+def country_metrics(rollup: AnalyticsRollup) -> list[dict[str, Any]]:
+    """Cube equivalent of ``visualization.maps.build_country_metrics``."""
+    cells = rollup.cells[rollup.cells["country"] != "Unknown"]
+    grouped = _slice(cells, ["country", "abbreviation"], {"avg_growth": "growth"}).rename(
+        columns={"subscribers_sum": "total_subscribers", "earnings_sum": "total_earnings"}
+    )
+    grouped = grouped[
+        ["country", "abbreviation", "total_subscribers", "total_earnings", "channel_count"]
+        + ["avg_growth"]
+    ].merge(rollup.countries, on=["country", "abbreviation"], how="left")
+
+    dominant = (
+        _slice(cells, ["country", "category"], {})
+        .rename(columns={"subscribers_sum": "subscribers"})[["country", "category", "subscribers"]]
+        .sort_values("subscribers", ascending=False)
+        .drop_duplicates(subset=["country"])
+        .rename(columns={"category": "dominant_category"})[["country", "dominant_category"]]
+    )
+
+    merged = grouped.merge(dominant, on="country", how="left")
+    merged = merged.sort_values("total_subscribers", ascending=False)
+    records = merged.to_dict(orient="records")
+    for row in records:
+        latitude = row.get("latitude")
+        longitude = row.get("longitude")
+        row["latitude"] = float(latitude) if pd.notna(latitude) else None
+        row["longitude"] = float(longitude) if pd.notna(longitude) else None
+    return records
+
+
+class AnalyticsRollupStore:
+    """Serves the rollup for a dataset file from memory, revalidated like ``DatasetCache``.
+
+    On a miss (first request or a changed file) the training artifact is used when it
+    was built from the same file contents; otherwise the cube is rebuilt from the
+    cached dataset, so the analytics endpoints never serve stale aggregates.
+    """
+
+    def __init__(self, artifact_path: Path | None = None) -> None:
+        self.artifact_path = artifact_path or REPORT_DIR / ROLLUP_FILENAME
+        self._entries: dict[Path, tuple[FileSignature, AnalyticsRollup]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+        self.artifact_loads = 0
+
+    def get(self, path: Path | str | None = None) -> AnalyticsRollup:
+        path = resolve_data_path(path)
+        signature = file_signature(path)
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1]
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                return entry[1]
+            digest = file_digest(path)
+            rollup = load_analytics_rollup(self.artifact_path)
+            if rollup is not None and rollup.data_sha256 == digest:
+                self.artifact_loads += 1
+            else:
+                rollup = build_analytics_rollup(cached_dataset(path, ROLLUP_COLUMNS), digest)
+                self.builds += 1
+            self._entries[path] = (signature, rollup)
+        return rollup
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "builds": self.builds, "artifact_loads": self.artifact_loads}
+
+
+_shared_store = AnalyticsRollupStore()
+
+
+def get_rollup_store() -> AnalyticsRollupStore:
+    return _shared_store
+
+
+def cached_rollup(path: Path | str | None = None) -> AnalyticsRollup:
+    return _shared_store.get(path)
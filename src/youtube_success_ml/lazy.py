@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access.
+
+    The API processes reach pandas, scikit-learn, plotly and folium only through the
+    data, model and visualization layers; holding those layers behind this proxy keeps
+    them out of the import of the app itself. ``importlib`` serializes concurrent
+    first imports, so racing request threads all see a fully initialized module.
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: ModuleType | None = None
+
+    def __getattr__(self, attr: str) -> Any:
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
@@ -1,22 +1,63 @@
 from __future__ import annotations
 
 import json
+import math
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from youtube_success_ml.mlops.sketches import KLLSketch
 from youtube_success_ml.models.supervised import FEATURE_COLUMNS
 
 NUMERIC_FEATURES = ["uploads", "age"]
 CATEGORICAL_FEATURES = ["category", "country"]
+# Processed-dataset columns the training baseline is built from.
+BASELINE_COLUMNS = FEATURE_COLUMNS
+# Baseline deciles used as the edges of the fixed-bin numeric histograms.
+HISTOGRAM_QUANTILES = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+# Floor for PSI proportions so unseen or vanished categories give a finite score.
+PSI_EPSILON = 1e-4
+# Conventional PSI level above which a distribution is treated as shifted.
+PSI_ALERT_THRESHOLD = 0.2
+# Two-sample KS critical coefficient c(alpha) at alpha = 0.05.
+KS_CRITICAL_COEFFICIENT = 1.358
+
+
+def population_stability_index(
+    observed: dict[Any, float], expected: dict[Any, float], epsilon: float = PSI_EPSILON
+) -> float:
+    """PSI between two proportion maps (categories or bins) over the union of their keys."""
+    psi = 0.0
+    for key in set(observed) | set(expected):
+        actual = max(observed.get(key, 0.0), epsilon)
+        reference = max(float(expected.get(key, 0.0)), epsilon)
+        psi += (actual - reference) * math.log(actual / reference)
+    return psi
+
+
+def _histogram_proportions(
+    edges: list[float], values: np.ndarray, weights: np.ndarray | None = None
+) -> list[float]:
+    """Proportions of ``values`` in the ``len(edges) + 1`` bins ``(-inf, e0), [e0, e1), ...``."""
+    bins = np.searchsorted(np.asarray(edges, dtype=np.float64), values, side="right")
+    counts = np.bincount(bins, weights=weights, minlength=len(edges) + 1).astype(np.float64)
+    total = counts.sum()
+    return (counts / total).round(6).tolist() if total else counts.tolist()
+
+
+def _distribution(sketch: KLLSketch, edges: list[float], proportions: list[float]) -> dict:
+    return {"kll": sketch.to_dict(), "histogram": {"edges": edges, "proportions": proportions}}
 
 
 def build_training_baseline(df: pd.DataFrame) -> dict[str, Any]:
     """Build drift baseline from model feature columns."""
-    feature_df = df[FEATURE_COLUMNS].copy()
+    feature_df = df[BASELINE_COLUMNS].copy()
 
     numeric_stats: dict[str, dict[str, float]] = {}
+    distributions: dict[str, dict[str, Any]] = {}
     for col in NUMERIC_FEATURES:
         series = pd.to_numeric(feature_df[col], errors="coerce").fillna(0)
         std = float(series.std())
@@ -25,6 +66,11 @@ def build_training_baseline(df: pd.DataFrame) -> dict[str, Any]:
             "std": std if std > 1e-9 else 1.0,
             "p95": float(series.quantile(0.95)),
         }
+        values = series.to_numpy(dtype=np.float64)
+        sketch = KLLSketch()
+        sketch.update(values)
+        edges = np.unique(series.quantile(HISTOGRAM_QUANTILES).to_numpy()).tolist()
+        distributions[col] = _distribution(sketch, edges, _histogram_proportions(edges, values))
 
     categorical_stats: dict[str, dict[str, float]] = {}
     for col in CATEGORICAL_FEATURES:
@@ -42,19 +88,158 @@ def build_training_baseline(df: pd.DataFrame) -> dict[str, Any]:
         "features": FEATURE_COLUMNS,
         "numeric": numeric_stats,
         "categorical": categorical_stats,
+        "distributions": distributions,
     }
 
 
+def _quantile_from_counts(counts: pd.Series, q: float) -> float:
+    """``Series.quantile(q)`` (linear interpolation) of the multiset ``{value: count}``."""
+    counts = counts.sort_index()
+    cumulative = counts.cumsum().to_numpy()
+    values = counts.index.to_numpy(dtype=float)
+    position = q * (int(cumulative[-1]) - 1)
+    lower_pos = int(np.floor(position))
+    lower = values[np.searchsorted(cumulative, lower_pos, side="right")]
+    upper = values[np.searchsorted(cumulative, int(np.ceil(position)), side="right")]
+    return float(lower + (upper - lower) * (position - lower_pos))
+
+
+def build_training_baseline_streaming(chunks: Iterable[pd.DataFrame]) -> dict[str, Any]:
+    """:func:`build_training_baseline` over processed chunks (e.g. ``iter_dataset``).
+
+    Numeric features are summarized with exact value counts, which stay small because
+    uploads and age are integers with far fewer distinct values than rows; their KLL
+    sketches are fed chunk by chunk, so they may differ slightly from the in-memory ones.
+    """
+    value_counts = {col: pd.Series(dtype="int64") for col in NUMERIC_FEATURES}
+    sketches = {col: KLLSketch() for col in NUMERIC_FEATURES}
+    category_counts = {col: pd.Series(dtype="int64") for col in CATEGORICAL_FEATURES}
+    for chunk in chunks:
+        for col in NUMERIC_FEATURES:
+            series = pd.to_numeric(chunk[col], errors="coerce").fillna(0)
+            value_counts[col] = value_counts[col].add(series.value_counts(), fill_value=0)
+            sketches[col].update(series.to_numpy(dtype=np.float64))
+        for col in CATEGORICAL_FEATURES:
+            labels = chunk[col].fillna("Unknown").astype(str).value_counts()
+            category_counts[col] = category_counts[col].add(labels, fill_value=0)
+
+    numeric_stats: dict[str, dict[str, float]] = {}
+    distributions: dict[str, dict[str, Any]] = {}
+    for col, counts in value_counts.items():
+        values = counts.index.to_numpy(dtype=float)
+        weights = counts.to_numpy(dtype=float)
+        n = weights.sum()
+        mean = float((values * weights).sum() / n)
+        std = float(np.sqrt((weights * (values - mean) ** 2).sum() / (n - 1))) if n > 1 else 0.0
+        numeric_stats[col] = {
+            "mean": mean,
+            "std": std if std > 1e-9 else 1.0,
+            "p95": _quantile_from_counts(counts, 0.95),
+        }
+        edges = np.unique([_quantile_from_counts(counts, q) for q in HISTOGRAM_QUANTILES]).tolist()
+        proportions = _histogram_proportions(edges, values, weights)
+        distributions[col] = _distribution(sketches[col], edges, proportions)
+
+    categorical_stats: dict[str, dict[str, float]] = {}
+    for col, counts in category_counts.items():
+        freqs = (counts / counts.sum()).sort_values(ascending=False, kind="stable").round(6)
+        categorical_stats[col] = {str(k): float(v) for k, v in freqs.items()}
+
+    return {
+        "features": FEATURE_COLUMNS,
+        "numeric": numeric_stats,
+        "categorical": categorical_stats,
+        "distributions": distributions,
+    }
+
+
+def distributions_path(path: Path) -> Path:
+    """Sidecar holding the baseline's sketches and histograms, next to ``path``."""
+    return path.with_name(f"{path.stem}_sketches.json")
+
+
 def save_training_baseline(baseline: dict[str, Any], path: Path) -> Path:
+    """Write the summary baseline as readable JSON and its distributions as a compact sidecar."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(baseline, indent=2), encoding="utf-8")
+    summary = {key: value for key, value in baseline.items() if key != "distributions"}
+    path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    if "distributions" in baseline:
+        distributions_path(path).write_text(
+            json.dumps(baseline["distributions"], separators=(",", ":")), encoding="utf-8"
+        )
     return path
 
 
 def load_training_baseline(path: Path) -> dict[str, Any] | None:
     if not path.exists():
         return None
-    return json.loads(path.read_text(encoding="utf-8"))
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+    sidecar = distributions_path(path)
+    if sidecar.exists():
+        baseline["distributions"] = json.loads(sidecar.read_text(encoding="utf-8"))
+    return baseline
+
+
+def _ks_statistic(sketch: KLLSketch, values: np.ndarray) -> float:
+    """Sup distance between the batch ECDF and the sketch CDF.
+
+    Both are step functions, so the supremum is reached just before or at one of the
+    batch's distinct values; the cost depends on the batch and sketch size, not on
+    how many rows the baseline was built from.
+    """
+    uniques, counts = np.unique(values, return_counts=True)
+    after = np.cumsum(counts) / len(values)
+    before = after - counts / len(values)
+    return float(
+        max(
+            np.abs(after - sketch.cdf(uniques)).max(),
+            np.abs(before - sketch.cdf(uniques, strict=True)).max(),
+        )
+    )
+
+
+def _distribution_drift(
+    columns: dict[str, Any], baseline: dict[str, Any], n_rows: int
+) -> dict[str, dict[str, Any]] | None:
+    """Batch-level PSI (and KS for numeric features) against the baseline distributions."""
+    distributions = baseline.get("distributions")
+    if not distributions or not n_rows:
+        return None
+
+    result: dict[str, dict[str, Any]] = {}
+    for col in NUMERIC_FEATURES:
+        distribution = distributions.get(col)
+        if distribution is None:
+            continue
+        values = np.asarray(columns[col], dtype=np.float64)
+        histogram = distribution["histogram"]
+        observed = _histogram_proportions(histogram["edges"], values)
+        psi = population_stability_index(
+            dict(enumerate(observed)), dict(enumerate(histogram["proportions"]))
+        )
+        sketch = KLLSketch.from_dict(distribution["kll"])
+        ks = _ks_statistic(sketch, values)
+        critical = KS_CRITICAL_COEFFICIENT * math.sqrt((n_rows + sketch.n) / (n_rows * sketch.n))
+        result[col] = {
+            "psi": round(psi, 6),
+            "ks": round(ks, 6),
+            "ks_critical": round(critical, 6),
+            "drifted": psi > PSI_ALERT_THRESHOLD or ks > critical,
+        }
+
+    for col in CATEGORICAL_FEATURES:
+        expected = baseline.get("categorical", {}).get(col)
+        if not expected:
+            continue
+        observed = pd.Series(columns[col], dtype=object).astype(str).value_counts(normalize=True)
+        psi = population_stability_index(observed.to_dict(), expected)
+        result[col] = {
+            "psi": round(psi, 6),
+            "ks": None,
+            "ks_critical": None,
+            "drifted": psi > PSI_ALERT_THRESHOLD,
+        }
+    return result
 
 
 def check_feature_drift(
@@ -64,43 +249,84 @@ def check_feature_drift(
     min_category_frequency: float = 0.01,
 ) -> dict[str, Any]:
     """Score input payloads against training baseline distributions."""
-    records: list[dict[str, Any]] = []
-    severe_count = 0
+    columns = {
+        col: np.array([item[col] for item in items], dtype=np.float64) for col in NUMERIC_FEATURES
+    }
+    columns.update({col: [str(item[col]) for item in items] for col in CATEGORICAL_FEATURES})
+    return check_feature_drift_columns(
+        columns,
+        baseline=baseline,
+        z_threshold=z_threshold,
+        min_category_frequency=min_category_frequency,
+    )
+
+
+def check_feature_drift_columns(
+    columns: dict[str, Any],
+    baseline: dict[str, Any],
+    z_threshold: float = 3.0,
+    min_category_frequency: float = 0.01,
+) -> dict[str, Any]:
+    """Columnar ``check_feature_drift`` over arrays keyed by feature name.
 
+    Z-scores and category frequencies are computed for the whole batch at once;
+    warning strings are only formatted for the rows a feature flags. When the baseline
+    carries distributions, a batch-level ``distribution`` block with PSI and KS scores
+    is added; it does not change the per-record severities.
+    """
+    n_rows = len(columns[NUMERIC_FEATURES[0]])
     numeric_baseline = baseline.get("numeric", {})
     categorical_baseline = baseline.get("categorical", {})
+    warning_counts = np.zeros(n_rows, dtype=np.int64)
 
-    for idx, item in enumerate(items):
-        warnings: list[str] = []
+    numeric_flags: list[tuple[str, np.ndarray, np.ndarray]] = []
+    for col in NUMERIC_FEATURES:
+        stats = numeric_baseline.get(col, {"mean": 0.0, "std": 1.0})
+        values = np.asarray(columns[col], dtype=np.float64)
+        z = np.abs((values - float(stats["mean"])) / max(float(stats["std"]), 1e-9))
+        rows = np.flatnonzero(z > z_threshold)
+        warning_counts[rows] += 1
+        numeric_flags.append((col, rows, z))
 
-        for col in NUMERIC_FEATURES:
-            stats = numeric_baseline.get(col, {"mean": 0.0, "std": 1.0})
-            value = float(item[col])
-            z = abs((value - float(stats["mean"])) / max(float(stats["std"]), 1e-9))
-            if z > z_threshold:
-                warnings.append(f"{col}: high z-score {z:.2f}")
+    categorical_flags: list[tuple[str, np.ndarray, np.ndarray, pd.Index, np.ndarray]] = []
+    for col in CATEGORICAL_FEATURES:
+        # Integer-code the column so each distinct value is looked up in the baseline once.
+        codes, uniques = pd.factorize(pd.Series(columns[col], dtype=object).astype(str))
+        frequencies = categorical_baseline.get(col, {})
+        unique_freq = np.array([float(frequencies.get(v, 0.0)) for v in uniques], dtype=np.float64)
+        rows = np.flatnonzero(unique_freq[codes] < min_category_frequency)
+        warning_counts[rows] += 1
+        categorical_flags.append((col, rows, codes, uniques, unique_freq))
 
-        for col in CATEGORICAL_FEATURES:
-            value = str(item[col])
-            frequency = float(categorical_baseline.get(col, {}).get(value, 0.0))
-            if frequency < min_category_frequency:
-                warnings.append(f"{col}: low-frequency category '{value}' ({frequency:.4f})")
-
-        severity = "high" if len(warnings) >= 2 else "medium" if len(warnings) == 1 else "low"
-        if severity == "high":
-            severe_count += 1
-
-        records.append(
-            {
-                "index": idx,
-                "warnings": warnings,
-                "severity": severity,
-            }
-        )
+    # Warning strings are only built for flagged rows, numeric features first as before.
+    warnings: dict[int, list[str]] = {}
+    for col, rows, z in numeric_flags:
+        for i, score in zip(rows.tolist(), z[rows].tolist(), strict=True):
+            warnings.setdefault(i, []).append(f"{col}: high z-score {score:.2f}")
+    for col, rows, codes, uniques, unique_freq in categorical_flags:
+        # One message per distinct flagged value, shared by every row holding it.
+        messages = [
+            f"{col}: low-frequency category '{value}' ({frequency:.4f})"
+            for value, frequency in zip(uniques.tolist(), unique_freq.tolist(), strict=True)
+        ]
+        for i, code in zip(rows.tolist(), codes[rows].tolist(), strict=True):
+            warnings.setdefault(i, []).append(messages[code])
+
+    # Each record is assembled once from the index, warning and severity columns.
+    severities = np.array(["low", "medium", "high"], dtype=object)[np.minimum(warning_counts, 2)]
+    records = [
+        {"index": idx, "warnings": warnings.get(idx, []), "severity": severity}
+        for idx, severity in enumerate(severities.tolist())
+    ]
 
+    severe_count = int((warning_counts >= 2).sum())
     summary = {
-        "total_records": len(records),
+        "total_records": n_rows,
         "high_severity_records": severe_count,
         "is_drift_risk": severe_count > 0,
     }
-    return {"summary": summary, "records": records}
+    result: dict[str, Any] = {"summary": summary, "records": records}
+    distribution = _distribution_drift(columns, baseline, n_rows)
+    if distribution is not None:
+        result["distribution"] = distribution
+    return result
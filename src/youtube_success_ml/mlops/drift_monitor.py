@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections import Counter
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from youtube_success_ml.mlops.drift import (
+    CATEGORICAL_FEATURES,
+    NUMERIC_FEATURES,
+    PSI_ALERT_THRESHOLD,
+    population_stability_index,
+)
+
+
+class _SlidingMoments:
+    """Mean and variance of the last ``size`` values, updated in O(1) per value.
+
+    Each time the window wraps around, mean and variance are recomputed from the held
+    values so rounding error from the sliding updates cannot build up.
+    """
+
+    def __init__(self, size: int) -> None:
+        self.values = [0.0] * size
+        self.size = size
+        self.count = 0
+        self.position = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, value: float) -> None:
+        if self.count < self.size:
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (value - self.mean)
+        else:
+            # Sliding Welford: replace the oldest value in one step.
+            old = self.values[self.position]
+            old_mean = self.mean
+            self.mean += (value - old) / self.count
+            self.m2 = max(self.m2 + (value - old) * (value - self.mean + old - old_mean), 0.0)
+        self.values[self.position] = value
+        self.position = (self.position + 1) % self.size
+        if self.position == 0:
+            self.mean = math.fsum(self.values) / self.count
+            self.m2 = math.fsum((v - self.mean) ** 2 for v in self.values)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+class _SlidingCounts:
+    """Category counts over the last ``size`` values; at most ``size`` keys are held."""
+
+    def __init__(self, size: int) -> None:
+        self.values: list[str | None] = [None] * size
+        self.size = size
+        self.count = 0
+        self.position = 0
+        self.counts: Counter[str] = Counter()
+
+    def push(self, value: str) -> None:
+        old = self.values[self.position]
+        if old is not None:
+            remaining = self.counts[old] - 1
+            if remaining:
+                self.counts[old] = remaining
+            else:
+                del self.counts[old]
+        else:
+            self.count += 1
+        self.counts[value] += 1
+        self.values[self.position] = value
+        self.position = (self.position + 1) % self.size
+
+
+class DriftMonitor:
+    """Sliding-window drift statistics over live prediction traffic.
+
+    Every scored payload updates fixed-size ring buffers: running mean/variance for
+    numeric features and frequency counters for categorical ones (labels stripped of
+    surrounding whitespace, as the model sees them). ``snapshot``
+    compares the window with the training baseline: numeric features by how many
+    baseline standard deviations the window mean has moved, categorical features
+    by PSI against the baseline frequencies.
+    """
+
+    def __init__(
+        self,
+        baseline: dict[str, Any],
+        window_size: int = 10_000,
+        min_samples: int = 100,
+        z_threshold: float = 1.0,
+        psi_threshold: float = PSI_ALERT_THRESHOLD,
+    ) -> None:
+        if window_size < 2:
+            raise ValueError("window_size must be >= 2")
+        self.baseline = baseline
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self.z_threshold = z_threshold
+        self.psi_threshold = psi_threshold
+        self._numeric = {col: _SlidingMoments(window_size) for col in NUMERIC_FEATURES}
+        self._categorical = {col: _SlidingCounts(window_size) for col in CATEGORICAL_FEATURES}
+        self._lock = threading.Lock()
+        self.observed_total = 0
+
+    def observe(self, payload: dict[str, Any]) -> None:
+        self.observe_many((payload,))
+
+    def observe_many(self, payloads: Iterable[dict[str, Any]]) -> None:
+        with self._lock:
+            for payload in payloads:
+                for col, moments in self._numeric.items():
+                    moments.push(float(payload[col]))
+                for col, counts in self._categorical.items():
+                    counts.push(str(payload[col]).strip())
+                self.observed_total += 1
+
+    def observe_columns(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        """Columnar ``observe_many``: ``columns`` maps each feature to an equal-length array."""
+        with self._lock:
+            for col, moments in self._numeric.items():
+                for value in columns[col]:
+                    moments.push(float(value))
+            for col, counts in self._categorical.items():
+                for value in columns[col]:
+                    counts.push(str(value).strip())
+            self.observed_total += len(columns[NUMERIC_FEATURES[0]])
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            numeric = {
+                col: (moments.count, moments.mean, moments.std)
+                for col, moments in self._numeric.items()
+            }
+            categorical = {
+                col: (counts.count, dict(counts.counts))
+                for col, counts in self._categorical.items()
+            }
+            observed_total = self.observed_total
+
+        features: dict[str, dict[str, Any]] = {}
+        for col, (count, mean, std) in numeric.items():
+            stats = self.baseline.get("numeric", {}).get(col, {"mean": 0.0, "std": 1.0})
+            score = abs(mean - float(stats["mean"])) / max(float(stats["std"]), 1e-9)
+            features[col] = {
+                "method": "z",
+                "score": score if count else 0.0,
+                "window_mean": mean,
+                "window_std": std,
+                "alert": count >= self.min_samples and score > self.z_threshold,
+            }
+        for col, (count, counts) in categorical.items():
+            observed = {key: value / count for key, value in counts.items()} if count else {}
+            expected = self.baseline.get("categorical", {}).get(col, {})
+            score = population_stability_index(observed, expected) if count else 0.0
+            features[col] = {
+                "method": "psi",
+                "score": score,
+                "alert": count >= self.min_samples and score > self.psi_threshold,
+            }
+
+        return {
+            "window_samples": numeric[NUMERIC_FEATURES[0]][0],
+            "window_size": self.window_size,
+            "observed_total": observed_total,
+            "features": features,
+        }
+
+    def render_metrics(self) -> list[str]:
+        snapshot = self.snapshot()
+        lines = [
+            "# HELP prediction_drift_window_samples Requests in the drift monitor window",
+            "# TYPE prediction_drift_window_samples gauge",
+            f"prediction_drift_window_samples {snapshot['window_samples']}",
+            "# HELP prediction_drift_observed_total Requests observed by the drift monitor",
+            "# TYPE prediction_drift_observed_total counter",
+            f"prediction_drift_observed_total {snapshot['observed_total']}",
+            "# HELP prediction_drift_score Window drift score (mean-shift z or PSI) per feature",
+            "# TYPE prediction_drift_score gauge",
+        ]
+        for col, feature in snapshot["features"].items():
+            lines.append(
+                f'prediction_drift_score{{feature="{col}",method="{feature["method"]}"}} '
+                f"{feature['score']:.6f}"
+            )
+        lines.extend(
+            [
+                "# HELP prediction_drift_alert 1 when a feature's window drift exceeds its threshold",
+                "# TYPE prediction_drift_alert gauge",
+            ]
+        )
+        for col, feature in snapshot["features"].items():
+            lines.append(f'prediction_drift_alert{{feature="{col}"}} {int(feature["alert"])}')
+        return lines
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -7,11 +8,22 @@ import pandas as pd
 
 from youtube_success_ml.models.supervised import FEATURE_COLUMNS, TARGET_COLUMNS
 
+# Processed-dataset columns a snapshot is built from.
+SNAPSHOT_COLUMNS = FEATURE_COLUMNS + list(TARGET_COLUMNS.values())
 
-def build_feature_snapshot(df: pd.DataFrame) -> pd.DataFrame:
-    snapshot = df[FEATURE_COLUMNS + list(TARGET_COLUMNS.values())].copy()
-    snapshot["channel_id"] = [f"channel-{i}" for i in range(len(snapshot))]
-    snapshot["event_timestamp"] = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+def _snapshot_timestamp() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def build_feature_snapshot(
+    df: pd.DataFrame, start_index: int = 0, event_timestamp: str | None = None
+) -> pd.DataFrame:
+    snapshot = df[SNAPSHOT_COLUMNS].copy()
+    snapshot["channel_id"] = [
+        f"channel-{i}" for i in range(start_index, start_index + len(snapshot))
+    ]
+    snapshot["event_timestamp"] = event_timestamp or _snapshot_timestamp()
     ordered = [
         "channel_id",
         *FEATURE_COLUMNS,
@@ -26,3 +38,18 @@ def save_feature_snapshot(df: pd.DataFrame, output_path: Path) -> Path:
     snapshot = build_feature_snapshot(df)
     snapshot.to_csv(output_path, index=False)
     return output_path
+
+
+def save_feature_snapshot_streaming(chunks: Iterable[pd.DataFrame], output_path: Path) -> Path:
+    """Write the snapshot chunk by chunk; ids and the event timestamp match a single-frame run."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output_path.with_name(output_path.name + ".tmp")
+    event_timestamp = _snapshot_timestamp()
+    written = 0
+    with tmp.open("w", encoding="utf-8", newline="") as handle:
+        for chunk in chunks:
+            snapshot = build_feature_snapshot(chunk, written, event_timestamp)
+            snapshot.to_csv(handle, index=False, header=written == 0)
+            written += len(snapshot)
+    tmp.replace(output_path)
+    return output_path
@@ -8,11 +8,30 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
-from youtube_success_ml.config import ARTIFACT_DIR, MODEL_DIR, REPORT_DIR, TrainingConfig
+from youtube_success_ml import config as settings
+from youtube_success_ml.config import TrainingConfig
 
-MLOPS_DIR = ARTIFACT_DIR / "mlops"
-MANIFEST_PATH = MLOPS_DIR / "training_manifest.json"
-REGISTRY_PATH = MLOPS_DIR / "model_registry.json"
+MANIFEST_FILENAME = "training_manifest.json"
+REGISTRY_FILENAME = "model_registry.json"
+
+
+def default_manifest_path() -> Path:
+    return settings.ARTIFACT_DIR / "mlops" / MANIFEST_FILENAME
+
+
+def default_registry_path() -> Path:
+    return settings.ARTIFACT_DIR / "mlops" / REGISTRY_FILENAME
+
+
+def __getattr__(name: str) -> Path:
+    # MLOPS_DIR, MANIFEST_PATH and REGISTRY_PATH follow the lazily resolved artifact dir.
+    if name == "MLOPS_DIR":
+        return settings.ARTIFACT_DIR / "mlops"
+    if name == "MANIFEST_PATH":
+        return default_manifest_path()
+    if name == "REGISTRY_PATH":
+        return default_registry_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def utc_now_iso() -> str:
@@ -35,8 +54,8 @@ def file_sha256(path: Path) -> str:
 def expected_artifacts(
     model_dir: Path | None = None, report_dir: Path | None = None
 ) -> dict[str, Path]:
-    model_dir = model_dir or MODEL_DIR
-    report_dir = report_dir or REPORT_DIR
+    model_dir = model_dir or settings.MODEL_DIR
+    report_dir = report_dir or settings.REPORT_DIR
     return {
         "supervised_bundle": model_dir / "supervised_bundle.joblib",
         "clustering_bundle": model_dir / "clustering_bundle.joblib",
@@ -45,7 +64,7 @@ def expected_artifacts(
         "data_quality_report": report_dir / "data_quality_report.json",
         "training_baseline": report_dir / "training_baseline.json",
         "feature_store_snapshot": report_dir / "feature_store_snapshot.csv",
-        "training_manifest": MANIFEST_PATH,
+        "training_manifest": default_manifest_path(),
     }
 
 
@@ -70,8 +89,8 @@ def build_training_manifest(
     model_dir: Path | None = None,
     report_dir: Path | None = None,
 ) -> dict[str, Any]:
-    model_dir = model_dir or MODEL_DIR
-    report_dir = report_dir or REPORT_DIR
+    model_dir = model_dir or settings.MODEL_DIR
+    report_dir = report_dir or settings.REPORT_DIR
 
     artifact_paths = expected_artifacts(model_dir=model_dir, report_dir=report_dir)
     existing_paths = {k: v for k, v in artifact_paths.items() if v.exists()}
@@ -91,6 +110,7 @@ def build_training_manifest(
             "n_clusters": config.n_clusters,
             "dbscan_eps": config.dbscan_eps,
             "dbscan_min_samples": config.dbscan_min_samples,
+            "supervised_mode": config.supervised_mode,
         },
         "metrics": metrics,
         "artifact_hashes": {k: file_sha256(v) for k, v in existing_paths.items()},
@@ -98,13 +118,15 @@ def build_training_manifest(
     }
 
 
-def write_manifest(manifest: dict[str, Any], manifest_path: Path = MANIFEST_PATH) -> Path:
+def write_manifest(manifest: dict[str, Any], manifest_path: Path | None = None) -> Path:
+    manifest_path = manifest_path or default_manifest_path()
     manifest_path.parent.mkdir(parents=True, exist_ok=True)
     manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
     return manifest_path
 
 
-def update_registry(manifest: dict[str, Any], registry_path: Path = REGISTRY_PATH) -> Path:
+def update_registry(manifest: dict[str, Any], registry_path: Path | None = None) -> Path:
+    registry_path = registry_path or default_registry_path()
     registry_path.parent.mkdir(parents=True, exist_ok=True)
     if registry_path.exists():
         payload = json.loads(registry_path.read_text(encoding="utf-8"))
@@ -127,13 +149,15 @@ def update_registry(manifest: dict[str, Any], registry_path: Path = REGISTRY_PAT
     return registry_path
 
 
-def load_manifest(manifest_path: Path = MANIFEST_PATH) -> dict[str, Any] | None:
+def load_manifest(manifest_path: Path | None = None) -> dict[str, Any] | None:
+    manifest_path = manifest_path or default_manifest_path()
     if not manifest_path.exists():
         return None
     return json.loads(manifest_path.read_text(encoding="utf-8"))
 
 
-def load_registry(registry_path: Path = REGISTRY_PATH) -> dict[str, Any] | None:
+def load_registry(registry_path: Path | None = None) -> dict[str, Any] | None:
+    registry_path = registry_path or default_registry_path()
     if not registry_path.exists():
         return None
     return json.loads(registry_path.read_text(encoding="utf-8"))
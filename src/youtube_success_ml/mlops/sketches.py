@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def hash_values(values: pd.Series | pd.DataFrame) -> np.ndarray:
+    """Stable 64-bit hashes of values (or whole rows), independent of index and dtype levels."""
+    return pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Exact bit length of uint64 values (frexp is exact on the 32-bit halves)."""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+class HyperLogLog:
+    """Distinct-count sketch over 64-bit hashes using ``2**precision`` one-byte registers.
+
+    The relative standard error is ``1.04 / sqrt(2**precision)`` (0.81% at the default
+    precision of 14, i.e. 16 KiB of registers) regardless of how many values are added.
+    Until more than ``exact_limit`` distinct hashes have been seen they are also kept in
+    a set, so small inputs get exact counts and memory stays bounded either way.
+    """
+
+    def __init__(self, precision: int = 14, exact_limit: int = 4096) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18")
+        self.precision = precision
+        self.exact_limit = exact_limit
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+        self._exact: set[int] | None = set() if exact_limit > 0 else None
+
+    @property
+    def is_exact(self) -> bool:
+        return self._exact is not None
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of :meth:`estimate` (0 while counting exactly)."""
+        return 0.0 if self.is_exact else 1.04 / math.sqrt(len(self.registers))
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        if not len(hashes):
+            return
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if self._exact is not None:
+            self._exact.update(hashes.tolist())
+            if len(self._exact) > self.exact_limit:
+                self._exact = None
+        suffix_bits = 64 - self.precision
+        index = (hashes >> np.uint64(suffix_bits)).astype(np.intp)
+        suffix = hashes & np.uint64((1 << suffix_bits) - 1)
+        # Rank = position of the leftmost 1-bit in the suffix (suffix_bits + 1 when all zero).
+        rank = (suffix_bits + 1 - _bit_length(suffix)).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: HyperLogLog) -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches with different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        if self._exact is not None and other._exact is not None:
+            self._exact |= other._exact
+            if len(self._exact) > self.exact_limit:
+                self._exact = None
+        else:
+            self._exact = None
+
+    def estimate(self) -> float:
+        if self._exact is not None:
+            return float(len(self._exact))
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / float(np.ldexp(1.0, -self.registers.astype(np.int64)).sum())
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)
+        return raw
+
+
+class RunningMoments:
+    """Count, mean, variance (Welford/Chan), min and max merged one chunk at a time."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _merge(self, n_b: float, mean_b: float, m2_b: float) -> None:
+        # Chan et al. parallel combination of two (count, mean, M2) summaries.
+        n = self.count + n_b
+        delta = mean_b - self.mean
+        self.mean += delta * n_b / n
+        self.m2 += m2_b + delta**2 * self.count * n_b / n
+        self.count = n
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        mean_b = float(values.mean())
+        self._merge(len(values), mean_b, float(((values - mean_b) ** 2).sum()))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def update_counts(self, counts: pd.Series) -> None:
+        """Merge the multiset ``{value: count}`` without expanding it."""
+        counts = counts[counts > 0]
+        if counts.empty:
+            return
+        values = counts.index.to_numpy(dtype=np.float64)
+        weights = counts.to_numpy(dtype=np.float64)
+        n_b = float(weights.sum())
+        mean_b = float((values * weights).sum() / n_b)
+        self._merge(n_b, mean_b, float((weights * (values - mean_b) ** 2).sum()))
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (``ddof=1``, as ``DataFrame.describe``)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else math.nan
+
+    def summary(self) -> dict[str, float]:
+        if not self.count:
+            return {"mean": math.nan, "std": math.nan, "min": math.nan, "max": math.nan}
+        return {"mean": self.mean, "std": self.std, "min": self.min, "max": self.max}
+
+
+class KLLSketch:
+    """Mergeable KLL quantile sketch (Karnin, Lang & Liberty) over floats.
+
+    Items at level ``h`` stand for ``2**h`` inputs; a full level is sorted and every
+    other item is promoted. Rank error is roughly ``1.7 / k`` of ``n`` and the sketch
+    holds ``O(k)`` items however many values are added, so it serializes compactly.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0) -> None:
+        if k < 8:
+            raise ValueError("k must be >= 8")
+        self.k = k
+        self.n = 0
+        self.levels: list[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0, dtype=np.float64))
+                items = np.sort(items)
+                keep = items[-1:] if len(items) % 2 else items[:0]
+                pairs = items[: len(items) - len(keep)]
+                promoted = pairs[int(self._rng.integers(2)) :: 2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other: KLLSketch) -> None:
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+
+    def _weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        values = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(items), 2.0**level) for level, items in enumerate(self.levels)]
+        )
+        order = np.argsort(values, kind="stable")
+        return values[order], np.cumsum(weights[order])
+
+    def quantile(self, q: float | np.ndarray) -> np.ndarray:
+        values, cumulative = self._weighted_items()
+        if not len(values):
+            return np.full(np.shape(q), np.nan)
+        targets = np.asarray(q, dtype=np.float64) * cumulative[-1]
+        index = np.minimum(np.searchsorted(cumulative, targets, side="left"), len(values) - 1)
+        return values[index]
+
+    def cdf(self, x: float | np.ndarray, strict: bool = False) -> np.ndarray:
+        """Estimated fraction of inputs ``<= x`` (``< x`` when ``strict``)."""
+        values, cumulative = self._weighted_items()
+        if not len(values):
+            return np.full(np.shape(x), np.nan)
+        side = "left" if strict else "right"
+        index = np.searchsorted(values, np.asarray(x, dtype=np.float64), side=side)
+        below = np.where(index > 0, cumulative[np.maximum(index - 1, 0)], 0.0)
+        return below / cumulative[-1]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"k": self.k, "n": self.n, "levels": [items.tolist() for items in self.levels]}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> KLLSketch:
+        sketch = cls(k=int(data["k"]))
+        sketch.n = int(data["n"])
+        sketch.levels = [np.asarray(items, dtype=np.float64) for items in data["levels"]]
+        return sketch
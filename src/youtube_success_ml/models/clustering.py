@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -18,10 +18,57 @@ CLUSTER_FEATURES = ["uploads", "subscribers", "highest_yearly_earnings", "growth
 
 @dataclass
 class ClusteringBundle:
+    """Fitted clustering pipelines plus K-Means centroids folded into raw feature space.
+
+    ``raw_centroids`` and ``feature_weights`` are derived from ``kmeans_pipeline`` by
+    ``fold_kmeans_centroids``; bundles pickled before they existed are folded on load.
+    """
+
     kmeans_pipeline: Pipeline
     dbscan_pipeline: Pipeline
     cluster_profiles: list[dict[str, Any]]
     cluster_name_map: dict[int, str]
+    raw_centroids: np.ndarray | None = field(default=None, repr=False)
+    feature_weights: np.ndarray | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.raw_centroids is None or self.feature_weights is None:
+            self.raw_centroids, self.feature_weights = fold_kmeans_centroids(self.kmeans_pipeline)
+
+
+# Rows per distance block in ``assign_kmeans_clusters``; bounds temporary memory.
+_ASSIGN_BLOCK = 262_144
+
+
+def fold_kmeans_centroids(kmeans_pipeline: Pipeline) -> tuple[np.ndarray, np.ndarray]:
+    """Map scaled K-Means centroids back to raw units with per-feature distance weights.
+
+    With ``z = (x - mean) / scale``, ``||z - c||^2 == sum(w * (x - r)^2)`` where
+    ``r = mean + c * scale`` and ``w = 1 / scale^2``, so the nearest raw centroid under
+    ``w`` is exactly the pipeline's prediction without scaling each input row.
+    """
+    scaler = kmeans_pipeline.named_steps["scaler"]
+    kmeans = kmeans_pipeline.named_steps["cluster"]
+    n_features = kmeans.cluster_centers_.shape[1]
+    mean = scaler.mean_ if scaler.with_mean else np.zeros(n_features)
+    scale = scaler.scale_ if scaler.with_std else np.ones(n_features)
+    raw_centroids = mean + kmeans.cluster_centers_ * scale
+    return raw_centroids, 1.0 / np.square(scale)
+
+
+def assign_kmeans_clusters(bundle: ClusteringBundle, X: np.ndarray) -> np.ndarray:
+    """Nearest folded centroid for each row of ``X`` (columns ordered as ``CLUSTER_FEATURES``)."""
+    X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+    centroids, weights = bundle.raw_centroids, bundle.feature_weights
+    # ||x - r||_w^2 = ||x||_w^2 - 2 x.w.r + ||r||_w^2; the first term is constant per row.
+    weighted_centroids = (centroids * weights).T
+    centroid_norms = np.square(centroids) @ weights
+    labels = np.empty(X.shape[0], dtype=np.int64)
+    for start in range(0, X.shape[0], _ASSIGN_BLOCK):
+        block = X[start : start + _ASSIGN_BLOCK]
+        scores = centroid_norms - 2.0 * (block @ weighted_centroids)
+        labels[start : start + _ASSIGN_BLOCK] = scores.argmin(axis=1)
+    return labels
 
 
 def _build_cluster_profiles(
@@ -139,7 +186,19 @@ def train_clustering_bundle(
 
 def load_clustering_bundle(model_dir: Path | None = None) -> ClusteringBundle:
     model_dir = model_dir or MODEL_DIR
-    return joblib.load(model_dir / "clustering_bundle.joblib")
+    bundle = joblib.load(model_dir / "clustering_bundle.joblib")
+    # Unpickling skips __post_init__; fold centroids for bundles saved without them.
+    if getattr(bundle, "raw_centroids", None) is None or bundle.feature_weights is None:
+        bundle.raw_centroids, bundle.feature_weights = fold_kmeans_centroids(bundle.kmeans_pipeline)
+    return bundle
+
+
+def cluster_archetypes(bundle: ClusteringBundle, cluster_ids: np.ndarray) -> list[str]:
+    names = np.array(
+        [bundle.cluster_name_map.get(c, f"Cluster {c}") for c in range(len(bundle.raw_centroids))],
+        dtype=object,
+    )
+    return names[cluster_ids].tolist()
 
 
 def predict_kmeans_cluster(
@@ -149,16 +208,13 @@ def predict_kmeans_cluster(
     earnings: float,
     growth: float,
 ) -> tuple[int, str]:
-    X = pd.DataFrame(
-        [
-            {
-                "uploads": uploads,
-                "subscribers": subscribers,
-                "highest_yearly_earnings": earnings,
-                "growth_target": growth,
-            }
-        ]
-    )
-    cluster = int(bundle.kmeans_pipeline.predict(X)[0])
-    archetype = bundle.cluster_name_map.get(cluster, f"Cluster {cluster}")
-    return cluster, archetype
+    labels = assign_kmeans_clusters(bundle, [[uploads, subscribers, earnings, growth]])
+    return int(labels[0]), cluster_archetypes(bundle, labels)[0]
+
+
+def predict_kmeans_clusters(
+    bundle: ClusteringBundle, frame: pd.DataFrame
+) -> tuple[np.ndarray, list[str]]:
+    """Vectorized ``predict_kmeans_cluster`` over a frame holding ``CLUSTER_FEATURES``."""
+    clusters = assign_kmeans_clusters(bundle, frame[CLUSTER_FEATURES].to_numpy(dtype=np.float64))
+    return clusters, cluster_archetypes(bundle, clusters)
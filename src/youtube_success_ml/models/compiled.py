@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from youtube_success_ml.models.supervised import TARGET_COLUMNS, SupervisedBundle, forest_outputs
+
+NUMERIC_FEATURES = ["uploads", "age"]
+CATEGORICAL_FEATURES = ["category", "country"]
+TARGET_KEYS = list(TARGET_COLUMNS)
+
+# Rows traversed per block; bounds the (rows x trees) node-index matrix.
+_ROW_BLOCK = 2048
+
+
+@dataclass(frozen=True)
+class CompiledEncoder:
+    """Pandas-free replica of the fitted ColumnTransformer."""
+
+    numeric_fill: np.ndarray
+    categorical_fill: tuple[str, ...]
+    category_codes: tuple[dict[str, int], ...]
+    n_features: int
+
+    def encode_columns(
+        self,
+        uploads: Sequence[float] | np.ndarray,
+        age: Sequence[float] | np.ndarray,
+        category: Sequence[Any],
+        country: Sequence[Any],
+    ) -> np.ndarray:
+        numeric = np.column_stack(
+            [np.asarray(uploads, dtype=np.float64), np.asarray(age, dtype=np.float64)]
+        )
+        n_rows = numeric.shape[0]
+        missing = np.isnan(numeric)
+        if missing.any():
+            numeric = np.where(missing, self.numeric_fill, numeric)
+
+        # Trees compare float32 inputs against float64 thresholds, like sklearn does.
+        X = np.zeros((n_rows, self.n_features), dtype=np.float32)
+        X[:, : len(NUMERIC_FEATURES)] = numeric
+        rows = np.arange(n_rows)
+        for values, codes, fill in zip(
+            (category, country), self.category_codes, self.categorical_fill, strict=True
+        ):
+            column = np.fromiter(
+                (codes.get(_categorical_value(value, fill), -1) for value in values),
+                dtype=np.int64,
+                count=n_rows,
+            )
+            known = column >= 0
+            X[rows[known], column[known]] = 1.0
+        return X
+
+    def encode_rows(self, payloads: Sequence[dict[str, Any]]) -> np.ndarray:
+        return self.encode_columns(
+            uploads=[_numeric_value(p.get("uploads")) for p in payloads],
+            age=[_numeric_value(p.get("age")) for p in payloads],
+            category=[p.get("category") for p in payloads],
+            country=[p.get("country") for p in payloads],
+        )
+
+
+@dataclass(frozen=True)
+class CompiledForest:
+    """Flattened node tables for one or more stacked tree ensembles.
+
+    Leaves point at themselves, so a (row, tree) pair that reaches a leaf can
+    be dropped from the traversal without further bookkeeping.
+    """
+
+    feature: np.ndarray
+    threshold: np.ndarray
+    children: np.ndarray
+    value: np.ndarray
+    roots: np.ndarray
+    max_depth: int
+    trees_per_output: np.ndarray
+    is_leaf: np.ndarray
+
+    @property
+    def n_trees(self) -> int:
+        return int(self.roots.shape[0])
+
+    @property
+    def n_nodes(self) -> int:
+        return int(self.feature.shape[0])
+
+    def leaf_indices(self, X: np.ndarray) -> np.ndarray:
+        n_rows, n_features = X.shape
+        flat_x = X.reshape(-1)
+        nodes = np.tile(self.roots, n_rows)
+        offsets = np.repeat(np.arange(n_rows, dtype=np.intp) * n_features, self.n_trees)
+        active = np.arange(nodes.shape[0])
+        current = nodes.copy()
+
+        # Advance only the (row, tree) pairs still on internal nodes; ``children``
+        # interleaves (right, left) so the comparison result indexes the branch.
+        for _ in range(self.max_depth):
+            go_left = flat_x[offsets + self.feature[current]] <= self.threshold[current]
+            current = self.children[2 * current + go_left]
+            done = self.is_leaf[current]
+            if done.any():
+                nodes[active[done]] = current[done]
+                keep = ~done
+                active, current, offsets = active[keep], current[keep], offsets[keep]
+                if active.shape[0] == 0:
+                    break
+        return nodes.reshape(n_rows, self.n_trees)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        out = np.empty((X.shape[0], self.value.shape[1]), dtype=np.float64)
+        for start in range(0, X.shape[0], _ROW_BLOCK):
+            block = X[start : start + _ROW_BLOCK]
+            leaves = self.leaf_indices(block)
+            out[start : start + _ROW_BLOCK] = self.value[leaves].sum(axis=1)
+        return out / self.trees_per_output
+
+
+@dataclass(frozen=True)
+class CompiledSupervisedModel:
+    encoder: CompiledEncoder
+    forest: CompiledForest
+    targets: tuple[str, ...]
+
+    def predict_encoded(self, X: np.ndarray) -> dict[str, np.ndarray]:
+        raw = np.expm1(self.forest.predict(X))
+        clipped = np.clip(raw, a_min=0, a_max=None)
+        return {key: clipped[:, i] for i, key in enumerate(self.targets)}
+
+    def predict_columns(
+        self,
+        uploads: Sequence[float] | np.ndarray,
+        age: Sequence[float] | np.ndarray,
+        category: Sequence[Any],
+        country: Sequence[Any],
+    ) -> dict[str, np.ndarray]:
+        X = self.encoder.encode_columns(uploads, age, category, country)
+        return self.predict_encoded(X)
+
+
+def _numeric_value(value: Any) -> float:
+    return float("nan") if value is None else float(value)
+
+
+def _categorical_value(value: Any, fill: str) -> str:
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return fill
+    return str(value)
+
+
+def _compile_encoder(preprocessor: Any) -> CompiledEncoder:
+    transformers = {name: (pipe, cols) for name, pipe, cols in preprocessor.transformers_}
+    numeric_pipe, numeric_cols = transformers["numeric"]
+    categorical_pipe, categorical_cols = transformers["categorical"]
+    if list(numeric_cols) != NUMERIC_FEATURES or list(categorical_cols) != CATEGORICAL_FEATURES:
+        raise ValueError("Unsupported preprocessor layout for compiled inference")
+
+    numeric_imputer = numeric_pipe.named_steps["imputer"]
+    categorical_imputer = categorical_pipe.named_steps["imputer"]
+    ohe = categorical_pipe.named_steps["ohe"]
+    if ohe.drop_idx_ is not None or getattr(ohe, "infrequent_categories_", None):
+        raise ValueError("Compiled inference does not support dropped/infrequent categories")
+
+    offset = len(NUMERIC_FEATURES)
+    category_codes: list[dict[str, int]] = []
+    for categories in ohe.categories_:
+        category_codes.append({str(c): offset + i for i, c in enumerate(categories)})
+        offset += len(categories)
+
+    return CompiledEncoder(
+        numeric_fill=np.asarray(numeric_imputer.statistics_, dtype=np.float64),
+        categorical_fill=tuple(str(v) for v in categorical_imputer.statistics_),
+        category_codes=tuple(category_codes),
+        n_features=offset,
+    )
+
+
+def _compile_forests(forests: list[tuple[Any, list[int]]], n_outputs: int) -> CompiledForest:
+    """Stack fitted forests into one node table.
+
+    Each entry pairs a fitted ``RandomForestRegressor`` with the output slots
+    its trees write to, so three single-target forests and one multi-output
+    forest both traverse as a single ensemble.
+    """
+    features, thresholds, lefts, rights, values, roots, leaves = [], [], [], [], [], [], []
+    trees_per_output = np.zeros(n_outputs, dtype=np.float64)
+    offset = 0
+    max_depth = 0
+    for forest, slots in forests:
+        trees_per_output[slots] += len(forest.estimators_)
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            node_ids = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+
+            leaves.append(is_leaf)
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.intp))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left) + offset)
+            rights.append(np.where(is_leaf, node_ids, tree.children_right) + offset)
+
+            node_values = np.zeros((tree.node_count, n_outputs), dtype=np.float64)
+            node_values[:, slots] = tree.value[:, :, 0]
+            values.append(node_values)
+
+            roots.append(offset)
+            offset += tree.node_count
+            max_depth = max(max_depth, int(tree.max_depth))
+
+    return CompiledForest(
+        feature=np.concatenate(features),
+        threshold=np.concatenate(thresholds).astype(np.float64),
+        children=np.column_stack([np.concatenate(rights), np.concatenate(lefts)])
+        .astype(np.intp)
+        .reshape(-1),
+        value=np.concatenate(values),
+        roots=np.asarray(roots, dtype=np.intp),
+        max_depth=max_depth,
+        trees_per_output=trees_per_output,
+        is_leaf=np.concatenate(leaves),
+    )
+
+
+def compile_supervised_bundle(bundle: SupervisedBundle) -> CompiledSupervisedModel:
+    """Flatten the bundle's forests into contiguous NumPy node tables."""
+    return CompiledSupervisedModel(
+        encoder=_compile_encoder(bundle.preprocessor),
+        forest=_compile_forests(forest_outputs(bundle), n_outputs=len(TARGET_KEYS)),
+        targets=tuple(TARGET_KEYS),
+    )
+
+
+def _to_records(predictions: dict[str, np.ndarray]) -> list[dict[str, float]]:
+    return [
+        {
+            "predicted_subscribers": float(s),
+            "predicted_earnings": float(e),
+            "predicted_growth": float(g),
+        }
+        for s, e, g in zip(
+            predictions["subscribers"], predictions["earnings"], predictions["growth"], strict=True
+        )
+    ]
+
+
+def predict_compiled(model: CompiledSupervisedModel, payload: dict[str, Any]) -> dict[str, float]:
+    return batch_predict_compiled(model, [payload])[0]
+
+
+def batch_predict_compiled(
+    model: CompiledSupervisedModel, payloads: list[dict[str, Any]]
+) -> list[dict[str, float]]:
+    X = model.encoder.encode_rows(payloads)
+    return _to_records(model.predict_encoded(X))
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import numpy as np
+
+from youtube_success_ml.models.supervised import SupervisedBundle, forest_outputs
+
+UPLOADS_FEATURE = "numeric__uploads"
+
+
+def uploads_breakpoints(bundle: SupervisedBundle) -> np.ndarray:
+    """Sorted unique split thresholds on ``uploads`` across every forest in the bundle.
+
+    With all other features fixed, every tree is constant between consecutive
+    thresholds, so the ensemble prediction is piecewise-constant in ``uploads``.
+    """
+    feature_names = bundle.preprocessor.get_feature_names_out().tolist()
+    column = feature_names.index(UPLOADS_FEATURE)
+    thresholds = [
+        estimator.tree_.threshold[estimator.tree_.feature == column]
+        for forest, _ in forest_outputs(bundle)
+        for estimator in forest.estimators_
+    ]
+    return np.unique(np.concatenate(thresholds)) if thresholds else np.empty(0)
+
+
+def segment_grid(grid: np.ndarray, breakpoints: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Split an ascending ``uploads`` grid into constant-prediction segments.
+
+    Trees route ``x <= threshold`` left, so two values see the same path in every
+    tree exactly when the same number of thresholds lies strictly below them.
+    Inputs are compared as float32 by sklearn, which is exact for the integer
+    upload range accepted by the API.
+
+    Returns the grid index of the first point of each segment and, for every
+    grid point, the index of its segment.
+    """
+    segment_ids = np.searchsorted(breakpoints, grid.astype(np.float32), side="left")
+    first_index = np.flatnonzero(np.diff(segment_ids, prepend=-1))
+    point_segment = np.cumsum(np.diff(segment_ids, prepend=-1) != 0) - 1
+    return first_index, point_segment
+
+
+def downsample_indices(n_points: int, max_points: int | None) -> np.ndarray:
+    """Evenly spaced indices (always keeping both ends) when a grid exceeds ``max_points``."""
+    if max_points is None or n_points <= max_points:
+        return np.arange(n_points)
+    return np.unique(np.linspace(0, n_points - 1, num=max_points).round().astype(np.int64))
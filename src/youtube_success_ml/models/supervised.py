@@ -23,13 +23,28 @@ TARGET_COLUMNS = {
     "earnings": "highest_yearly_earnings",
     "growth": "growth_target",
 }
+SUPERVISED_MODES = ("per_target", "multi_output")
+# Model key of the single forest in "multi_output" bundles; outputs follow TARGET_COLUMNS order.
+MULTI_OUTPUT_KEY = "multi_output"
 
 
 @dataclass
 class SupervisedBundle:
+    """Fitted supervised models.
+
+    ``preprocessor`` is the single fitted ``ColumnTransformer`` shared by every
+    target. In ``per_target`` mode ``models`` maps each target to a forest
+    fitted on the log1p-transformed target; in ``multi_output`` mode it holds
+    one multi-output forest under ``MULTI_OUTPUT_KEY``. Bundles written before
+    the shared layout carry one ``TransformedTargetRegressor`` per target and
+    ``preprocessor=None``; ``load_supervised_bundle`` upgrades them in memory.
+    """
+
     models: dict[str, Any]
     metrics: dict[str, dict[str, float]]
     metadata: dict[str, Any]
+    preprocessor: Any | None = None
+    mode: str = "per_target"
 
 
 def _build_base_pipeline(config: TrainingConfig) -> Pipeline:
@@ -84,14 +99,49 @@ def _evaluate(y_true: np.ndarray, y_pred: np.ndarray) -> dict[str, float]:
     }
 
 
-def train_supervised_bundle(
-    df: pd.DataFrame,
-    config: TrainingConfig,
-    model_dir: Path | None = None,
-) -> SupervisedBundle:
-    model_dir = model_dir or MODEL_DIR
-    model_dir.mkdir(parents=True, exist_ok=True)
-
+def _preprocessor_state(preprocessor: ColumnTransformer) -> list[tuple[str, list[str], Any]]:
+    state: list[tuple[str, list[str], Any]] = []
+    for name, pipeline, columns in preprocessor.transformers_:
+        if name == "remainder":
+            continue
+        steps = []
+        for step in pipeline.named_steps.values():
+            if hasattr(step, "statistics_"):
+                steps.append(step.statistics_.tolist())
+            if hasattr(step, "categories_"):
+                steps.append([c.tolist() for c in step.categories_])
+        state.append((name, list(columns), steps))
+    return state
+
+
+def shared_preprocessor(regressors: dict[str, TransformedTargetRegressor]) -> ColumnTransformer:
+    """Return the preprocessor fitted for every target, checking they are identical."""
+    preprocessors = {
+        key: regressor.regressor_.named_steps["preprocessor"]
+        for key, regressor in regressors.items()
+    }
+    reference_key, reference = next(iter(preprocessors.items()))
+    reference_state = _preprocessor_state(reference)
+    for key, preprocessor in preprocessors.items():
+        if _preprocessor_state(preprocessor) != reference_state:
+            raise ValueError(
+                f"Preprocessor fitted for '{key}' differs from '{reference_key}'; "
+                "targets cannot share one encoding pass"
+            )
+    return reference
+
+
+def _to_shared_layout(
+    regressors: dict[str, TransformedTargetRegressor],
+) -> tuple[ColumnTransformer, dict[str, RandomForestRegressor]]:
+    preprocessor = shared_preprocessor(regressors)
+    forests = {key: reg.regressor_.named_steps["model"] for key, reg in regressors.items()}
+    return preprocessor, forests
+
+
+def _fit_per_target(
+    df: pd.DataFrame, config: TrainingConfig, refit: bool = True
+) -> tuple[ColumnTransformer, dict[str, Any], dict[str, dict[str, float]]]:
     X = df[FEATURE_COLUMNS].copy()
     models: dict[str, Any] = {}
     metrics: dict[str, dict[str, float]] = {}
@@ -119,34 +169,132 @@ def train_supervised_bundle(
         metrics[key] = _evaluate(y_test, pred)
 
         # Refit on all available rows for deployment.
-        regressor.fit(X, y)
+        if refit:
+            regressor.fit(X, y)
         models[key] = regressor
 
+    preprocessor, forests = _to_shared_layout(models)
+    return preprocessor, forests, metrics
+
+
+def _fit_multi_output(
+    df: pd.DataFrame, config: TrainingConfig, refit: bool = True
+) -> tuple[ColumnTransformer, dict[str, Any], dict[str, dict[str, float]]]:
+    X = df[FEATURE_COLUMNS].copy()
+    Y = df[list(TARGET_COLUMNS.values())].to_numpy(dtype=float)
+
+    # Same split parameters as the per-target mode so holdout metrics are comparable.
+    X_train, X_test, Y_train, Y_test = train_test_split(
+        X,
+        Y,
+        test_size=config.test_size,
+        random_state=config.random_state,
+    )
+
+    pipeline = _build_base_pipeline(config)
+    pipeline.fit(X_train, np.log1p(Y_train))
+    pred = np.clip(np.expm1(pipeline.predict(X_test)), a_min=0, a_max=None)
+    metrics = {key: _evaluate(Y_test[:, i], pred[:, i]) for i, key in enumerate(TARGET_COLUMNS)}
+
+    # Refit on all available rows for deployment.
+    if refit:
+        pipeline.fit(X, np.log1p(Y))
+    forests = {MULTI_OUTPUT_KEY: pipeline.named_steps["model"]}
+    return pipeline.named_steps["preprocessor"], forests, metrics
+
+
+def _fit_supervised(
+    df: pd.DataFrame, config: TrainingConfig, mode: str, refit: bool = True
+) -> tuple[ColumnTransformer, dict[str, Any], dict[str, dict[str, float]]]:
+    """Holdout metrics plus forests; ``refit=False`` keeps the training-split fit."""
+    if mode not in SUPERVISED_MODES:
+        raise ValueError(f"Unknown supervised mode '{mode}'. Allowed: {list(SUPERVISED_MODES)}")
+    if mode == "multi_output":
+        return _fit_multi_output(df, config, refit=refit)
+    return _fit_per_target(df, config, refit=refit)
+
+
+def _ensemble_size(forests: dict[str, Any]) -> dict[str, int]:
+    estimators = [tree for forest in forests.values() for tree in forest.estimators_]
+    return {
+        "n_trees": len(estimators),
+        "n_nodes": int(sum(tree.tree_.node_count for tree in estimators)),
+    }
+
+
+def evaluate_supervised_mode(df: pd.DataFrame, config: TrainingConfig, mode: str) -> dict[str, Any]:
+    """Holdout metrics and ensemble size for one supervised mode, without persisting it.
+
+    Only the training split is fitted; the ensemble size is that of the holdout model.
+    """
+    _, forests, metrics = _fit_supervised(df, config, mode, refit=False)
+    return {"metrics": metrics, **_ensemble_size(forests)}
+
+
+def train_supervised_bundle(
+    df: pd.DataFrame,
+    config: TrainingConfig,
+    model_dir: Path | None = None,
+) -> SupervisedBundle:
+    model_dir = model_dir or MODEL_DIR
+    model_dir.mkdir(parents=True, exist_ok=True)
+
+    preprocessor, forests, metrics = _fit_supervised(df, config, config.supervised_mode)
+
     metadata = {
         "feature_columns": FEATURE_COLUMNS,
         "categories": sorted(df["category"].dropna().unique().tolist()),
         "countries": sorted(df["country"].dropna().unique().tolist()),
+        **_ensemble_size(forests),
     }
 
-    bundle = SupervisedBundle(models=models, metrics=metrics, metadata=metadata)
+    bundle = SupervisedBundle(
+        models=forests,
+        metrics=metrics,
+        metadata=metadata,
+        preprocessor=preprocessor,
+        mode=config.supervised_mode,
+    )
     joblib.dump(bundle, model_dir / "supervised_bundle.joblib")
     return bundle
 
 
 def load_supervised_bundle(model_dir: Path | None = None) -> SupervisedBundle:
     model_dir = model_dir or MODEL_DIR
-    return joblib.load(model_dir / "supervised_bundle.joblib")
+    bundle = joblib.load(model_dir / "supervised_bundle.joblib")
+    if getattr(bundle, "preprocessor", None) is None:
+        bundle.preprocessor, bundle.models = _to_shared_layout(bundle.models)
+    return bundle
+
+
+def forest_outputs(bundle: SupervisedBundle) -> list[tuple[RandomForestRegressor, list[int]]]:
+    """Pair each fitted forest with the ``TARGET_COLUMNS`` positions it predicts."""
+    if bundle.mode == "multi_output":
+        return [(bundle.models[MULTI_OUTPUT_KEY], list(range(len(TARGET_COLUMNS))))]
+    return [(bundle.models[key], [slot]) for slot, key in enumerate(TARGET_COLUMNS)]
+
+
+def predict_encoded(bundle: SupervisedBundle, encoded: Any) -> dict[str, np.ndarray]:
+    """Score an already-encoded feature matrix with every target forest."""
+    log_preds = np.empty((encoded.shape[0], len(TARGET_COLUMNS)), dtype=float)
+    for forest, slots in forest_outputs(bundle):
+        log_preds[:, slots] = forest.predict(encoded).reshape(encoded.shape[0], len(slots))
+    preds = np.clip(np.expm1(log_preds), a_min=0, a_max=None)
+    return {key: preds[:, i] for i, key in enumerate(TARGET_COLUMNS)}
+
+
+def predict_frame(bundle: SupervisedBundle, X: pd.DataFrame) -> dict[str, np.ndarray]:
+    """Encode ``X`` once and feed the shared matrix to all target forests."""
+    return predict_encoded(bundle, bundle.preprocessor.transform(X[FEATURE_COLUMNS]))
 
 
 def predict_from_bundle(bundle: SupervisedBundle, payload: dict[str, Any]) -> dict[str, float]:
     X = pd.DataFrame([payload], columns=FEATURE_COLUMNS)
-    subs = float(bundle.models["subscribers"].predict(X)[0])
-    earn = float(bundle.models["earnings"].predict(X)[0])
-    growth = float(bundle.models["growth"].predict(X)[0])
+    preds = predict_frame(bundle, X)
     return {
-        "predicted_subscribers": max(subs, 0.0),
-        "predicted_earnings": max(earn, 0.0),
-        "predicted_growth": max(growth, 0.0),
+        "predicted_subscribers": float(preds["subscribers"][0]),
+        "predicted_earnings": float(preds["earnings"][0]),
+        "predicted_growth": float(preds["growth"][0]),
     }
 
 
@@ -154,9 +302,8 @@ def batch_predict_from_bundle(
     bundle: SupervisedBundle, payloads: list[dict[str, Any]]
 ) -> list[dict[str, float]]:
     X = pd.DataFrame(payloads, columns=FEATURE_COLUMNS)
-    subs = np.clip(bundle.models["subscribers"].predict(X), a_min=0, a_max=None)
-    earn = np.clip(bundle.models["earnings"].predict(X), a_min=0, a_max=None)
-    growth = np.clip(bundle.models["growth"].predict(X), a_min=0, a_max=None)
+    preds = predict_frame(bundle, X)
+    subs, earn, growth = preds["subscribers"], preds["earnings"], preds["growth"]
 
     return [
         {
@@ -176,13 +323,10 @@ def top_feature_importance(
     if target not in TARGET_COLUMNS:
         raise ValueError(f"Unknown target '{target}'. Allowed: {sorted(TARGET_COLUMNS)}")
 
-    transformed = bundle.models[target]
-    pipeline = transformed.regressor_
-    preprocessor = pipeline.named_steps["preprocessor"]
-    model = pipeline.named_steps["model"]
-
-    feature_names = preprocessor.get_feature_names_out().tolist()
-    importances = model.feature_importances_
+    feature_names = bundle.preprocessor.get_feature_names_out().tolist()
+    # A multi-output forest shares its splits across targets, so importances are shared too.
+    model_key = MULTI_OUTPUT_KEY if bundle.mode == "multi_output" else target
+    importances = bundle.models[model_key].feature_importances_
 
     rows = [
         {"feature": str(name), "importance": float(value)}
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from typing import Literal
+from collections.abc import Mapping, Sequence
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, ValidationInfo, field_validator
+import numpy as np
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
 
 
 class PredictionRequest(BaseModel):
@@ -39,6 +41,88 @@ class BatchPredictionResponse(BaseModel):
     summary: BatchPredictionSummary
 
 
+def _check_int_range(name: str, values: Sequence[int] | np.ndarray, upper: int) -> None:
+    if isinstance(values, np.ndarray):
+        if not np.issubdtype(values.dtype, np.integer):
+            raise ValueError(f"{name} must be an integer array")
+        low, high = (values.min(), values.max()) if values.size else (0, 0)
+    else:
+        low, high = min(values), max(values)
+    if low < 0 or high > upper:
+        raise ValueError(f"{name} values must be between 0 and {upper}")
+
+
+def _normalize_texts(name: str, values: Sequence[Any]) -> list[str]:
+    if not all(isinstance(value, str) for value in values):
+        raise ValueError(f"{name} must be an array of strings")
+    lengths = [len(value) for value in values]
+    if min(lengths) < 1 or max(lengths) > 100:
+        raise ValueError(f"{name} values must be between 1 and 100 characters")
+    return [value.strip() for value in values]
+
+
+class ColumnarPredictionRequest(BaseModel):
+    """A batch as one equal-length array per feature, checked array-wise rather than per row."""
+
+    uploads: list[int] = Field(..., min_length=1, max_length=500)
+    category: list[str] = Field(..., min_length=1, max_length=500)
+    country: list[str] = Field(..., min_length=1, max_length=500)
+    age: list[int] = Field(..., min_length=1, max_length=500)
+
+    @field_validator("uploads", "age")
+    @classmethod
+    def check_bounds(cls, values: list[int], info: ValidationInfo) -> list[int]:
+        _check_int_range(
+            info.field_name, values, 2_000_000 if info.field_name == "uploads" else 100
+        )
+        return values
+
+    @field_validator("category", "country")
+    @classmethod
+    def normalize_text(cls, values: list[str], info: ValidationInfo) -> list[str]:
+        return _normalize_texts(info.field_name, values)
+
+    @model_validator(mode="after")
+    def check_lengths(self) -> ColumnarPredictionRequest:
+        if not len(self.uploads) == len(self.category) == len(self.country) == len(self.age):
+            raise ValueError("uploads, category, country and age must have equal lengths")
+        return self
+
+    @classmethod
+    def from_arrays(cls, columns: Mapping[str, Any]) -> ColumnarPredictionRequest:
+        """Apply the same checks to decoded columns (e.g. from Arrow), keeping NumPy arrays.
+
+        Raises ``ValueError`` rather than ``ValidationError``; numeric columns must be
+        integer arrays and are not copied into lists.
+        """
+        missing = [
+            name for name in ("uploads", "category", "country", "age") if name not in columns
+        ]
+        if missing:
+            raise ValueError(f"missing columns: {', '.join(missing)}")
+        lengths = {len(columns[name]) for name in ("uploads", "category", "country", "age")}
+        if len(lengths) != 1:
+            raise ValueError("uploads, category, country and age must have equal lengths")
+        if not 1 <= lengths.pop() <= 500:
+            raise ValueError("columns must hold between 1 and 500 rows")
+        uploads, age = np.asarray(columns["uploads"]), np.asarray(columns["age"])
+        _check_int_range("uploads", uploads, 2_000_000)
+        _check_int_range("age", age, 100)
+        return cls.model_construct(
+            uploads=uploads,
+            category=_normalize_texts("category", columns["category"]),
+            country=_normalize_texts("country", columns["country"]),
+            age=age,
+        )
+
+
+class ColumnarPredictionResponse(BaseModel):
+    predicted_subscribers: list[float]
+    predicted_earnings: list[float]
+    predicted_growth: list[float]
+    summary: BatchPredictionSummary
+
+
 class SimulationRequest(BaseModel):
     category: str = Field(..., min_length=1, max_length=100)
     country: str = Field(..., min_length=1, max_length=100)
@@ -46,6 +130,8 @@ class SimulationRequest(BaseModel):
     start_uploads: int = Field(..., ge=0, le=2_000_000)
     end_uploads: int = Field(..., ge=0, le=2_000_000)
     step: int = Field(..., ge=1, le=200_000)
+    # Optional cap on returned points; best_uploads_* are still computed over the full grid.
+    max_points: int | None = Field(default=None, ge=2, le=200_000)
 
     @field_validator("category", "country")
     @classmethod
@@ -84,6 +170,16 @@ class RecommendationResponse(BaseModel):
     recommendations: list[str]
 
 
+class BatchRecommendationSummary(BaseModel):
+    count: int
+    risk_level_counts: dict[Literal["low", "medium", "high"], int]
+
+
+class BatchRecommendationResponse(BaseModel):
+    records: list[RecommendationResponse]
+    summary: BatchRecommendationSummary
+
+
 class FeatureImportanceRecord(BaseModel):
     feature: str
     importance: float
@@ -112,9 +208,17 @@ class DriftSummary(BaseModel):
     is_drift_risk: bool
 
 
+class FeatureDistributionDrift(BaseModel):
+    psi: float
+    ks: float | None = None
+    ks_critical: float | None = None
+    drifted: bool
+
+
 class DriftCheckResponse(BaseModel):
     summary: DriftSummary
     records: list[DriftRecord]
+    distribution: dict[str, FeatureDistributionDrift] | None = None
 
 
 class HealthResponse(BaseModel):
@@ -132,6 +236,26 @@ class ClusterSummaryRecord(BaseModel):
     dominant_category: str
 
 
+class ClusterAssignItem(BaseModel):
+    uploads: float = Field(..., ge=0)
+    subscribers: float = Field(..., ge=0)
+    earnings: float = Field(..., ge=0)
+    growth: float
+
+
+class ClusterAssignRequest(BaseModel):
+    items: list[ClusterAssignItem] = Field(..., min_length=1, max_length=10_000)
+
+
+class ClusterAssignRecord(BaseModel):
+    cluster_id: int
+    archetype: str
+
+
+class ClusterAssignResponse(BaseModel):
+    records: list[ClusterAssignRecord]
+
+
 class CountryMetricRecord(BaseModel):
     country: str
     abbreviation: str
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import time
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from youtube_success_ml.config import INFERENCE_ENGINE, INFERENCE_ENGINES, MODEL_DIR
+from youtube_success_ml.data.loader import SOURCE_ENCODING
+from youtube_success_ml.logging_utils import configure_logging
+from youtube_success_ml.mlops.registry import expected_artifacts, file_sha256
+from youtube_success_ml.models.clustering import (
+    ClusteringBundle,
+    load_clustering_bundle,
+    predict_kmeans_clusters,
+)
+from youtube_success_ml.models.compiled import CompiledSupervisedModel, compile_supervised_bundle
+from youtube_success_ml.models.supervised import (
+    FEATURE_COLUMNS,
+    SupervisedBundle,
+    load_supervised_bundle,
+    predict_frame,
+)
+
+logger = logging.getLogger(__name__)
+
+PREDICTION_COLUMNS = {
+    "subscribers": "predicted_subscribers",
+    "earnings": "predicted_earnings",
+    "growth": "predicted_growth",
+}
+RESUME_STATE_FILE = "_scoring.json"
+
+# Per-process model state, populated once by ``_init_worker``.
+_worker_state: dict[str, Any] = {}
+
+
+def _has_pyarrow() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _file_format(path: Path) -> str:
+    suffix = path.suffix.lower()
+    if suffix in {".parquet", ".pq"}:
+        if not _has_pyarrow():
+            raise RuntimeError("Parquet input/output requires pyarrow (pip install pyarrow)")
+        return "parquet"
+    if suffix == ".csv":
+        return "csv"
+    raise ValueError(f"Unsupported file type '{path.suffix}'. Use .csv or .parquet")
+
+
+def iter_input_chunks(
+    path: Path, chunksize: int, encoding: str = SOURCE_ENCODING
+) -> Iterator[pd.DataFrame]:
+    """Yield the input file as DataFrames of at most ``chunksize`` rows.
+
+    ``encoding`` applies to CSV input; it defaults to that of the source dataset.
+    """
+    if _file_format(path) == "parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize, encoding=encoding)
+
+
+def _check_feature_columns(frame: pd.DataFrame) -> None:
+    missing = [c for c in FEATURE_COLUMNS if c not in frame.columns]
+    if missing:
+        raise ValueError(f"Input is missing required columns: {missing}")
+
+
+def _prepare_features(frame: pd.DataFrame) -> pd.DataFrame:
+    _check_feature_columns(frame)
+    X = frame[FEATURE_COLUMNS].copy()
+    for column in ("uploads", "age"):
+        X[column] = pd.to_numeric(X[column], errors="coerce")
+    for column in ("category", "country"):
+        values = X[column]
+        X[column] = values.where(values.isna(), values.astype(str).str.strip())
+    return X
+
+
+def score_frame(
+    frame: pd.DataFrame,
+    supervised: SupervisedBundle,
+    compiled: CompiledSupervisedModel | None = None,
+    clustering: ClusteringBundle | None = None,
+) -> pd.DataFrame:
+    """Append prediction (and optional K-Means archetype) columns to ``frame``."""
+    X = _prepare_features(frame)
+    if compiled is not None:
+        preds = compiled.predict_columns(
+            X["uploads"].to_numpy(dtype=float),
+            X["age"].to_numpy(dtype=float),
+            X["category"].tolist(),
+            X["country"].tolist(),
+        )
+    else:
+        preds = predict_frame(supervised, X)
+
+    scored = frame.copy()
+    for key, column in PREDICTION_COLUMNS.items():
+        scored[column] = preds[key]
+
+    if clustering is not None:
+        features = pd.DataFrame(
+            {
+                "uploads": X["uploads"].to_numpy(),
+                "subscribers": preds["subscribers"],
+                "highest_yearly_earnings": preds["earnings"],
+                "growth_target": preds["growth"],
+            }
+        ).fillna(0)  # same missing-value handling as clustering training
+        scored["kmeans_cluster"], scored["archetype"] = predict_kmeans_clusters(
+            clustering, features
+        )
+    return scored
+
+
+def _init_worker(model_dir: str, engine: str, with_clusters: bool) -> None:
+    supervised = load_supervised_bundle(Path(model_dir))
+    _worker_state["supervised"] = supervised
+    _worker_state["compiled"] = (
+        compile_supervised_bundle(supervised) if engine == "compiled" else None
+    )
+    _worker_state["clustering"] = load_clustering_bundle(Path(model_dir)) if with_clusters else None
+
+
+def _write_part(frame: pd.DataFrame, path: Path, fmt: str) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    if fmt == "parquet":
+        frame.to_parquet(tmp, index=False)
+    else:
+        frame.to_csv(tmp, index=False)
+    # Parts appear atomically, so an interrupted run never leaves a half-written part behind.
+    os.replace(tmp, path)
+
+
+def _score_chunk(frame: pd.DataFrame, part_path: str, fmt: str) -> int:
+    scored = score_frame(
+        frame,
+        _worker_state["supervised"],
+        compiled=_worker_state["compiled"],
+        clustering=_worker_state["clustering"],
+    )
+    _write_part(scored, Path(part_path), fmt)
+    return len(scored)
+
+
+def _part_path(parts_dir: Path, index: int, fmt: str) -> Path:
+    return parts_dir / f"part-{index:06d}.{'parquet' if fmt == 'parquet' else 'csv'}"
+
+
+def _prepare_parts_dir(
+    parts_dir: Path,
+    input_path: Path,
+    chunksize: int,
+    with_clusters: bool,
+    restart: bool,
+    *,
+    model_dir: Path,
+    engine: str,
+    encoding: str = SOURCE_ENCODING,
+) -> None:
+    stat = input_path.stat()
+    # Parts are only reusable when scored by the same models, not just the same input.
+    bundles = expected_artifacts(model_dir=model_dir)
+    state = {
+        "input": str(input_path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "chunksize": chunksize,
+        "encoding": encoding,
+        "clusters": with_clusters,
+        "engine": engine,
+        "model_dir": str(model_dir.resolve()),
+        "supervised_sha256": file_sha256(bundles["supervised_bundle"]),
+        "clustering_sha256": (file_sha256(bundles["clustering_bundle"]) if with_clusters else None),
+    }
+    state_path = parts_dir / RESUME_STATE_FILE
+    if restart and parts_dir.exists():
+        shutil.rmtree(parts_dir)
+    if state_path.exists():
+        previous = json.loads(state_path.read_text(encoding="utf-8"))
+        if previous != state:
+            raise ValueError(
+                f"Partial results in {parts_dir} were produced for a different input, "
+                "settings or model; rerun with --restart to discard them"
+            )
+        return
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+
+
+def _concatenate_parts(part_paths: list[Path], output_path: Path, fmt: str) -> None:
+    tmp = output_path.with_name(output_path.name + ".tmp")
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+
+        writer = None
+        try:
+            for path in part_paths:
+                table = pq.read_table(path)
+                if writer is None:
+                    writer = pq.ParquetWriter(tmp, table.schema)
+                elif table.schema != writer.schema:
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        with tmp.open("wb") as out:
+            for i, path in enumerate(part_paths):
+                with path.open("rb") as part:
+                    header = part.readline()
+                    if i == 0:
+                        out.write(header)
+                    shutil.copyfileobj(part, out)
+    os.replace(tmp, output_path)
+
+
+def score_file(
+    input_path: Path,
+    output_path: Path,
+    model_dir: Path | None = None,
+    chunksize: int = 100_000,
+    workers: int | None = None,
+    with_clusters: bool = False,
+    engine: str | None = None,
+    restart: bool = False,
+    encoding: str = SOURCE_ENCODING,
+) -> dict[str, Any]:
+    """Score ``input_path`` chunk by chunk into ``output_path``, preserving input order.
+
+    Each chunk is written to ``<output>.parts/`` as it finishes; rerunning the same
+    command after an interruption skips chunks whose part already exists. CSV input
+    is decoded with ``encoding``.
+    """
+    model_dir = model_dir or MODEL_DIR
+    engine = engine or INFERENCE_ENGINE
+    if engine not in INFERENCE_ENGINES:
+        raise ValueError(f"Unknown inference engine '{engine}'. Allowed: {INFERENCE_ENGINES}")
+    if chunksize < 1:
+        raise ValueError("chunksize must be >= 1")
+    workers = max(1, workers or os.cpu_count() or 1)
+    _file_format(input_path)
+    out_fmt = _file_format(output_path)
+
+    # Read the first chunk before creating any state, so an empty input or one without
+    # the feature columns fails without leaving ``<output>.parts/`` behind.
+    chunks = iter_input_chunks(input_path, chunksize, encoding=encoding)
+    try:
+        first = next(chunks, None)
+    except pd.errors.EmptyDataError:
+        first = None
+    if first is None or first.empty:
+        raise ValueError(f"Input file {input_path} contains no rows")
+    _check_feature_columns(first)
+
+    parts_dir = output_path.with_name(output_path.name + ".parts")
+    _prepare_parts_dir(
+        parts_dir,
+        input_path,
+        chunksize,
+        with_clusters,
+        restart,
+        model_dir=model_dir,
+        engine=engine,
+        encoding=encoding,
+    )
+
+    start = time.perf_counter()
+    part_paths: list[Path] = []
+    scored_rows = 0
+    skipped_chunks = 0
+    init_args = (str(model_dir), engine, with_clusters)
+
+    def _chunks() -> Iterator[tuple[int, pd.DataFrame, Path]]:
+        nonlocal skipped_chunks
+        for index, frame in enumerate(chain([first], chunks)):
+            part = _part_path(parts_dir, index, out_fmt)
+            part_paths.append(part)
+            if part.exists():
+                skipped_chunks += 1
+                continue
+            yield index, frame, part
+
+    if workers == 1:
+        _init_worker(*init_args)
+        for index, frame, part in _chunks():
+            scored_rows += _score_chunk(frame, str(part), out_fmt)
+            logger.info("Scored chunk %d (%d rows)", index, len(frame))
+    else:
+        # Bound in-flight chunks so memory does not grow with the input size.
+        max_pending = workers * 2
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=init_args
+        ) as pool:
+            pending: deque[tuple[int, Future[int]]] = deque()
+            for index, frame, part in _chunks():
+                pending.append((index, pool.submit(_score_chunk, frame, str(part), out_fmt)))
+                while len(pending) >= max_pending:
+                    done_index, future = pending.popleft()
+                    scored_rows += future.result()
+                    logger.info("Scored chunk %d", done_index)
+            while pending:
+                done_index, future = pending.popleft()
+                scored_rows += future.result()
+                logger.info("Scored chunk %d", done_index)
+
+    score_seconds = time.perf_counter() - start
+    _concatenate_parts(part_paths, output_path, out_fmt)
+    shutil.rmtree(parts_dir)
+    elapsed = time.perf_counter() - start
+
+    report = {
+        "input": str(input_path),
+        "output": str(output_path),
+        "chunks": len(part_paths),
+        "resumed_chunks": skipped_chunks,
+        "rows_scored": scored_rows,
+        "workers": workers,
+        "engine": engine,
+        "score_seconds": round(score_seconds, 3),
+        "total_seconds": round(elapsed, 3),
+        "rows_per_second": round(scored_rows / score_seconds, 1) if score_seconds > 0 else None,
+    }
+    logger.info("Scoring complete: %s", report)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Score a CSV/Parquet file of channels offline")
+    parser.add_argument("input", type=Path, help="Input .csv or .parquet with feature columns")
+    parser.add_argument("output", type=Path, help="Output .csv or .parquet path")
+    parser.add_argument("--model-dir", type=Path, default=None, help="Model artifact directory")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="Rows per chunk")
+    parser.add_argument(
+        "--workers", type=int, default=None, help="Worker processes (default: all cores)"
+    )
+    parser.add_argument(
+        "--with-clusters", action="store_true", help="Add K-Means cluster and archetype columns"
+    )
+    parser.add_argument(
+        "--engine", choices=INFERENCE_ENGINES, default=None, help="Inference engine override"
+    )
+    parser.add_argument(
+        "--restart", action="store_true", help="Discard partial results from a previous run"
+    )
+    parser.add_argument(
+        "--encoding",
+        default=SOURCE_ENCODING,
+        help=f"CSV input encoding (default: {SOURCE_ENCODING}, as the source dataset)",
+    )
+    args = parser.parse_args()
+
+    configure_logging()
+    report = score_file(
+        input_path=args.input,
+        output_path=args.output,
+        model_dir=args.model_dir,
+        chunksize=args.chunksize,
+        workers=args.workers,
+        with_clusters=args.with_clusters,
+        engine=args.engine,
+        restart=args.restart,
+        encoding=args.encoding,
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,81 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from statistics import mean
 from typing import Any
+from uuid import uuid4
 
-from youtube_success_ml.config import MODEL_DIR, REPORT_DIR
+import numpy as np
+import pandas as pd
+
+from youtube_success_ml.config import (
+    DRIFT_MONITOR_ENABLED,
+    DRIFT_MONITOR_WINDOW,
+    INFERENCE_ENGINE,
+    INFERENCE_ENGINES,
+    MODEL_DIR,
+    REPORT_DIR,
+)
 from youtube_success_ml.mlops.drift import check_feature_drift, load_training_baseline
+from youtube_success_ml.mlops.drift_monitor import DriftMonitor
+from youtube_success_ml.mlops.registry import file_sha256, load_manifest
 from youtube_success_ml.models.clustering import (
     ClusteringBundle,
+    assign_kmeans_clusters,
+    cluster_archetypes,
     load_clustering_bundle,
-    predict_kmeans_cluster,
+    predict_kmeans_clusters,
+)
+from youtube_success_ml.models.compiled import (
+    CompiledSupervisedModel,
+    batch_predict_compiled,
+    compile_supervised_bundle,
+)
+from youtube_success_ml.models.simulation import (
+    downsample_indices,
+    segment_grid,
+    uploads_breakpoints,
 )
 from youtube_success_ml.models.supervised import (
+    TARGET_COLUMNS,
     SupervisedBundle,
     batch_predict_from_bundle,
     load_supervised_bundle,
-    predict_from_bundle,
+    predict_frame,
     top_feature_importance,
 )
-from youtube_success_ml.schemas import PredictionRequest, SimulationRequest
+from youtube_success_ml.schemas import (
+    ClusterAssignItem,
+    ColumnarPredictionRequest,
+    PredictionRequest,
+    SimulationRequest,
+)
+from youtube_success_ml.services.prediction_cache import (
+    PredictionCache,
+    get_prediction_cache,
+    prediction_cache_key,
+)
+from youtube_success_ml.services.recommendations import recommendation_lists, risk_levels
+
+
+def _bundle_digests(model_dir: Path) -> tuple[str, str]:
+    return (
+        file_sha256(model_dir / "supervised_bundle.joblib"),
+        file_sha256(model_dir / "clustering_bundle.joblib"),
+    )
+
+
+def _run_id_for(supervised_sha256: str) -> str | None:
+    """The training run whose manifest recorded this supervised bundle, if any."""
+    manifest = load_manifest()
+    if not manifest:
+        return None
+    if manifest.get("artifact_hashes", {}).get("supervised_bundle") != supervised_sha256:
+        return None
+    return manifest.get("run_id")
 
 
 @dataclass
@@ -27,27 +83,114 @@ class IntelligenceService:
     supervised: SupervisedBundle
     clustering: ClusteringBundle
     baseline: dict[str, Any] | None
+    engine: str = "sklearn"
+    compiled: CompiledSupervisedModel | None = field(default=None, repr=False)
+    run_id: str | None = None
+    bundle_digest: str | None = None
+    cache: PredictionCache | None = field(default=None, repr=False)
+    drift_monitor: DriftMonitor | None = field(default=None, repr=False)
+    model_token: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Cache keys carry the run and the digest of the loaded bundles, so a swapped
+        # model never serves stale results.
+        parts = [part for part in (self.run_id, self.bundle_digest) if part]
+        self.model_token = ":".join(parts) or f"unregistered-{uuid4().hex}"
+        if self.engine not in INFERENCE_ENGINES:
+            raise ValueError(
+                f"Unknown inference engine '{self.engine}'. Allowed: {INFERENCE_ENGINES}"
+            )
+        if self.engine == "compiled" and self.compiled is None:
+            self.compiled = compile_supervised_bundle(self.supervised)
 
     @classmethod
     def from_artifacts(
         cls,
         model_dir: Path | None = None,
         report_dir: Path | None = None,
+        engine: str | None = None,
     ) -> "IntelligenceService":
         model_dir = model_dir or MODEL_DIR
         report_dir = report_dir or REPORT_DIR
 
-        supervised = load_supervised_bundle(model_dir)
-        clustering = load_clustering_bundle(model_dir)
+        # Hash the bundle files on both sides of the load so the digest describes the
+        # bytes actually loaded even if a retrain replaces them meanwhile.
+        for _ in range(3):
+            digests = _bundle_digests(model_dir)
+            supervised = load_supervised_bundle(model_dir)
+            clustering = load_clustering_bundle(model_dir)
+            if _bundle_digests(model_dir) == digests:
+                bundle_digest = ":".join(digests)
+                break
+        else:
+            digests, bundle_digest = None, None
+
         baseline = load_training_baseline(report_dir / "training_baseline.json")
-        return cls(supervised=supervised, clustering=clustering, baseline=baseline)
+        return cls(
+            supervised=supervised,
+            clustering=clustering,
+            baseline=baseline,
+            engine=engine or INFERENCE_ENGINE,
+            run_id=_run_id_for(digests[0]) if digests else None,
+            bundle_digest=bundle_digest,
+            cache=get_prediction_cache(),
+            drift_monitor=(
+                DriftMonitor(baseline, window_size=DRIFT_MONITOR_WINDOW)
+                if DRIFT_MONITOR_ENABLED and baseline is not None
+                else None
+            ),
+        )
+
+    def _predict_many(self, payloads: list[dict[str, Any]]) -> list[dict[str, float]]:
+        if self.compiled is not None:
+            return batch_predict_compiled(self.compiled, payloads)
+        return batch_predict_from_bundle(self.supervised, payloads)
+
+    def _predict_deduped(
+        self, payloads: list[dict[str, Any]], use_cache: bool = True, observe: bool = True
+    ) -> list[dict[str, float]]:
+        """Score each distinct payload once, consulting the cache, and scatter results back."""
+        if observe and self.drift_monitor is not None:
+            self.drift_monitor.observe_many(payloads)
+        cache = self.cache if use_cache else None
+        keys = [prediction_cache_key(self.model_token, p) for p in payloads]
+        results: dict[tuple[Any, ...], dict[str, float]] = {}
+        pending: dict[tuple[Any, ...], dict[str, Any]] = {}
+        for key, payload in zip(keys, payloads, strict=True):
+            if key in results or key in pending:
+                continue
+            cached = cache.get(key) if cache is not None else None
+            if cached is None:
+                pending[key] = payload
+            else:
+                results[key] = cached
+
+        if pending:
+            scored = self._predict_many(list(pending.values()))
+            for key, record in zip(pending, scored, strict=True):
+                results[key] = record
+                if cache is not None:
+                    cache.put(key, record)
+
+        return [dict(results[key]) for key in keys]
 
     def predict(self, request: PredictionRequest) -> dict[str, float]:
-        return predict_from_bundle(self.supervised, request.model_dump())
+        return self._predict_deduped([request.model_dump()])[0]
+
+    def predict_many(
+        self, requests: list[PredictionRequest], use_cache: bool = True, observe: bool = True
+    ) -> list[dict[str, float]]:
+        """Per-request predictions; bulk callers can skip the cache to avoid flushing hot keys.
+
+        ``observe=False`` keeps the rows out of the drift monitor (e.g. synthetic warm-up rows).
+        """
+        return self._predict_deduped(
+            [r.model_dump() for r in requests], use_cache=use_cache, observe=observe
+        )
 
     def predict_batch(self, requests: list[PredictionRequest]) -> dict[str, Any]:
         payloads = [r.model_dump() for r in requests]
-        records = batch_predict_from_bundle(self.supervised, payloads)
+        records = self._predict_deduped(payloads)
 
         summary = {
             "count": len(records),
@@ -57,73 +200,137 @@ class IntelligenceService:
         }
         return {"records": records, "summary": summary}
 
+    def predict_columns(
+        self, request: ColumnarPredictionRequest, observe: bool = True
+    ) -> dict[str, Any]:
+        """Columnar ``predict_batch``: the feature arrays feed the model directly.
+
+        No per-row payloads are built, so the prediction cache and de-duplication are
+        skipped; outputs are returned as numpy arrays, one per target.
+        """
+        columns = {
+            "uploads": request.uploads,
+            "category": request.category,
+            "country": request.country,
+            "age": request.age,
+        }
+        if observe and self.drift_monitor is not None:
+            self.drift_monitor.observe_columns(columns)
+        if self.compiled is not None:
+            preds = self.compiled.predict_columns(
+                columns["uploads"], columns["age"], columns["category"], columns["country"]
+            )
+        else:
+            preds = predict_frame(self.supervised, pd.DataFrame(columns))
+
+        # Target columns are strided views of one matrix; fast encoders want contiguous arrays.
+        result: dict[str, Any] = {
+            f"predicted_{key}": np.ascontiguousarray(preds[key]) for key in TARGET_COLUMNS
+        }
+        result["summary"] = {
+            "count": len(request.uploads),
+            **{f"avg_predicted_{key}": float(preds[key].mean()) for key in TARGET_COLUMNS},
+        }
+        return result
+
+    @cached_property
+    def upload_breakpoints(self) -> np.ndarray:
+        return uploads_breakpoints(self.supervised)
+
     def simulate(self, request: SimulationRequest) -> dict[str, Any]:
-        rows = []
-        for uploads in range(request.start_uploads, request.end_uploads + 1, request.step):
-            pred = predict_from_bundle(
-                self.supervised,
+        grid = np.arange(request.start_uploads, request.end_uploads + 1, request.step)
+        first_index, point_segment = segment_grid(grid, self.upload_breakpoints)
+
+        # One model evaluation per constant segment, expanded back onto the grid.
+        segment_preds = self._predict_many(
+            [
                 {
-                    "uploads": uploads,
+                    "uploads": int(uploads),
                     "category": request.category,
                     "country": request.country,
                     "age": request.age,
-                },
-            )
-            rows.append({"uploads": uploads, **pred})
+                }
+                for uploads in grid[first_index]
+            ]
+        )
+        growth = np.array([p["predicted_growth"] for p in segment_preds])
+        earnings = np.array([p["predicted_earnings"] for p in segment_preds])
+
+        rows = [
+            {"uploads": int(grid[i]), **segment_preds[point_segment[i]]}
+            for i in downsample_indices(grid.shape[0], request.max_points)
+        ]
 
+        # argmax returns the first maximal segment, whose first point is the first maximal
+        # grid point, matching max() over the full grid.
         return {
             "input": request.model_dump(),
             "points": rows,
-            "best_uploads_by_growth": max(rows, key=lambda r: r["predicted_growth"])["uploads"],
-            "best_uploads_by_earnings": max(rows, key=lambda r: r["predicted_earnings"])["uploads"],
+            "best_uploads_by_growth": int(grid[first_index[int(np.argmax(growth))]]),
+            "best_uploads_by_earnings": int(grid[first_index[int(np.argmax(earnings))]]),
         }
 
-    def recommendation(self, request: PredictionRequest) -> dict[str, Any]:
-        pred = self.predict(request)
-        cluster_id, archetype = predict_kmeans_cluster(
+    def _recommend_many(
+        self, requests: list[PredictionRequest], use_cache: bool = True, observe: bool = True
+    ) -> list[dict[str, Any]]:
+        """Predictions, K-Means archetypes and rule-based advice for many rows at once."""
+        preds = self._predict_deduped(
+            [r.model_dump() for r in requests], use_cache=use_cache, observe=observe
+        )
+        uploads = np.array([r.uploads for r in requests], dtype=float)
+        age = np.array([r.age for r in requests], dtype=float)
+        subscribers = np.array([p["predicted_subscribers"] for p in preds])
+        earnings = np.array([p["predicted_earnings"] for p in preds])
+        growth = np.array([p["predicted_growth"] for p in preds])
+
+        cluster_ids, archetypes = predict_kmeans_clusters(
             self.clustering,
-            uploads=float(request.uploads),
-            subscribers=pred["predicted_subscribers"],
-            earnings=pred["predicted_earnings"],
-            growth=pred["predicted_growth"],
+            pd.DataFrame(
+                {
+                    "uploads": uploads,
+                    "subscribers": subscribers,
+                    "highest_yearly_earnings": earnings,
+                    "growth_target": growth,
+                }
+            ),
         )
+        risks = risk_levels(growth)
+        advice = recommendation_lists(uploads, age, growth, earnings)
 
-        recommendations = []
-        if request.uploads < 200:
-            recommendations.append(
-                "Increase publishing cadence with a consistent weekly release plan."
-            )
-        if pred["predicted_growth"] < 50_000:
-            recommendations.append(
-                "Prioritize retention-focused video formats and stronger first-minute hooks."
-            )
-        if pred["predicted_earnings"] < 1_000_000:
-            recommendations.append(
-                "Expand monetization mix with sponsorship tiers and affiliate bundles."
-            )
-        if request.age < 2:
-            recommendations.append(
-                "Use collaboration and shorts strategy to accelerate early channel discovery."
+        return [
+            {
+                "prediction": pred,
+                "cluster": {"cluster_id": int(cluster_id), "archetype": archetype},
+                "risk_level": str(risk),
+                "recommendations": recommendations,
+            }
+            for pred, cluster_id, archetype, risk, recommendations in zip(
+                preds, cluster_ids, archetypes, risks, advice, strict=True
             )
+        ]
 
-        if not recommendations:
-            recommendations.append(
-                "Maintain current content velocity and optimize around top-performing content pillars."
-            )
+    def recommendation(self, request: PredictionRequest) -> dict[str, Any]:
+        return self._recommend_many([request])[0]
 
-        risk_level = (
-            "high"
-            if pred["predicted_growth"] < 20_000
-            else "medium"
-            if pred["predicted_growth"] < 120_000
-            else "low"
-        )
+    def recommendation_batch(self, requests: list[PredictionRequest]) -> dict[str, Any]:
+        records = self._recommend_many(requests)
+        counts = {level: 0 for level in ("low", "medium", "high")}
+        for record in records:
+            counts[record["risk_level"]] += 1
+        return {"records": records, "summary": {"count": len(records), "risk_level_counts": counts}}
 
+    def assign_clusters(self, items: list[ClusterAssignItem]) -> dict[str, Any]:
+        X = np.array(
+            [[item.uploads, item.subscribers, item.earnings, item.growth] for item in items],
+            dtype=float,
+        )
+        cluster_ids = assign_kmeans_clusters(self.clustering, X)
+        archetypes = cluster_archetypes(self.clustering, cluster_ids)
         return {
-            "prediction": pred,
-            "cluster": {"cluster_id": cluster_id, "archetype": archetype},
-            "risk_level": risk_level,
-            "recommendations": recommendations,
+            "records": [
+                {"cluster_id": int(cluster_id), "archetype": archetype}
+                for cluster_id, archetype in zip(cluster_ids, archetypes, strict=True)
+            ]
         }
 
     def feature_importance(self, target: str, top_n: int) -> dict[str, Any]:
@@ -146,3 +353,47 @@ class IntelligenceService:
             z_threshold=z_threshold,
             min_category_frequency=min_frequency,
         )
+
+    def warm_up(self) -> dict[str, float]:
+        """Run a sample through every scoring path; seconds taken per path.
+
+        Warm-up rows bypass the prediction cache and the drift monitor, so they neither
+        occupy cache slots nor enter the live drift window.
+        """
+        sample = PredictionRequest(
+            uploads=500, category="Entertainment", country="United States", age=5
+        )
+        items = [sample, sample.model_copy(update={"uploads": 5_000, "age": 12})]
+        paths = {
+            "predict": lambda: self.predict_many([sample], use_cache=False, observe=False),
+            "batch": lambda: self.predict_many(items, use_cache=False, observe=False),
+            "columnar": lambda: self.predict_columns(
+                ColumnarPredictionRequest(
+                    uploads=[item.uploads for item in items],
+                    category=[item.category for item in items],
+                    country=[item.country for item in items],
+                    age=[item.age for item in items],
+                ),
+                observe=False,
+            ),
+            "simulate": lambda: self.simulate(
+                SimulationRequest(
+                    category=sample.category,
+                    country=sample.country,
+                    age=sample.age,
+                    start_uploads=0,
+                    end_uploads=20_000,
+                    step=500,
+                )
+            ),
+            "recommendation": lambda: self._recommend_many(items, use_cache=False, observe=False),
+            "cluster": lambda: self.assign_clusters(
+                [ClusterAssignItem(uploads=500, subscribers=1e6, earnings=1e5, growth=1e4)]
+            ),
+        }
+        timings: dict[str, float] = {}
+        for name, run in paths.items():
+            start = time.perf_counter()
+            run()
+            timings[name] = time.perf_counter() - start
+        return timings
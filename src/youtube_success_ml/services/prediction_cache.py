@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from youtube_success_ml.config import PREDICTION_CACHE_SIZE, PREDICTION_CACHE_TTL_SECONDS
+
+
+class PredictionCache:
+    """Thread-safe, size-bounded LRU cache with an optional per-entry TTL."""
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expires_at = self._clock() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+            }
+
+
+_shared_cache: PredictionCache | None = None
+_shared_lock = threading.Lock()
+
+
+def get_prediction_cache() -> PredictionCache | None:
+    """Process-wide cache shared by service reloads; ``None`` when disabled."""
+    global _shared_cache
+    if PREDICTION_CACHE_SIZE <= 0:
+        return None
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = PredictionCache(
+                max_size=PREDICTION_CACHE_SIZE, ttl_seconds=PREDICTION_CACHE_TTL_SECONDS
+            )
+        return _shared_cache
+
+
+def prediction_cache_key(model_token: str, payload: dict[str, Any]) -> tuple[Any, ...]:
+    """Normalize a validated prediction payload into a cache key for one model run."""
+    return (
+        model_token,
+        int(payload["uploads"]),
+        str(payload["category"]).strip(),
+        str(payload["country"]).strip(),
+        int(payload["age"]),
+    )
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import numpy as np
+
+LOW_UPLOADS_MESSAGE = "Increase publishing cadence with a consistent weekly release plan."
+LOW_GROWTH_MESSAGE = "Prioritize retention-focused video formats and stronger first-minute hooks."
+LOW_EARNINGS_MESSAGE = "Expand monetization mix with sponsorship tiers and affiliate bundles."
+EARLY_CHANNEL_MESSAGE = (
+    "Use collaboration and shorts strategy to accelerate early channel discovery."
+)
+DEFAULT_MESSAGE = (
+    "Maintain current content velocity and optimize around top-performing content pillars."
+)
+
+HIGH_RISK_GROWTH = 20_000
+MEDIUM_RISK_GROWTH = 120_000
+
+
+def risk_levels(growth: np.ndarray) -> np.ndarray:
+    return np.select(
+        [growth < HIGH_RISK_GROWTH, growth < MEDIUM_RISK_GROWTH], ["high", "medium"], "low"
+    )
+
+
+def recommendation_lists(
+    uploads: np.ndarray, age: np.ndarray, growth: np.ndarray, earnings: np.ndarray
+) -> list[list[str]]:
+    """Apply every rule as a column mask; rows matching no rule get the default advice."""
+    messages = np.array(
+        [LOW_UPLOADS_MESSAGE, LOW_GROWTH_MESSAGE, LOW_EARNINGS_MESSAGE, EARLY_CHANNEL_MESSAGE],
+        dtype=object,
+    )
+    masks = np.column_stack([uploads < 200, growth < 50_000, earnings < 1_000_000, age < 2])
+    return [messages[row].tolist() or [DEFAULT_MESSAGE] for row in masks]
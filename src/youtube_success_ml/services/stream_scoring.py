@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import zlib
+from typing import TYPE_CHECKING, Any
+
+from pydantic import ValidationError
+
+from youtube_success_ml.schemas import PredictionRequest
+
+if TYPE_CHECKING:
+    from youtube_success_ml.services.intelligence_service import IntelligenceService
+
+# Upper bound on one NDJSON line and on bytes inflated per gzip step.
+MAX_LINE_BYTES = 64 * 1024
+_INFLATE_STEP = 1 << 20
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+class NDJSONPredictionStream:
+    """Incremental NDJSON scorer with bounded memory.
+
+    ``feed`` accepts raw body chunks as they arrive (gzip-compressed when
+    ``compressed`` is set) and returns encoded NDJSON output for every complete
+    chunk of ``chunk_size`` rows; ``close`` flushes the remainder and appends a
+    summary line. Output rows carry their 1-based input ``line`` number, with
+    either the three predictions or an ``error`` message, in input order. A body
+    that cannot be read (bad or truncated gzip, data after the gzip stream) stops
+    the stream with a final ``error`` line; the message is kept in ``error``.
+    """
+
+    def __init__(
+        self,
+        service: IntelligenceService,
+        chunk_size: int = 1000,
+        compressed: bool = False,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.service = service
+        self.chunk_size = chunk_size
+        self._inflater = zlib.decompressobj(16 + zlib.MAX_WBITS) if compressed else None
+        self._buffer = bytearray()
+        self._discarding = False
+        self.error: str | None = None
+        self._pending: list[tuple[int, PredictionRequest | str]] = []
+        self.lines = 0
+        self.scored = 0
+        self.errors = 0
+
+    def feed(self, data: bytes) -> bytes:
+        if self.error is not None or not data:
+            return b""
+        out = bytearray()
+        try:
+            for piece in self._inflate(data):
+                self._consume(piece, out)
+        except zlib.error as exc:
+            self._fail(f"invalid gzip stream: {exc}", out)
+        return bytes(out)
+
+    def close(self) -> bytes:
+        out = bytearray()
+        if self.error is None and self._inflater is not None and not self._inflater.eof:
+            # Input has ended: take whatever zlib still holds before judging the stream.
+            try:
+                self._consume(self._inflater.flush(), out)
+            except zlib.error as exc:
+                self._fail(f"invalid gzip stream: {exc}", out)
+        if self.error is None:
+            if self._inflater is not None and not self._inflater.eof:
+                self._fail("truncated gzip stream", out)
+            else:
+                if self._buffer or self._discarding:
+                    self._take_line(bytes(self._buffer), out)
+                    self._buffer.clear()
+                self._flush(out)
+        summary = {"lines": self.lines, "scored": self.scored, "errors": self.errors}
+        out += json.dumps({"summary": summary}).encode() + b"\n"
+        return bytes(out)
+
+    def _inflate(self, data: bytes):
+        if self._inflater is None:
+            yield data
+            return
+        while not self._inflater.eof:
+            piece = self._inflater.decompress(data, _INFLATE_STEP)
+            if piece:
+                yield piece
+            data = self._inflater.unconsumed_tail
+            # A full output step can leave inflated bytes in zlib with no input left.
+            if not data and len(piece) < _INFLATE_STEP:
+                break
+        if self._inflater.eof and (data or self._inflater.unused_data):
+            raise zlib.error("trailing data after end of stream")
+
+    def _consume(self, data: bytes, out: bytearray) -> None:
+        start = 0
+        while True:
+            newline = data.find(b"\n", start)
+            if newline < 0:
+                break
+            if not self._discarding:
+                self._buffer += data[start:newline]
+            self._take_line(bytes(self._buffer), out)
+            self._buffer.clear()
+            start = newline + 1
+        if not self._discarding:
+            self._buffer += data[start:]
+            if len(self._buffer) > MAX_LINE_BYTES:
+                self._buffer.clear()
+                self._discarding = True
+
+    def _take_line(self, raw: bytes, out: bytearray) -> None:
+        self.lines += 1
+        if self._discarding or len(raw) > MAX_LINE_BYTES:
+            self._discarding = False
+            self._pending.append((self.lines, f"line exceeds {MAX_LINE_BYTES} bytes"))
+        elif raw.strip():
+            try:
+                self._pending.append((self.lines, PredictionRequest.model_validate_json(raw)))
+            except ValidationError as exc:
+                self._pending.append((self.lines, _validation_message(exc)))
+        if len(self._pending) >= self.chunk_size:
+            self._flush(out)
+
+    def _flush(self, out: bytearray) -> None:
+        if not self._pending:
+            return
+        requests = [item for _, item in self._pending if isinstance(item, PredictionRequest)]
+        predictions = iter(self.service.predict_many(requests, use_cache=False))
+        for line, item in self._pending:
+            if isinstance(item, PredictionRequest):
+                record: dict[str, Any] = {"line": line, **next(predictions)}
+                self.scored += 1
+            else:
+                record = {"line": line, "error": item}
+                self.errors += 1
+            out += json.dumps(record).encode() + b"\n"
+        self._pending.clear()
+
+    def _fail(self, message: str, out: bytearray) -> None:
+        self._flush(out)
+        self.error = message
+        self.errors += 1
+        out += json.dumps({"line": None, "error": message}).encode() + b"\n"
@@ -9,21 +9,35 @@ from youtube_success_ml.config import (
     REPORT_DIR,
     TrainingConfig,
 )
-from youtube_success_ml.data.loader import load_dataset, load_raw_dataset, resolve_data_path
+from youtube_success_ml.data.loader import load_raw_dataset, prepare_dataset, resolve_data_path
+from youtube_success_ml.data.rollups import (
+    ROLLUP_FILENAME,
+    build_analytics_rollup,
+    save_analytics_rollup,
+)
 from youtube_success_ml.logging_utils import configure_logging
-from youtube_success_ml.mlops.drift import build_training_baseline, save_training_baseline
+from youtube_success_ml.mlops.drift import (
+    build_training_baseline,
+    distributions_path,
+    save_training_baseline,
+)
 from youtube_success_ml.mlops.experiments import ExperimentTracker
 from youtube_success_ml.mlops.feature_store import save_feature_snapshot
 from youtube_success_ml.mlops.hpo import OptunaConfig, run_supervised_hpo
 from youtube_success_ml.mlops.quality import build_data_quality_report, save_data_quality_report
 from youtube_success_ml.mlops.registry import (
     build_training_manifest,
+    file_sha256,
     generate_run_id,
     update_registry,
     write_manifest,
 )
 from youtube_success_ml.models.clustering import train_clustering_bundle
-from youtube_success_ml.models.supervised import train_supervised_bundle
+from youtube_success_ml.models.supervised import (
+    SUPERVISED_MODES,
+    evaluate_supervised_mode,
+    train_supervised_bundle,
+)
 from youtube_success_ml.visualization.maps import export_map_assets
 
 
@@ -38,6 +52,10 @@ def _flatten_metrics(metrics: dict) -> dict[str, float]:
                 flat[f"{target}_{key}"] = float(value)
             except (TypeError, ValueError):
                 continue
+    for mode, summary in metrics.get("supervised_mode_comparison", {}).items():
+        for target, target_metrics in summary.get("metrics", {}).items():
+            for key, value in target_metrics.items():
+                flat[f"{mode}_{target}_{key}"] = float(value)
     if "hpo_best_rmse" in metrics:
         flat["hpo_best_rmse"] = float(metrics["hpo_best_rmse"])
     return flat
@@ -55,8 +73,10 @@ def run_training(
     tracker = ExperimentTracker.start(run_name="yts-training", run_id=run_id)
     try:
         data_path = resolve_data_path()
+        # The quality report profiles every column, so parse the full file once and
+        # derive the processed frame from it instead of reading the CSV twice.
         raw_df = load_raw_dataset(path=data_path)
-        df = load_dataset(path=data_path)
+        df = prepare_dataset(raw_df.copy())
 
         if optuna_trials > 0:
             hpo_result = run_supervised_hpo(
@@ -80,6 +100,7 @@ def run_training(
                 n_clusters=cfg.n_clusters,
                 dbscan_eps=cfg.dbscan_eps,
                 dbscan_min_samples=cfg.dbscan_min_samples,
+                supervised_mode=cfg.supervised_mode,
             )
         else:
             hpo_result = None
@@ -93,15 +114,30 @@ def run_training(
                 "n_clusters": cfg.n_clusters,
                 "dbscan_eps": cfg.dbscan_eps,
                 "dbscan_min_samples": cfg.dbscan_min_samples,
+                "supervised_mode": cfg.supervised_mode,
                 "run_maps": run_maps,
                 "optuna_trials": optuna_trials,
             }
         )
 
         supervised = train_supervised_bundle(df, config=cfg, model_dir=MODEL_DIR)
+        # Holdout metrics for every mode, so accuracy can be traded against ensemble size.
+        mode_comparison = {
+            cfg.supervised_mode: {
+                "metrics": supervised.metrics,
+                "n_trees": supervised.metadata["n_trees"],
+                "n_nodes": supervised.metadata["n_nodes"],
+            }
+        }
+        for mode in SUPERVISED_MODES:
+            if mode not in mode_comparison:
+                mode_comparison[mode] = evaluate_supervised_mode(df, config=cfg, mode=mode)
         clustering, _ = train_clustering_bundle(df, config=cfg, model_dir=MODEL_DIR)
 
-        map_paths = export_map_assets(df, output_dir=MAP_DIR) if run_maps else {}
+        data_sha256 = file_sha256(data_path)
+        map_paths = (
+            export_map_assets(df, output_dir=MAP_DIR, data_sha256=data_sha256) if run_maps else {}
+        )
 
         REPORT_DIR.mkdir(parents=True, exist_ok=True)
         data_quality = build_data_quality_report(raw_df=raw_df, processed_df=df)
@@ -109,9 +145,15 @@ def run_training(
         baseline = build_training_baseline(df)
         save_training_baseline(baseline, REPORT_DIR / "training_baseline.json")
         feature_snapshot_path = save_feature_snapshot(df, REPORT_DIR / "feature_store_snapshot.csv")
+        rollup_path = save_analytics_rollup(
+            build_analytics_rollup(df, data_sha256=data_sha256),
+            REPORT_DIR / ROLLUP_FILENAME,
+        )
 
         metrics = {
             "supervised_metrics": supervised.metrics,
+            "supervised_mode": cfg.supervised_mode,
+            "supervised_mode_comparison": mode_comparison,
             "clusters": clustering.cluster_profiles,
             "maps": {k: str(v) for k, v in map_paths.items()},
         }
@@ -139,7 +181,9 @@ def run_training(
                 metrics_path,
                 REPORT_DIR / "data_quality_report.json",
                 REPORT_DIR / "training_baseline.json",
+                distributions_path(REPORT_DIR / "training_baseline.json"),
                 feature_snapshot_path,
+                rollup_path,
             ]
         )
         if hpo_result is not None:
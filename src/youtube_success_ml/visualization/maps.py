@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,25 @@ try:
 except Exception:  # noqa: BLE001
     folium = None
 
+# Processed-dataset columns read by the map builders and ``build_country_metrics``.
+MAP_COLUMNS = [
+    "youtuber",
+    "category",
+    "country",
+    "abbreviation",
+    "uploads",
+    "subscribers",
+    "highest_yearly_earnings",
+    "growth_target",
+    "latitude",
+    "longitude",
+]
+MAP_PAGE_TITLES = {
+    "influence_map": "Global YouTube Influence Map",
+    "earnings_choropleth": "Yearly Earnings by Country",
+    "category_dominance_map": "Category Dominance by Country",
+}
+
 
 def _wrap_embed_html(body_html: str, title: str) -> str:
     safe_title = title.replace("<", "").replace(">", "")
@@ -48,29 +68,34 @@ def _wrap_embed_html(body_html: str, title: str) -> str:
 </html>"""
 
 
+def _embed_html(fig_or_map, title: str) -> str:
+    if folium is not None and hasattr(fig_or_map, "get_root"):
+        return _wrap_embed_html(fig_or_map.get_root().render(), title)
+    fig_or_map.update_layout(margin=dict(l=0, r=0, t=48, b=0))
+    html = fig_or_map.to_html(include_plotlyjs="cdn", full_html=False, config={"responsive": True})
+    return _wrap_embed_html(html, title)
+
+
 def build_influence_map_html(df: pd.DataFrame) -> str:
-    fig = build_influence_map(df)
-    fig.update_layout(margin=dict(l=0, r=0, t=48, b=0))
-    html = fig.to_html(include_plotlyjs="cdn", full_html=False, config={"responsive": True})
-    return _wrap_embed_html(html, "Global YouTube Influence Map")
+    return _embed_html(build_influence_map(df), MAP_PAGE_TITLES["influence_map"])
 
 
 def build_earnings_choropleth_html(df: pd.DataFrame) -> str:
-    fig = build_earnings_choropleth(df)
-    fig.update_layout(margin=dict(l=0, r=0, t=48, b=0))
-    html = fig.to_html(include_plotlyjs="cdn", full_html=False, config={"responsive": True})
-    return _wrap_embed_html(html, "Yearly Earnings by Country")
+    return _embed_html(build_earnings_choropleth(df), MAP_PAGE_TITLES["earnings_choropleth"])
 
 
 def build_category_dominance_map_html(df: pd.DataFrame) -> str:
-    fmap_or_fig = build_category_dominance_map(df)
-    if folium is not None and hasattr(fmap_or_fig, "get_root"):
-        html = fmap_or_fig.get_root().render()
-        return _wrap_embed_html(html, "Category Dominance by Country")
+    return _embed_html(build_category_dominance_map(df), MAP_PAGE_TITLES["category_dominance_map"])
 
-    fmap_or_fig.update_layout(margin=dict(l=0, r=0, t=48, b=0))
-    html = fmap_or_fig.to_html(include_plotlyjs="cdn", full_html=False, config={"responsive": True})
-    return _wrap_embed_html(html, "Category Dominance by Country")
+
+# Served (embeddable) map pages, keyed like the ``export_map_assets`` outputs.
+MAP_PAGES = {
+    "influence_map": build_influence_map_html,
+    "earnings_choropleth": build_earnings_choropleth_html,
+    "category_dominance_map": build_category_dominance_map_html,
+}
+# Written by ``export_map_assets`` next to the pages it records.
+MAP_MANIFEST_FILENAME = "map_pages.json"
 
 
 def build_influence_map(df: pd.DataFrame):
@@ -103,7 +128,7 @@ def build_influence_map(df: pd.DataFrame):
 def build_earnings_choropleth(df: pd.DataFrame):
     agg = (
         df[df["country"] != "Unknown"]
-        .groupby(["country", "abbreviation"], as_index=False)
+        .groupby(["country", "abbreviation"], as_index=False, observed=True)
         .agg(total_earnings=("highest_yearly_earnings", "sum"))
     )
 
@@ -126,7 +151,7 @@ def build_category_dominance_map(df: pd.DataFrame):
     geo = geo[geo["country"] != "Unknown"]
 
     grouped = (
-        geo.groupby(["country", "category", "abbreviation"], as_index=False)
+        geo.groupby(["country", "category", "abbreviation"], as_index=False, observed=True)
         .agg(
             subscribers=("subscribers", "sum"),
             earnings=("highest_yearly_earnings", "sum"),
@@ -172,7 +197,7 @@ def build_category_dominance_map(df: pd.DataFrame):
 def build_country_metrics(df: pd.DataFrame) -> list[dict[str, Any]]:
     grouped = (
         df[df["country"] != "Unknown"]
-        .groupby(["country", "abbreviation"], as_index=False)
+        .groupby(["country", "abbreviation"], as_index=False, observed=True)
         .agg(
             total_subscribers=("subscribers", "sum"),
             total_earnings=("highest_yearly_earnings", "sum"),
@@ -185,7 +210,7 @@ def build_country_metrics(df: pd.DataFrame) -> list[dict[str, Any]]:
 
     dominant = (
         df[df["country"] != "Unknown"]
-        .groupby(["country", "category"], as_index=False)
+        .groupby(["country", "category"], as_index=False, observed=True)
         .agg(subscribers=("subscribers", "sum"))
         .sort_values("subscribers", ascending=False)
         .drop_duplicates(subset=["country"])
@@ -203,7 +228,14 @@ def build_country_metrics(df: pd.DataFrame) -> list[dict[str, Any]]:
     return records
 
 
-def export_map_assets(df: pd.DataFrame, output_dir: Path | None = None) -> dict[str, Path]:
+def export_map_assets(
+    df: pd.DataFrame, output_dir: Path | None = None, data_sha256: str | None = None
+) -> dict[str, Path]:
+    """Write standalone map HTML files.
+
+    With ``data_sha256``, the embeddable pages served by the API are written as well,
+    with a manifest recording the dataset hash so serving can reuse them.
+    """
     output_dir = output_dir or MAP_DIR
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -222,8 +254,43 @@ def export_map_assets(df: pd.DataFrame, output_dir: Path | None = None) -> dict[
     else:
         dominance.write_html(str(dominance_path), include_plotlyjs="cdn")
 
+    if data_sha256 is not None:
+        figures = {
+            "influence_map": influence,
+            "earnings_choropleth": earnings,
+            "category_dominance_map": dominance,
+        }
+        pages = {}
+        for name, figure in figures.items():
+            page_path = output_dir / f"{name}.embed.html"
+            page_path.write_text(_embed_html(figure, MAP_PAGE_TITLES[name]), encoding="utf-8")
+            pages[name] = page_path.name
+        manifest = {"data_sha256": data_sha256, "pages": pages}
+        (output_dir / MAP_MANIFEST_FILENAME).write_text(
+            json.dumps(manifest, indent=2), encoding="utf-8"
+        )
+
     return {
         "influence_map": influence_path,
         "earnings_choropleth": earnings_path,
         "category_dominance_map": dominance_path,
     }
+
+
+def load_exported_map_pages(data_sha256: str, map_dir: Path | None = None) -> dict[str, str]:
+    """Pages written by ``export_map_assets`` for this dataset hash (empty when stale)."""
+    manifest_path = (map_dir or MAP_DIR) / MAP_MANIFEST_FILENAME
+    if not manifest_path.exists():
+        return {}
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("data_sha256") != data_sha256:
+        return {}
+    pages = {}
+    for name, filename in manifest.get("pages", {}).items():
+        page_path = manifest_path.parent / filename
+        if name in MAP_PAGES and page_path.exists():
+            pages[name] = page_path.read_text(encoding="utf-8")
+    return pages
@@ -0,0 +1,109 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from youtube_success_ml.data.loader import load_dataset, resolve_data_path
+from youtube_success_ml.data.rollups import (
+    AnalyticsRollupStore,
+    build_analytics_rollup,
+    category_performance,
+    country_metrics,
+    load_analytics_rollup,
+    save_analytics_rollup,
+    upload_bucket_labels,
+    upload_growth_buckets,
+)
+from youtube_success_ml.mlops.registry import file_sha256
+from youtube_success_ml.visualization.maps import build_country_metrics
+
+
+def _reference_category_performance(df, top_n):
+    agg = (
+        df.groupby("category", as_index=False)
+        .agg(
+            channel_count=("youtuber", "count"),
+            avg_subscribers=("subscribers", "mean"),
+            avg_earnings=("highest_yearly_earnings", "mean"),
+            avg_growth=("growth_target", "mean"),
+            total_subscribers=("subscribers", "sum"),
+            total_earnings=("highest_yearly_earnings", "sum"),
+        )
+        .sort_values("total_subscribers", ascending=False)
+        .head(top_n)
+    )
+    return agg.to_dict(orient="records")
+
+
+def _reference_upload_buckets(df):
+    df = df.assign(upload_bucket=upload_bucket_labels(df["uploads"]))
+    agg = (
+        df.groupby("upload_bucket", as_index=False)
+        .agg(
+            channel_count=("youtuber", "count"),
+            avg_growth=("growth_target", "mean"),
+            avg_earnings=("highest_yearly_earnings", "mean"),
+            avg_subscribers=("subscribers", "mean"),
+        )
+        .sort_values("upload_bucket")
+    )
+    return agg.to_dict(orient="records")
+
+
+def _assert_records_match(actual, expected):
+    # Re-adding per-cell sums can differ from a row-order sum in the last float bit.
+    assert [list(row) for row in actual] == [list(row) for row in expected]
+    for got, want in zip(actual, expected, strict=True):
+        for key, value in want.items():
+            if isinstance(value, float):
+                assert got[key] == pytest.approx(value, rel=1e-12, nan_ok=True)
+            else:
+                assert got[key] == value
+
+
+def test_rollup_slices_match_row_level_groupbys():
+    df = load_dataset()
+    rollup = build_analytics_rollup(df)
+    assert len(rollup.cells) < len(df)
+
+    _assert_records_match(category_performance(rollup, 30), _reference_category_performance(df, 30))
+    _assert_records_match(category_performance(rollup, 3), _reference_category_performance(df, 3))
+    _assert_records_match(upload_growth_buckets(rollup), _reference_upload_buckets(df))
+    _assert_records_match(country_metrics(rollup), build_country_metrics(df))
+
+    # Missing keys and metrics are dropped or skipped exactly as the row groupbys do.
+    patched = df.copy()
+    patched.loc[:40, "category"] = np.nan
+    patched.loc[20:60, "growth_target"] = np.nan
+    patched.loc[5:9, "uploads"] = -1
+    rollup = build_analytics_rollup(patched)
+    _assert_records_match(
+        category_performance(rollup, 30), _reference_category_performance(patched, 30)
+    )
+    _assert_records_match(upload_growth_buckets(rollup), _reference_upload_buckets(patched))
+
+
+def test_rollup_store_prefers_matching_artifact_and_rebuilds_on_change(tmp_path):
+    path = tmp_path / "dataset.csv"
+    shutil.copyfile(resolve_data_path(), path)
+    artifact = save_analytics_rollup(
+        build_analytics_rollup(load_dataset(path), data_sha256=file_sha256(path)),
+        tmp_path / "analytics_rollup.joblib",
+    )
+    assert load_analytics_rollup(artifact).data_sha256 == file_sha256(path)
+
+    store = AnalyticsRollupStore(artifact_path=artifact)
+    first = store.get(path)
+    assert store.get(path) is first
+    assert store.stats() == {"hits": 1, "builds": 0, "artifact_loads": 1}
+
+    with path.open("a", encoding="latin-1") as handle:
+        handle.write("\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    rebuilt = store.get(path)
+    assert store.stats()["builds"] == 1
+    assert rebuilt.data_sha256 == file_sha256(path)
+    pd.testing.assert_frame_equal(rebuilt.cells, first.cells)
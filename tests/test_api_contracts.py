@@ -1,3 +1,7 @@
+import gzip
+import json
+
+import pytest
 from fastapi.testclient import TestClient
 
 from youtube_success_ml.train import run_training
@@ -54,6 +58,31 @@ def test_fastapi_advanced_prediction_contracts():
     assert batch_body["summary"]["count"] == 2
     assert len(batch_body["records"]) == 2
 
+    rec_items = [
+        {"uploads": 150, "category": "Music", "country": "India", "age": 1},
+        {"uploads": 4000, "category": "Education", "country": "United States", "age": 12},
+    ]
+    rec_batch = client.post("/predict/recommendation/batch", json={"items": rec_items})
+    assert rec_batch.status_code == 200
+    rec_body = rec_batch.json()
+    assert rec_body["summary"]["count"] == 2
+    assert sum(rec_body["summary"]["risk_level_counts"].values()) == 2
+    for item, record in zip(rec_items, rec_body["records"], strict=True):
+        assert client.post("/predict/recommendation", json=item).json() == record
+
+    assign = client.post(
+        "/clusters/assign",
+        json={
+            "items": [
+                {"uploads": 300, "subscribers": 2e6, "earnings": 1e5, "growth": 4e4},
+                {"uploads": 9000, "subscribers": 9e7, "earnings": 4e7, "growth": 2e6},
+            ]
+        },
+    )
+    assert assign.status_code == 200
+    assert len(assign.json()["records"]) == 2
+    assert {"cluster_id", "archetype"} == set(assign.json()["records"][0])
+
     sim = client.post(
         "/predict/simulate",
         json={
@@ -101,6 +130,9 @@ def test_fastapi_ready_and_mlops_contract():
     manifest = client.get("/mlops/manifest")
     registry = client.get("/mlops/registry")
     capabilities = client.get("/mlops/capabilities")
+    client.post(
+        "/predict", json={"uploads": 100, "category": "Music", "country": "India", "age": 5}
+    )
     metrics = client.get("/metrics")
 
     assert ready.status_code == 200
@@ -109,10 +141,17 @@ def test_fastapi_ready_and_mlops_contract():
     assert "run_id" in manifest.json()
     assert registry.status_code == 200
     assert "active_run_id" in registry.json()
+    assert manifest.headers["etag"] and manifest.headers["last-modified"]
+    revalidated = client.get("/mlops/manifest", headers={"If-None-Match": manifest.headers["etag"]})
+    assert revalidated.status_code == 304
     assert capabilities.status_code == 200
     assert "experiment_tracking" in capabilities.json()
     assert metrics.status_code == 200
     assert "http_requests_total" in metrics.text
+    assert "prediction_cache_hits_total" in metrics.text
+    assert "prediction_microbatch_size_bucket" in metrics.text
+    assert 'prediction_drift_score{feature="uploads",method="z"}' in metrics.text
+    assert "response_cache_not_modified_total" in metrics.text
 
 
 def test_fastapi_drift_check_contract():
@@ -159,6 +198,17 @@ def test_fastapi_data_samples_contract():
     assert len(processed.json()["records"]) == 5
     assert "age" in processed.json()["records"][0]
 
+    from youtube_success_ml.api.flask_app import app as flask_app
+
+    flask_client = flask_app.test_client()
+    flask_raw = flask_client.get("/data/raw-sample?limit=5")
+    assert flask_raw.get_json() == raw.json()
+    assert flask_raw.headers["ETag"] != raw.headers["etag"]
+    cached = flask_client.get(
+        "/data/raw-sample?limit=5", headers={"If-None-Match": flask_raw.headers["ETag"]}
+    )
+    assert cached.status_code == 304
+
 
 def test_fastapi_analytics_endpoints_contract():
     _ensure_artifacts()
@@ -193,6 +243,32 @@ def test_fastapi_map_embed_endpoints_contract():
     assert "<html" in earnings.text.lower()
     assert "<html" in dominance.text.lower()
 
+    # Rendered once per dataset version: conditional requests revalidate to 304.
+    identity = client.get("/maps/influence-map", headers={"Accept-Encoding": "identity"})
+    gzipped = client.get("/maps/influence-map", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in identity.headers
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.text == identity.text == influence.text
+    assert gzipped.headers["etag"] != identity.headers["etag"]
+    revalidated = client.get(
+        "/maps/influence-map",
+        headers={"Accept-Encoding": "gzip", "If-None-Match": gzipped.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == gzipped.headers["etag"]
+
+    from youtube_success_ml.api.flask_app import app as flask_app
+
+    flask_client = flask_app.test_client()
+    flask_page = flask_client.get("/maps/influence-map")
+    assert flask_page.status_code == 200
+    assert flask_page.get_data(as_text=True) == influence.text
+    assert flask_page.headers["ETag"] == identity.headers["etag"]
+    flask_revalidated = flask_client.get(
+        "/maps/influence-map", headers={"If-None-Match": identity.headers["etag"]}
+    )
+    assert flask_revalidated.status_code == 304
+
 
 def test_flask_predict_contract():
     _ensure_artifacts()
@@ -216,6 +292,141 @@ def test_flask_predict_contract():
     assert "predicted_growth" in body
 
 
+def test_predict_stream_contract():
+    _ensure_artifacts()
+
+    from youtube_success_ml.api.fastapi_app import app as fastapi_app
+    from youtube_success_ml.api.flask_app import app as flask_app
+
+    rows = [
+        {"uploads": 100, "category": "Music", "country": "India", "age": 3},
+        {"uploads": 700, "category": "Education", "country": "United States", "age": 0},
+    ] * 3
+    body = gzip.compress(("\n".join(json.dumps(r) for r in rows) + "\n").encode())
+    headers = {"Content-Type": "application/x-ndjson", "Content-Encoding": "gzip"}
+
+    fast = TestClient(fastapi_app).post("/predict/stream", content=body, headers=headers)
+    flask = flask_app.test_client().post("/predict/stream", data=body, headers=headers)
+
+    for response, text in ((fast, fast.text), (flask, flask.get_data(as_text=True))):
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in text.splitlines()]
+        assert len(records) == len(rows) + 1
+        assert records[-1]["summary"] == {"lines": 6, "scored": 6, "errors": 0}
+        assert records[0]["line"] == 1 and "predicted_growth" in records[0]
+
+    trailing = body + b"garbage"
+    fast = TestClient(fastapi_app).post("/predict/stream", content=trailing, headers=headers)
+    flask = flask_app.test_client().post("/predict/stream", data=trailing, headers=headers)
+    assert fast.status_code == flask.status_code == 400
+    assert "trailing data" in fast.json()["detail"]
+    assert "trailing data" in flask.get_json()["error"]
+
+
+def test_predict_batch_columnar_contract():
+    _ensure_artifacts()
+
+    from youtube_success_ml.api.fastapi_app import app as fastapi_app
+    from youtube_success_ml.api.flask_app import app as flask_app
+
+    items = [
+        {"uploads": 200, "category": "Education", "country": "United States", "age": 4},
+        {"uploads": 1400, "category": " Entertainment ", "country": "India", "age": 9},
+        {"uploads": 0, "category": "Music", "country": "Atlantis", "age": 0},
+    ]
+    columns = {key: [item[key] for item in items] for key in items[0]}
+    fast = TestClient(fastapi_app)
+    flask = flask_app.test_client()
+
+    rows = fast.post("/predict/batch", json={"items": items}).json()
+    for response in (
+        fast.post("/predict/batch/columnar", json=columns),
+        flask.post("/predict/batch/columnar", json=columns),
+    ):
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/json")
+        body = json.loads(response.get_data() if hasattr(response, "get_data") else response.text)
+        for key in ("predicted_subscribers", "predicted_earnings", "predicted_growth"):
+            assert body[key] == [record[key] for record in rows["records"]]
+        assert body["summary"]["count"] == 3
+        assert body["summary"].keys() == rows["summary"].keys()
+
+    uneven = {**columns, "age": [4, 9]}
+    out_of_range = {**columns, "uploads": [200, 1400, 2_000_001]}
+    blank = {**columns, "country": ["India", "", "India"]}
+    for payload in (uneven, out_of_range, blank, {**columns, "uploads": []}):
+        assert fast.post("/predict/batch/columnar", json=payload).status_code == 422
+        assert flask.post("/predict/batch/columnar", json=payload).status_code == 400
+
+
+def test_fastapi_arrow_content_negotiation():
+    pa = pytest.importorskip("pyarrow")
+    _ensure_artifacts()
+
+    from youtube_success_ml.api.fastapi_app import app
+    from youtube_success_ml.api.serialization import ARROW_STREAM_MEDIA_TYPE, dumps_arrow
+
+    client = TestClient(app)
+    arrow = {"Accept": ARROW_STREAM_MEDIA_TYPE}
+    columns = {
+        "uploads": [200, 1400],
+        "category": ["Education", "Entertainment"],
+        "country": ["United States", "India"],
+        "age": [4, 9],
+    }
+    expected = client.post("/predict/batch/columnar", json=columns).json()
+
+    response = client.post(
+        "/predict/batch/columnar",
+        content=dumps_arrow(columns),
+        headers={**arrow, "Content-Type": ARROW_STREAM_MEDIA_TYPE},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert json.loads(table.schema.metadata[b"summary"]) == expected["summary"]
+    for key, values in table.to_pydict().items():
+        assert values == expected[key]
+
+    items = [dict(zip(columns, row, strict=True)) for row in zip(*columns.values(), strict=True)]
+    batch = client.post("/predict/batch", json={"items": items}, headers=arrow)
+    assert pa.ipc.open_stream(batch.content).read_all().to_pydict() == {
+        key: expected[key] for key in table.column_names
+    }
+
+    bad = client.post(
+        "/predict/batch/columnar",
+        content=dumps_arrow({**columns, "age": [4, 101]}),
+        headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE},
+    )
+    assert bad.status_code == 422
+    assert (
+        client.post(
+            "/predict/batch", json={"items": items}, headers={"Accept": "text/csv"}
+        ).status_code
+        == 406
+    )
+
+    for path in ("/analytics/upload-growth-buckets", "/maps/country-metrics"):
+        records = client.get(path).json()["records"]
+        table = pa.ipc.open_stream(client.get(path, headers=arrow).content).read_all()
+        assert table.to_pylist() == records
+
+    json_sample = client.get("/data/processed-sample?limit=5")
+    arrow_sample = client.get("/data/processed-sample?limit=5", headers=arrow)
+    assert arrow_sample.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+    assert arrow_sample.headers["vary"].startswith("Accept, Accept-Encoding")
+    assert arrow_sample.headers["etag"] != json_sample.headers["etag"]
+    table = pa.ipc.open_stream(arrow_sample.content).read_all()
+    assert table.to_pylist() == json_sample.json()["records"]
+    revalidated = client.get(
+        "/data/processed-sample?limit=5",
+        headers={**arrow, "If-None-Match": arrow_sample.headers["etag"]},
+    )
+    assert revalidated.status_code == 304
+
+
 def test_flask_advanced_contracts():
     _ensure_artifacts()
 
@@ -234,6 +445,20 @@ def test_flask_advanced_contracts():
     assert batch.status_code == 200
     assert batch.get_json()["summary"]["count"] == 2
 
+    rec_batch = client.post(
+        "/predict/recommendation/batch",
+        json={"items": [{"uploads": 100, "category": "Music", "country": "India", "age": 3}]},
+    )
+    assert rec_batch.status_code == 200
+    assert rec_batch.get_json()["records"][0]["risk_level"] in {"low", "medium", "high"}
+
+    assign = client.post(
+        "/clusters/assign",
+        json={"items": [{"uploads": 300, "subscribers": 2e6, "earnings": 1e5, "growth": 4e4}]},
+    )
+    assert assign.status_code == 200
+    assert isinstance(assign.get_json()["records"][0]["cluster_id"], int)
+
     fi = client.get("/predict/feature-importance?target=subscribers&top_n=5")
     assert fi.status_code == 200
     assert len(fi.get_json()["records"]) == 5
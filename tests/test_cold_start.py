@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from youtube_success_ml.config import COLD_START_BUDGET_SECONDS
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+DEFERRED_MODULES = ("sklearn", "scipy", "joblib", "pandas", "pyarrow", "plotly", "folium")
+
+
+@pytest.mark.parametrize(
+    "module", ["youtube_success_ml.api.fastapi_app", "youtube_success_ml.api.flask_app"]
+)
+def test_api_app_import_stays_within_cold_start_budget(module: str):
+    probe = (
+        f"import sys; import {module}; from youtube_success_ml import config; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules)); "
+        "print(config.project_root.cache_info().misses)"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(SRC_DIR), os.getenv("PYTHONPATH", "")])}
+
+    start = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True, env=env
+    )
+    elapsed = time.perf_counter() - start
+
+    loaded, root_lookups = out.stdout.splitlines()[-2:]
+    assert loaded == "", f"importing {module} loaded {loaded}"
+    # Path settings resolve on first use, not at import.
+    assert root_lookups == "0"
+    assert elapsed <= COLD_START_BUDGET_SECONDS, (
+        f"importing {module} took {elapsed:.2f}s (budget {COLD_START_BUDGET_SECONDS}s); "
+        "run scripts/benchmarks/bench_import_time.py for the per-module breakdown"
+    )
@@ -0,0 +1,113 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from youtube_success_ml.config import TrainingConfig
+from youtube_success_ml.data.loader import load_dataset
+from youtube_success_ml.mlops.drift_monitor import DriftMonitor
+from youtube_success_ml.models.compiled import (
+    batch_predict_compiled,
+    compile_supervised_bundle,
+    predict_compiled,
+)
+from youtube_success_ml.models.supervised import (
+    FEATURE_COLUMNS,
+    batch_predict_from_bundle,
+    predict_from_bundle,
+    train_supervised_bundle,
+)
+from youtube_success_ml.schemas import ColumnarPredictionRequest, PredictionRequest
+from youtube_success_ml.services.intelligence_service import IntelligenceService
+
+
+@pytest.fixture(scope="module")
+def trained(tmp_path_factory: pytest.TempPathFactory):
+    df = load_dataset()
+    model_dir: Path = tmp_path_factory.mktemp("compiled")
+    bundle = train_supervised_bundle(
+        df, config=TrainingConfig(n_estimators=15), model_dir=model_dir
+    )
+    return df, bundle
+
+
+def _as_matrix(records: list[dict[str, float]]) -> np.ndarray:
+    return np.array([[r[k] for k in sorted(r)] for r in records])
+
+
+def test_compiled_engine_matches_sklearn_batch(trained):
+    df, bundle = trained
+    compiled = compile_supervised_bundle(bundle)
+    payloads = df[FEATURE_COLUMNS].head(300).to_dict(orient="records")
+    payloads.append({"uploads": 10, "category": "NotACategory", "country": "Atlantis", "age": 1})
+
+    expected = _as_matrix(batch_predict_from_bundle(bundle, payloads))
+    actual = _as_matrix(batch_predict_compiled(compiled, payloads))
+    np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-6)
+
+
+def test_compiled_engine_matches_sklearn_single_row(trained):
+    _, bundle = trained
+    compiled = compile_supervised_bundle(bundle)
+    payload = {"uploads": 750, "category": "Music", "country": "India", "age": 9}
+
+    expected = predict_from_bundle(bundle, payload)
+    actual = predict_compiled(compiled, payload)
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-6)
+
+
+def test_intelligence_service_engine_selection(trained):
+    _, bundle = trained
+    request = PredictionRequest(uploads=320, category="Education", country="India", age=4)
+
+    sklearn_service = IntelligenceService(supervised=bundle, clustering=None, baseline=None)
+    compiled_service = IntelligenceService(
+        supervised=bundle, clustering=None, baseline=None, engine="compiled"
+    )
+
+    assert sklearn_service.compiled is None
+    assert compiled_service.compiled is not None
+    expected = sklearn_service.predict(request)
+    for key, value in compiled_service.predict(request).items():
+        assert value == pytest.approx(expected[key], rel=1e-9, abs=1e-6)
+
+    with pytest.raises(ValueError):
+        IntelligenceService(supervised=bundle, clustering=None, baseline=None, engine="onnx")
+
+
+@pytest.mark.parametrize("engine", ["sklearn", "compiled"])
+def test_columnar_batch_matches_row_batch(trained, engine):
+    df, bundle = trained
+    rows = df[FEATURE_COLUMNS].head(120).to_dict(orient="records")
+    rows.append({"uploads": 10, "category": "NotACategory", "country": "Atlantis", "age": 1})
+    requests = [PredictionRequest(**row) for row in rows]
+    columnar = ColumnarPredictionRequest(
+        **{column: [getattr(r, column) for r in requests] for column in FEATURE_COLUMNS}
+    )
+    baseline = {
+        "numeric": {"uploads": {"mean": 1.0, "std": 1.0}, "age": {"mean": 1.0, "std": 1.0}},
+        "categorical": {"category": {}, "country": {}},
+    }
+    row_monitor, column_monitor = DriftMonitor(baseline), DriftMonitor(baseline)
+
+    row_service = IntelligenceService(
+        supervised=bundle, clustering=None, baseline=None, engine=engine, drift_monitor=row_monitor
+    )
+    column_service = IntelligenceService(
+        supervised=bundle,
+        clustering=None,
+        baseline=None,
+        engine=engine,
+        drift_monitor=column_monitor,
+    )
+    expected = row_service.predict_batch(requests)
+    actual = column_service.predict_columns(columnar)
+
+    for key in ("predicted_subscribers", "predicted_earnings", "predicted_growth"):
+        np.testing.assert_array_equal(actual[key], [r[key] for r in expected["records"]])
+    assert actual["summary"]["count"] == expected["summary"]["count"] == len(rows)
+    for key, value in expected["summary"].items():
+        assert actual["summary"][key] == pytest.approx(value, rel=1e-12)
+    assert column_monitor.snapshot() == row_monitor.snapshot()
@@ -1,4 +1,8 @@
-from youtube_success_ml.data.loader import load_dataset
+import pandas as pd
+import pytest
+
+from youtube_success_ml.data import loader
+from youtube_success_ml.data.loader import load_dataset, load_raw_dataset
 
 
 def test_load_dataset_has_required_columns():
@@ -17,3 +21,43 @@ def test_load_dataset_has_required_columns():
     assert required.issubset(set(df.columns))
     assert len(df) > 500
     assert df["age"].min() >= 0
+
+
+@pytest.mark.parametrize("columnar_cache", [False, True])
+def test_column_projection_matches_full_load(columnar_cache, tmp_path, monkeypatch):
+    if columnar_cache:
+        pytest.importorskip("pyarrow")
+    monkeypatch.setattr(loader, "DATASET_CACHE_ENABLED", columnar_cache)
+    monkeypatch.setattr(loader, "DATASET_CACHE_DIR", tmp_path)
+    columns = ["growth_target", "country", "age", "uploads"]
+
+    projected = load_dataset(columns=columns)
+    assert list(projected.columns) == columns
+    pd.testing.assert_frame_equal(projected, load_dataset()[columns])
+
+    raw = load_raw_dataset(columns=["created_year", "category", "not_a_column"])
+    assert list(raw.columns) == ["created_year", "category"]
+
+
+def test_projected_cache_miss_parses_only_the_requested_columns(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    monkeypatch.setattr(loader, "DATASET_CACHE_ENABLED", True)
+    monkeypatch.setattr(loader, "DATASET_CACHE_DIR", tmp_path)
+    parse_csv = loader._parse_csv
+    parsed = []
+
+    def spy(file_path, columns=None):
+        parsed.append(columns)
+        return parse_csv(file_path, columns)
+
+    monkeypatch.setattr(loader, "_parse_csv", spy)
+    columns = ["uploads", "country"]
+
+    cold = load_raw_dataset(columns=columns)
+    assert parsed == [columns]
+    assert not list(tmp_path.glob("*.parquet"))
+
+    load_raw_dataset()
+    warm = load_raw_dataset(columns=columns)
+    assert parsed == [columns, None]
+    pd.testing.assert_frame_equal(warm, cold)
@@ -0,0 +1,96 @@
+import os
+import shutil
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from youtube_success_ml.data import cache as cache_module
+from youtube_success_ml.data.cache import DatasetCache
+from youtube_success_ml.data.loader import load_dataset, load_raw_dataset, resolve_data_path
+
+
+def _dataset_copy(tmp_path):
+    target = tmp_path / "dataset.csv"
+    shutil.copyfile(resolve_data_path(), target)
+    return target
+
+
+def test_dataset_cache_matches_loader_and_revalidates_on_change(tmp_path):
+    path = _dataset_copy(tmp_path)
+    cache = DatasetCache()
+
+    first = cache.processed(path)
+    pd.testing.assert_frame_equal(first, load_dataset(path))
+    pd.testing.assert_frame_equal(cache.raw(path), load_raw_dataset(path))
+    cache.processed(path)
+    assert cache.stats() == {"hits": 2, "loads": 2, "size": 2}
+
+    # Handlers may add or replace columns without touching the shared frame...
+    first["upload_bucket"] = "x"
+    first["age"] = first["age"].clip(upper=0)
+    again = cache.processed(path)
+    assert "upload_bucket" not in again.columns
+    assert again["age"].max() > 0
+    # ...but the cached values themselves are read-only.
+    with pytest.raises(ValueError, match="read-only"):
+        first["uploads"].to_numpy()[0] = -1
+    with pytest.raises(ValueError, match="read-only"):
+        first["category"].cat.codes.to_numpy()[0] = 0
+    assert again.loc[0, "uploads"] != -1
+
+    with path.open("a", encoding="latin-1") as handle:
+        handle.write("\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cache.processed(path)
+    assert cache.stats()["loads"] == 4
+
+
+def test_dataset_cache_single_flight_under_concurrency(tmp_path, monkeypatch):
+    path = _dataset_copy(tmp_path)
+    calls = []
+
+    def slow_load(p, columns=None):
+        calls.append(p)
+        time.sleep(0.2)
+        return load_raw_dataset(p, columns)
+
+    monkeypatch.setattr(cache_module, "load_raw_dataset", slow_load)
+    cache = DatasetCache()
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.raw(path))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(results) == 8
+
+
+def test_columnar_cache_is_reused_until_source_changes(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+    from youtube_success_ml.data import loader
+
+    path = _dataset_copy(tmp_path)
+    cache_dir = tmp_path / "columnar"
+    monkeypatch.setattr(loader, "DATASET_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(loader, "DATASET_CACHE_ENABLED", True)
+
+    cold = load_raw_dataset(path)
+    (cached_file,) = cache_dir.glob("*.parquet")
+    assert isinstance(cold["country"].dtype, pd.CategoricalDtype)
+
+    parse_csv = loader._parse_csv
+    monkeypatch.setattr(loader, "_parse_csv", lambda _: pytest.fail("CSV reparsed"))
+    warm = load_raw_dataset(path)
+    pd.testing.assert_frame_equal(warm, cold)
+    monkeypatch.setattr(loader, "_parse_csv", parse_csv)
+
+    text = path.read_text(encoding="latin-1").splitlines(keepends=True)
+    path.write_text("".join(text[:-1]), encoding="latin-1")
+    assert len(load_raw_dataset(path)) == len(cold) - 1
+    (rebuilt,) = cache_dir.glob("*.parquet")
+    assert rebuilt != cached_file
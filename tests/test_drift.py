@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+
+from youtube_success_ml.mlops.drift import (
+    build_training_baseline,
+    check_feature_drift,
+    check_feature_drift_columns,
+    load_training_baseline,
+    save_training_baseline,
+)
+
+BASELINE = {
+    "numeric": {"uploads": {"mean": 100.0, "std": 10.0}, "age": {"mean": 5.0, "std": 1.0}},
+    "categorical": {
+        "category": {"Music": 0.6, "Education": 0.395, "Pets": 0.005},
+        "country": {"India": 0.5, "United States": 0.5},
+    },
+}
+
+
+def _reference_drift(items, baseline, z_threshold, min_frequency):
+    """Row-at-a-time scoring the columnar implementation must reproduce."""
+    records = []
+    for idx, item in enumerate(items):
+        warnings = []
+        for col in ("uploads", "age"):
+            stats = baseline["numeric"][col]
+            z = abs((float(item[col]) - stats["mean"]) / max(stats["std"], 1e-9))
+            if z > z_threshold:
+                warnings.append(f"{col}: high z-score {z:.2f}")
+        for col in ("category", "country"):
+            value = str(item[col])
+            frequency = float(baseline["categorical"][col].get(value, 0.0))
+            if frequency < min_frequency:
+                warnings.append(f"{col}: low-frequency category '{value}' ({frequency:.4f})")
+        severity = "high" if len(warnings) >= 2 else "medium" if warnings else "low"
+        records.append({"index": idx, "warnings": warnings, "severity": severity})
+    return records
+
+
+def test_columnar_drift_matches_row_reference():
+    rng = np.random.default_rng(3)
+    items = [
+        {
+            "uploads": int(rng.integers(0, 250)),
+            "age": int(rng.integers(0, 12)),
+            "category": str(rng.choice(["Music", "Education", "Pets", "Unknown"])),
+            "country": str(rng.choice(["India", "United States", "Atlantis"])),
+        }
+        for _ in range(2000)
+    ]
+
+    for z_threshold, min_frequency in ((3.0, 0.01), (1.0, 0.5), (10.0, 0.0)):
+        result = check_feature_drift(items, BASELINE, z_threshold, min_frequency)
+        expected = _reference_drift(items, BASELINE, z_threshold, min_frequency)
+        assert result["records"] == expected
+        severe = sum(r["severity"] == "high" for r in expected)
+        assert result["summary"] == {
+            "total_records": len(items),
+            "high_severity_records": severe,
+            "is_drift_risk": severe > 0,
+        }
+
+
+def test_columnar_drift_accepts_arrays():
+    result = check_feature_drift_columns(
+        {
+            "uploads": np.array([100.0, 500.0]),
+            "age": np.array([5.0, 5.0]),
+            "category": np.array(["Music", "Pets"], dtype=object),
+            "country": ["India", "India"],
+        },
+        BASELINE,
+    )
+    assert [r["severity"] for r in result["records"]] == ["low", "high"]
+    assert result["records"][1]["warnings"] == [
+        "uploads: high z-score 40.00",
+        "category: low-frequency category 'Pets' (0.0050)",
+    ]
+
+
+def test_distribution_drift_scores_shifted_batches(tmp_path):
+    rng = np.random.default_rng(11)
+    train = pd.DataFrame(
+        {
+            "uploads": rng.poisson(300, size=20_000),
+            "category": rng.choice(
+                ["Music", "Education", "Gaming"], size=20_000, p=[0.5, 0.3, 0.2]
+            ),
+            "country": rng.choice(["India", "United States"], size=20_000),
+            "age": rng.integers(0, 15, size=20_000),
+        }
+    )
+    path = save_training_baseline(build_training_baseline(train), tmp_path / "baseline.json")
+    baseline = load_training_baseline(path)
+    assert "distributions" not in path.read_text()
+    assert len(baseline["distributions"]["uploads"]["histogram"]["proportions"]) == 10
+
+    def batch(uploads_mean, categories):
+        return {
+            "uploads": rng.poisson(uploads_mean, size=400).astype(float),
+            "age": rng.integers(0, 15, size=400).astype(float),
+            "category": rng.choice(categories, size=400),
+            "country": rng.choice(["India", "United States"], size=400),
+        }
+
+    same = check_feature_drift_columns(batch(300, ["Music", "Education", "Gaming"]), baseline)
+    assert not any(feature["drifted"] for feature in same["distribution"].values())
+
+    shifted = check_feature_drift_columns(batch(330, ["Gaming"]), baseline)["distribution"]
+    assert shifted["uploads"]["drifted"] and shifted["uploads"]["ks"] > 0.3
+    assert shifted["category"]["drifted"] and shifted["category"]["ks"] is None
+    assert not shifted["age"]["drifted"]
+    assert "distribution" not in check_feature_drift_columns(batch(300, ["Music"]), BASELINE)
@@ -0,0 +1,101 @@
+import numpy as np
+
+from youtube_success_ml.mlops.drift_monitor import (
+    DriftMonitor,
+    _SlidingCounts,
+    _SlidingMoments,
+    population_stability_index,
+)
+
+BASELINE = {
+    "numeric": {"uploads": {"mean": 100.0, "std": 10.0}, "age": {"mean": 5.0, "std": 1.0}},
+    "categorical": {
+        "category": {"Music": 0.5, "Education": 0.5},
+        "country": {"India": 0.5, "United States": 0.5},
+    },
+}
+
+
+def _payloads(n, rng, category="Music", uploads_mean=100.0):
+    return [
+        {
+            "uploads": float(rng.normal(uploads_mean, 10.0)),
+            "age": float(rng.normal(5.0, 1.0)),
+            "category": category if category else ("Music", "Education")[i % 2],
+            "country": ("India", "United States")[i % 2],
+        }
+        for i in range(n)
+    ]
+
+
+def test_sliding_moments_match_numpy_over_last_window():
+    rng = np.random.default_rng(7)
+    values = rng.normal(50.0, 20.0, size=2_500)
+    moments = _SlidingMoments(300)
+    for value in values:
+        moments.push(float(value))
+
+    window = values[-300:]
+    assert moments.count == 300
+    assert np.isclose(moments.mean, window.mean())
+    assert np.isclose(moments.std, window.std(ddof=1))
+
+
+def test_sliding_moments_do_not_accumulate_rounding_error():
+    # Huge values followed by small, tight ones: the sliding updates alone leave the
+    # variance of the later window off by orders of magnitude.
+    rng = np.random.default_rng(3)
+    values = np.concatenate([rng.normal(1e12, 1e9, size=1_000), rng.normal(5.0, 0.01, size=1_000)])
+    moments = _SlidingMoments(256)
+    for value in values:
+        moments.push(float(value))
+
+    window = values[-256:]
+    assert np.isclose(moments.mean, window.mean())
+    assert np.isclose(moments.std, window.std(ddof=1))
+
+
+def test_monitor_counts_categories_as_the_model_sees_them():
+    monitor = DriftMonitor(BASELINE, window_size=10)
+    monitor.observe({"uploads": 1.0, "age": 1.0, "category": " Music ", "country": "India\t"})
+    monitor.observe_columns(
+        {"uploads": [1.0], "age": [1.0], "category": ["Music"], "country": [" India"]}
+    )
+
+    assert monitor._categorical["category"].counts == {"Music": 2}
+    assert monitor._categorical["country"].counts == {"India": 2}
+
+
+def test_sliding_counts_stay_bounded_by_window():
+    counts = _SlidingCounts(50)
+    for i in range(10_000):
+        counts.push(f"category-{i}")
+
+    assert counts.count == 50
+    assert len(counts.counts) == 50
+    assert sum(counts.counts.values()) == 50
+    assert population_stability_index({"a": 0.5, "b": 0.5}, {"a": 0.5, "b": 0.5}) == 0.0
+
+
+def test_monitor_alerts_on_shifted_traffic_only_after_min_samples():
+    rng = np.random.default_rng(11)
+    monitor = DriftMonitor(BASELINE, window_size=1_000, min_samples=200)
+
+    monitor.observe_many(_payloads(100, rng, category="Music", uploads_mean=160.0))
+    early = monitor.snapshot()
+    assert early["window_samples"] == 100
+    assert not any(f["alert"] for f in early["features"].values())
+
+    monitor.observe_many(_payloads(900, rng, category="Music", uploads_mean=160.0))
+    shifted = monitor.snapshot()["features"]
+    assert shifted["uploads"]["alert"] and shifted["uploads"]["method"] == "z"
+    assert shifted["category"]["alert"] and shifted["category"]["method"] == "psi"
+    assert not shifted["age"]["alert"]
+    assert not shifted["country"]["alert"]
+
+    # Fresh in-distribution traffic pushes the drifted requests out of the window.
+    monitor.observe_many(_payloads(1_000, rng, category=None))
+    recovered = monitor.snapshot()
+    assert recovered["observed_total"] == 2_000
+    assert not any(f["alert"] for f in recovered["features"].values())
+    assert 'prediction_drift_alert{feature="uploads"} 0' in monitor.render_metrics()
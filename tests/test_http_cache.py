@@ -0,0 +1,101 @@
+import gzip
+import json
+import os
+import shutil
+
+from youtube_success_ml.api.http_cache import (
+    CachedBody,
+    MapPageCache,
+    ResponseCache,
+    RunVersionTracker,
+    conditional_response,
+    etag_matches,
+    negotiate_encoding,
+)
+from youtube_success_ml.data.cache import file_digest
+from youtube_success_ml.data.loader import load_dataset, resolve_data_path
+from youtube_success_ml.visualization.maps import MAP_PAGES, export_map_assets
+
+
+def test_encoding_negotiation_and_conditional_responses():
+    body = CachedBody.from_text("<html>" + "map " * 500 + "</html>")
+    assert gzip.decompress(body.encoded["gzip"]) == body.identity
+
+    assert negotiate_encoding("gzip, deflate", body.encoded) == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity", body.encoded) is None
+    assert negotiate_encoding("*", {"gzip": b""}) == "gzip"
+    assert negotiate_encoding(None, body.encoded) is None
+    assert negotiate_encoding("br;q=0.5, gzip;q=0.8", {"br": b"", "gzip": b""}) == "gzip"
+
+    etag = body.etag("gzip")
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(body.etag(None), etag)
+
+    status, payload, headers = conditional_response(body, "gzip", None)
+    assert (status, headers["Content-Encoding"]) == (200, "gzip")
+    assert payload == body.encoded["gzip"]
+    status, payload, headers = conditional_response(body, "gzip", etag)
+    assert (status, payload) == (304, b"")
+    assert "Content-Encoding" not in headers and headers["ETag"] == etag
+
+
+def test_map_page_cache_renders_once_and_prewarms_from_exports(tmp_path):
+    path = tmp_path / "dataset.csv"
+    shutil.copyfile(resolve_data_path(), path)
+
+    cache = MapPageCache(map_dir=tmp_path / "empty")
+    first = cache.get("earnings_choropleth", path)
+    assert cache.get("earnings_choropleth", path) is first
+    assert cache.stats() == {"hits": 1, "renders": 1, "prewarmed": 0}
+
+    map_dir = tmp_path / "maps"
+    export_map_assets(load_dataset(path), output_dir=map_dir, data_sha256=file_digest(path))
+    warmed = MapPageCache(map_dir=map_dir)
+    assert warmed.prewarm(path) == len(MAP_PAGES)
+    page = warmed.get("category_dominance_map", path)
+    assert b"<html" in page.identity
+    assert warmed.stats()["renders"] == 0
+
+    # Exports for other data are ignored.
+    with path.open("a", encoding="latin-1") as handle:
+        handle.write("\n")
+    assert MapPageCache(map_dir=map_dir).prewarm(path) == 0
+
+
+def test_response_cache_keys_on_run_version(tmp_path):
+    manifest_path, registry_path = tmp_path / "manifest.json", tmp_path / "registry.json"
+    tracker = RunVersionTracker(manifest_path, registry_path)
+    assert tracker.current() is None
+
+    manifest_path.write_text(json.dumps({"run_id": "r1", "artifact_hashes": {"a": "x"}}))
+    registry_path.write_text(json.dumps({"active_run_id": "r1", "runs": []}))
+    first = tracker.current()
+    assert tracker.current() is first
+
+    cache, builds = ResponseCache(), []
+
+    def build():
+        builds.append(1)
+        return manifest_path.read_text()
+
+    status, payload, headers = cache.respond("/m", first.token, build, {}, first.last_modified)
+    assert status == 200 and json.loads(payload)["run_id"] == "r1"
+    etag = headers["ETag"]
+    assert cache.respond("/m", first.token, build, {"if-none-match": etag})[0] == 304
+    assert cache.respond("/m", first.token, build, {"accept-encoding": "gzip"})[2]["ETag"] != etag
+    since = {"if-modified-since": headers["Last-Modified"]}
+    assert cache.respond("/m", first.token, build, since, first.last_modified)[0] == 304
+
+    # A fresh process answers a matching validator without building the body.
+    assert ResponseCache().respond("/m", first.token, build, {"if-none-match": etag})[0] == 304
+    assert len(builds) == 1
+
+    manifest_path.write_text(json.dumps({"run_id": "r2", "artifact_hashes": {"a": "y"}}))
+    stat = manifest_path.stat()
+    os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    second = tracker.current()
+    assert second.token != first.token
+    status, payload, headers = cache.respond("/m", second.token, build, {"if-none-match": etag})
+    assert status == 200 and json.loads(payload)["run_id"] == "r2"
+    assert headers["ETag"] != etag and len(builds) == 2
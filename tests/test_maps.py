@@ -18,5 +18,7 @@ def test_map_builders_return_objects():
     assert earnings is not None
     assert dominance is not None
     assert len(metrics) > 0
+    # Categorical keys must not expand into unobserved country/abbreviation pairs.
+    assert len(metrics) == df.loc[df["country"] != "Unknown", "country"].nunique()
     assert "latitude" in metrics[0]
     assert "longitude" in metrics[0]
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from youtube_success_ml.api.batching import Histogram, MicroBatcher
+
+
+def test_microbatcher_coalesces_concurrent_submissions():
+    batches: list[list[int]] = []
+
+    def score(items: list[int]) -> list[int]:
+        batches.append(list(items))
+        return [item * 10 for item in items]
+
+    batcher = MicroBatcher(score, max_batch_size=4, max_wait_ms=50)
+
+    async def run() -> list[int]:
+        return await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+
+    results = asyncio.run(run())
+
+    assert results == [i * 10 for i in range(10)]
+    assert [len(b) for b in batches] == [4, 4, 2]
+    assert "prediction_microbatch_size_count 3" in batcher.render_metrics()
+
+    # A fresh event loop (as with a new TestClient portal) gets a fresh worker.
+    assert asyncio.run(run()) == [i * 10 for i in range(10)]
+
+
+def test_microbatcher_propagates_scoring_errors_to_every_caller():
+    def score(items: list[int]) -> list[int]:
+        raise RuntimeError("model unavailable")
+
+    batcher = MicroBatcher(score, max_batch_size=8, max_wait_ms=5)
+
+    async def run() -> list[object]:
+        return await asyncio.gather(*(batcher.submit(i) for i in range(3)), return_exceptions=True)
+
+    outcomes = asyncio.run(run())
+    assert all(isinstance(o, RuntimeError) for o in outcomes)
+
+    with pytest.raises(ValueError):
+        MicroBatcher(score, max_batch_size=0)
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram(buckets=(1, 4))
+    for value in (1, 3, 9):
+        histogram.observe(value)
+
+    lines = histogram.render("demo", "Demo histogram")
+    assert 'demo_bucket{le="1"} 1' in lines
+    assert 'demo_bucket{le="4"} 2' in lines
+    assert 'demo_bucket{le="+Inf"} 3' in lines
+    assert "demo_sum 13" in lines
@@ -0,0 +1,151 @@
+import shutil
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from youtube_success_ml.config import TrainingConfig
+from youtube_success_ml.data.loader import load_dataset
+from youtube_success_ml.models.clustering import train_clustering_bundle
+from youtube_success_ml.models.supervised import (
+    batch_predict_from_bundle,
+    load_supervised_bundle,
+    train_supervised_bundle,
+)
+from youtube_success_ml.score import _prepare_parts_dir, score_file
+
+
+@pytest.fixture(scope="module")
+def model_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    model_dir = tmp_path_factory.mktemp("score-models")
+    df = load_dataset()
+    config = TrainingConfig(n_estimators=5)
+    train_supervised_bundle(df, config=config, model_dir=model_dir)
+    train_clustering_bundle(df, config=config, model_dir=model_dir)
+    return model_dir
+
+
+@pytest.fixture(scope="module")
+def channels() -> pd.DataFrame:
+    frame = load_dataset()[["uploads", "category", "country", "age"]].head(250).copy()
+    frame.insert(0, "channel_id", range(len(frame)))
+    return frame
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_score_file_preserves_input_order(model_dir, channels, tmp_path, workers):
+    input_path = tmp_path / "channels.csv"
+    channels.to_csv(input_path, index=False)
+    output_path = tmp_path / "scored.csv"
+
+    report = score_file(
+        input_path,
+        output_path,
+        model_dir=model_dir,
+        chunksize=40,
+        workers=workers,
+        with_clusters=True,
+    )
+
+    scored = pd.read_csv(output_path)
+    assert report["rows_scored"] == len(channels) == len(scored)
+    assert report["chunks"] == 7
+    assert scored["channel_id"].tolist() == channels["channel_id"].tolist()
+    assert {"kmeans_cluster", "archetype"} <= set(scored.columns)
+    assert not output_path.with_name("scored.csv.parts").exists()
+
+    expected = batch_predict_from_bundle(
+        load_supervised_bundle(model_dir),
+        channels[["uploads", "category", "country", "age"]].to_dict("records"),
+    )
+    assert scored["predicted_growth"].tolist() == pytest.approx(
+        [r["predicted_growth"] for r in expected]
+    )
+
+
+def test_score_file_resumes_from_existing_parts(model_dir, channels, tmp_path):
+    input_path = tmp_path / "channels.csv"
+    channels.to_csv(input_path, index=False)
+    output_path = tmp_path / "scored.csv"
+    parts_dir = tmp_path / "scored.csv.parts"
+
+    score_file(input_path, output_path, model_dir=model_dir, chunksize=100, workers=1)
+    full = pd.read_csv(output_path)
+
+    # Simulate an interrupted run that had finished only the first chunk.
+    settings = {"with_clusters": False, "restart": False, "model_dir": model_dir}
+    _prepare_parts_dir(parts_dir, input_path, 100, engine="sklearn", **settings)
+    full.head(100).assign(predicted_growth=-1.0).to_csv(parts_dir / "part-000000.csv", index=False)
+
+    report = score_file(input_path, output_path, model_dir=model_dir, chunksize=100, workers=1)
+    resumed = pd.read_csv(output_path)
+    assert report["resumed_chunks"] == 1
+    assert report["rows_scored"] == len(channels) - 100
+    assert (resumed["predicted_growth"].head(100) == -1.0).all()
+    assert resumed.iloc[100:].equals(full.iloc[100:])
+
+    _prepare_parts_dir(parts_dir, input_path, 100, engine="sklearn", **settings)
+    with pytest.raises(ValueError, match="--restart"):
+        score_file(input_path, output_path, model_dir=model_dir, chunksize=50, workers=1)
+    with pytest.raises(ValueError, match="--restart"):
+        score_file(input_path, output_path, model_dir=model_dir, chunksize=100, engine="compiled")
+
+    # A retrained model in the same directory must not be mixed into earlier parts.
+    retrained = tmp_path / "models"
+    shutil.copytree(model_dir, retrained)
+    _prepare_parts_dir(
+        parts_dir,
+        input_path,
+        100,
+        engine="sklearn",
+        **{**settings, "model_dir": retrained, "restart": True},
+    )
+    with (retrained / "supervised_bundle.joblib").open("ab") as handle:
+        handle.write(b"\0")
+    with pytest.raises(ValueError, match="--restart"):
+        score_file(input_path, output_path, model_dir=retrained, chunksize=100, workers=1)
+
+
+def test_score_file_reads_and_writes_parquet(model_dir, channels, tmp_path):
+    pytest.importorskip("pyarrow")
+    input_path = tmp_path / "channels.parquet"
+    channels.to_parquet(input_path, index=False)
+    output_path = tmp_path / "scored.parquet"
+
+    report = score_file(
+        input_path, output_path, model_dir=model_dir, chunksize=64, workers=1, engine="compiled"
+    )
+
+    scored = pd.read_parquet(output_path)
+    assert report["chunks"] == 4
+    assert scored["channel_id"].tolist() == channels["channel_id"].tolist()
+    assert (scored["predicted_subscribers"] >= 0).all()
+
+
+def test_score_file_rejects_unusable_input_before_creating_parts(model_dir, channels, tmp_path):
+    output_path = tmp_path / "scored.csv"
+    parts_dir = tmp_path / "scored.csv.parts"
+    empty, header_only, no_features = (tmp_path / f"{name}.csv" for name in ("e", "h", "n"))
+    empty.write_bytes(b"")
+    channels.head(0).to_csv(header_only, index=False)
+    channels[["channel_id", "uploads"]].to_csv(no_features, index=False)
+
+    for path, message in ((empty, "no rows"), (header_only, "no rows"), (no_features, "missing")):
+        with pytest.raises(ValueError, match=message):
+            score_file(path, output_path, model_dir=model_dir, workers=1)
+        assert not parts_dir.exists()
+
+
+def test_score_file_decodes_csv_with_the_source_encoding(model_dir, channels, tmp_path):
+    input_path = tmp_path / "channels.csv"
+    frame = channels.head(5).assign(country="Côte d'Ivoire")
+    input_path.write_bytes(frame.to_csv(index=False).encode("latin-1"))
+    output_path = tmp_path / "scored.csv"
+
+    score_file(input_path, output_path, model_dir=model_dir, workers=1)
+    assert pd.read_csv(output_path)["country"].tolist() == ["Côte d'Ivoire"] * 5
+
+    utf8_path = tmp_path / "channels-utf8.csv"
+    utf8_path.write_bytes(frame.to_csv(index=False).encode("utf-8"))
+    score_file(utf8_path, output_path, model_dir=model_dir, workers=1, encoding="utf-8")
+    assert pd.read_csv(output_path)["country"].tolist() == ["Côte d'Ivoire"] * 5
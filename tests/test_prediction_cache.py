@@ -0,0 +1,109 @@
+from pathlib import Path
+
+import pytest
+
+from youtube_success_ml.config import TrainingConfig
+from youtube_success_ml.data.loader import load_dataset
+from youtube_success_ml.models.supervised import train_supervised_bundle
+from youtube_success_ml.schemas import PredictionRequest
+from youtube_success_ml.services.intelligence_service import IntelligenceService
+from youtube_success_ml.services.prediction_cache import PredictionCache
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_prediction_cache_evicts_least_recently_used():
+    cache = PredictionCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+def test_prediction_cache_expires_entries_after_ttl():
+    clock = _FakeClock()
+    cache = PredictionCache(max_size=8, ttl_seconds=5, clock=clock)
+    cache.put("a", 1)
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.fixture(scope="module")
+def bundle(tmp_path_factory: pytest.TempPathFactory):
+    model_dir: Path = tmp_path_factory.mktemp("cache")
+    return train_supervised_bundle(
+        load_dataset(), config=TrainingConfig(n_estimators=5), model_dir=model_dir
+    )
+
+
+def test_service_dedupes_batch_rows_and_reuses_cache(bundle):
+    cache = PredictionCache(max_size=16)
+    service = IntelligenceService(
+        supervised=bundle, clustering=None, baseline=None, run_id="run-a", cache=cache
+    )
+    first = PredictionRequest(uploads=100, category="Music", country="India", age=3)
+    second = PredictionRequest(uploads=900, category="Education", country="India", age=7)
+
+    result = service.predict_batch([first, second, first, first])
+    assert result["summary"]["count"] == 4
+    assert result["records"][0] == result["records"][2] == result["records"][3]
+    assert cache.stats()["misses"] == 2
+    assert len(cache) == 2
+
+    assert service.predict(first) == result["records"][0]
+    assert cache.stats()["hits"] == 1
+
+
+def test_service_cache_is_scoped_to_run_id(bundle):
+    cache = PredictionCache(max_size=16)
+    request = PredictionRequest(uploads=100, category="Music", country="India", age=3)
+    old = IntelligenceService(
+        supervised=bundle, clustering=None, baseline=None, run_id="run-a", cache=cache
+    )
+    new = IntelligenceService(
+        supervised=bundle, clustering=None, baseline=None, run_id="run-b", cache=cache
+    )
+
+    old.predict(request)
+    new.predict(request)
+    assert cache.stats()["hits"] == 0
+    assert len(cache) == 2
+
+
+def test_service_cache_is_scoped_to_loaded_bundle(bundle):
+    cache = PredictionCache(max_size=16)
+    request = PredictionRequest(uploads=100, category="Music", country="India", age=3)
+    before, after = (
+        IntelligenceService(
+            supervised=bundle,
+            clustering=None,
+            baseline=None,
+            run_id="run-a",
+            bundle_digest=digest,
+            cache=cache,
+        )
+        for digest in ("aa", "bb")
+    )
+
+    before.predict(request)
+    after.predict(request)
+    assert before.model_token == "run-a:aa"
+    assert cache.stats()["hits"] == 0
+    assert len(cache) == 2
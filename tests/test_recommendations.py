@@ -0,0 +1,24 @@
+import numpy as np
+
+from youtube_success_ml.services.recommendations import (
+    DEFAULT_MESSAGE,
+    EARLY_CHANNEL_MESSAGE,
+    LOW_UPLOADS_MESSAGE,
+    recommendation_lists,
+    risk_levels,
+)
+
+
+def test_risk_levels_use_growth_boundaries():
+    growth = np.array([0, 19_999.9, 20_000, 119_999, 120_000, 5e6])
+    assert risk_levels(growth).tolist() == ["high", "high", "medium", "medium", "low", "low"]
+
+
+def test_recommendation_lists_apply_rules_in_order_with_default():
+    advice = recommendation_lists(
+        uploads=np.array([100.0, 5000.0]),
+        age=np.array([1.0, 10.0]),
+        growth=np.array([1e6, 1e6]),
+        earnings=np.array([5e6, 5e6]),
+    )
+    assert advice == [[LOW_UPLOADS_MESSAGE, EARLY_CHANNEL_MESSAGE], [DEFAULT_MESSAGE]]
@@ -0,0 +1,84 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from youtube_success_ml.api import serialization
+from youtube_success_ml.schemas import ColumnarPredictionRequest
+
+
+def test_dumps_json_encodes_numpy_with_and_without_orjson(monkeypatch):
+    matrix = np.array([[1.5, 2.0, 0.1], [3.25, 4.0, 1e20]])
+    payload = {
+        "values": matrix[:, 0],
+        "contiguous": np.ascontiguousarray(matrix[:, 2]),
+        "summary": {"count": np.int64(2), "mean": np.float64(2.375)},
+    }
+    expected = {
+        "values": [1.5, 3.25],
+        "contiguous": [0.1, 1e20],
+        "summary": {"count": 2, "mean": 2.375},
+    }
+
+    assert json.loads(serialization.dumps_json(payload)) == expected
+    monkeypatch.setattr(serialization, "orjson", None)
+    encoded = serialization.dumps_json(payload)
+    assert b" " not in encoded
+    assert json.loads(encoded) == expected
+
+
+def test_media_type_negotiation(monkeypatch):
+    arrow = serialization.ARROW_STREAM_MEDIA_TYPE
+    negotiate = serialization.negotiate_media_type
+    monkeypatch.setattr(serialization, "arrow_available", lambda: True)
+
+    assert negotiate(None) == "application/json"
+    assert negotiate("*/*") == "application/json"
+    assert negotiate(arrow) == arrow
+    assert negotiate(f"application/json;q=0.9, {arrow}") == arrow
+    assert negotiate(f"{arrow};q=0.5, application/json") == "application/json"
+    assert negotiate(f"{arrow};q=0") is None
+    assert negotiate("text/html") is None
+
+    monkeypatch.setattr(serialization, "arrow_available", lambda: False)
+    assert negotiate(f"{arrow}, application/json;q=0.1") == "application/json"
+    assert negotiate(arrow) is None
+
+
+def test_arrow_round_trip_keeps_numeric_columns_as_numpy():
+    pa = pytest.importorskip("pyarrow")
+
+    columns = {
+        "uploads": np.array([200, 0, 2_000_000]),
+        "category": ["Music", " Education ", "Gaming"],
+        "country": ["India", "India", "Atlantis"],
+        "age": np.array([4, 0, 100], dtype=np.int32),
+    }
+    body = serialization.dumps_arrow(columns, {"summary": {"count": 3}})
+    table = pa.ipc.open_stream(body).read_all()
+    assert json.loads(table.schema.metadata[b"summary"]) == {"count": 3}
+
+    decoded = serialization.loads_arrow_columns(body)
+    assert isinstance(decoded["uploads"], np.ndarray)
+    np.testing.assert_array_equal(decoded["age"], columns["age"])
+    request = ColumnarPredictionRequest.from_arrays(decoded)
+    assert request.category == ["Music", "Education", "Gaming"]
+    assert request.uploads.dtype == np.int64
+
+    frame = pd.DataFrame({"name": ["a", None], "value": [1.5, np.nan]})
+    assert pa.ipc.open_stream(serialization.dumps_arrow(frame)).read_pandas().equals(frame)
+
+    for bad in (
+        {**columns, "age": np.array([4, 0])},
+        {**columns, "uploads": np.array([1.5, 2.0, 3.0])},
+        {**columns, "age": np.array([4, 0, 101])},
+        {**columns, "country": ["India", "", "India"]},
+        {key: value for key, value in columns.items() if key != "country"},
+    ):
+        with pytest.raises(ValueError):
+            ColumnarPredictionRequest.from_arrays(bad)
+    with pytest.raises(ValueError):
+        serialization.loads_arrow_columns(serialization.dumps_arrow({"uploads": [1, None]}))
+    with pytest.raises(ValueError):
+        serialization.loads_arrow_columns(b"not an arrow stream")
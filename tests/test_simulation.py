@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from youtube_success_ml.config import TrainingConfig
+from youtube_success_ml.data.loader import load_dataset
+from youtube_success_ml.models.simulation import downsample_indices, segment_grid
+from youtube_success_ml.models.supervised import batch_predict_from_bundle, train_supervised_bundle
+from youtube_success_ml.schemas import SimulationRequest
+from youtube_success_ml.services.intelligence_service import IntelligenceService
+
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory: pytest.TempPathFactory) -> IntelligenceService:
+    model_dir: Path = tmp_path_factory.mktemp("simulation")
+    bundle = train_supervised_bundle(
+        load_dataset(), config=TrainingConfig(n_estimators=10), model_dir=model_dir
+    )
+    return IntelligenceService(supervised=bundle, clustering=None, baseline=None)
+
+
+def test_segment_grid_groups_points_between_breakpoints():
+    grid = np.arange(0, 10)
+    first_index, point_segment = segment_grid(grid, np.array([2.5, 6.5]))
+
+    assert first_index.tolist() == [0, 3, 7]
+    assert point_segment.tolist() == [0, 0, 0, 1, 1, 1, 1, 2, 2, 2]
+
+
+def test_simulation_matches_per_step_predictions(service: IntelligenceService):
+    request = SimulationRequest(
+        category="Music", country="India", age=7, start_uploads=0, end_uploads=2500, step=9
+    )
+    result = service.simulate(request)
+
+    grid = list(range(0, 2501, 9))
+    expected = [
+        {"uploads": uploads, **pred}
+        for uploads, pred in zip(
+            grid,
+            batch_predict_from_bundle(
+                service.supervised,
+                [{"uploads": u, "category": "Music", "country": "India", "age": 7} for u in grid],
+            ),
+            strict=True,
+        )
+    ]
+    assert result["points"] == expected
+    assert (
+        result["best_uploads_by_growth"]
+        == max(expected, key=lambda r: r["predicted_growth"])["uploads"]
+    )
+    assert (
+        result["best_uploads_by_earnings"]
+        == max(expected, key=lambda r: r["predicted_earnings"])["uploads"]
+    )
+
+
+def test_simulation_downsamples_large_grids(service: IntelligenceService):
+    request = SimulationRequest(
+        category="Education",
+        country="United States",
+        age=4,
+        start_uploads=0,
+        end_uploads=2_000_000,
+        step=1,
+        max_points=100,
+    )
+    result = service.simulate(request)
+
+    assert len(result["points"]) == 100
+    assert result["points"][0]["uploads"] == 0
+    assert result["points"][-1]["uploads"] == 2_000_000
+    assert downsample_indices(5, None).tolist() == [0, 1, 2, 3, 4]
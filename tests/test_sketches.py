@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from youtube_success_ml.mlops.sketches import HyperLogLog, KLLSketch, RunningMoments, hash_values
+
+
+def test_hyperloglog_is_exact_below_limit_and_bounded_above():
+    values = pd.Series(np.arange(200_000) % 150_000)
+    small = HyperLogLog(exact_limit=4096)
+    small.add_hashes(hash_values(values[:3_000]))
+    assert small.is_exact and small.estimate() == 3_000
+
+    sketch = HyperLogLog(precision=12, exact_limit=0)
+    for chunk in np.array_split(values.to_numpy(), 7):
+        sketch.add_hashes(hash_values(pd.Series(chunk)))
+    assert not sketch.is_exact
+    assert abs(sketch.estimate() - 150_000) <= 3 * sketch.relative_error * 150_000
+
+    left, right = HyperLogLog(exact_limit=0), HyperLogLog(exact_limit=0)
+    left.add_hashes(hash_values(values[:120_000]))
+    right.add_hashes(hash_values(values[100_000:]))
+    union = HyperLogLog(exact_limit=0)
+    union.add_hashes(hash_values(values))
+    left.merge(right)
+    np.testing.assert_array_equal(left.registers, union.registers)
+
+
+def test_running_moments_match_numpy_across_chunks():
+    rng = np.random.default_rng(3)
+    values = rng.lognormal(3.0, 1.5, size=50_000)
+    values[::17] = np.nan
+    moments = RunningMoments()
+    for chunk in np.array_split(values, 9):
+        moments.update(chunk)
+
+    clean = values[~np.isnan(values)]
+    assert moments.count == len(clean)
+    assert moments.mean == pytest.approx(clean.mean())
+    assert moments.std == pytest.approx(clean.std(ddof=1))
+    assert (moments.min, moments.max) == (clean.min(), clean.max())
+
+    counted = RunningMoments()
+    counted.update_counts(pd.Series([3, 1, 2], index=[10, 20, 35]))
+    assert counted.summary() == pytest.approx(
+        pd.Series([10, 10, 10, 20, 35, 35]).describe()[["mean", "std", "min", "max"]].to_dict()
+    )
+
+
+def test_kll_sketch_ranks_merge_and_round_trip():
+    rng = np.random.default_rng(5)
+    values = rng.lognormal(2.0, 1.0, size=200_000)
+    sketch = KLLSketch(k=200)
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+    assert sketch.n == len(values)
+    assert sum(len(items) for items in sketch.levels) < 1_000
+
+    ordered = np.sort(values)
+    probes = np.quantile(values, [0.01, 0.1, 0.5, 0.9, 0.99])
+    true_cdf = np.searchsorted(ordered, probes, side="right") / len(values)
+    assert np.abs(sketch.cdf(probes) - true_cdf).max() < 0.02
+    ranks = np.searchsorted(ordered, sketch.quantile(np.array([0.1, 0.5, 0.9]))) / len(values)
+    np.testing.assert_allclose(ranks, [0.1, 0.5, 0.9], atol=0.02)
+
+    left, right = KLLSketch(seed=1), KLLSketch(seed=2)
+    left.update(values[:150_000])
+    right.update(values[150_000:])
+    left.merge(right)
+    assert left.n == len(values)
+    assert np.abs(left.cdf(probes) - true_cdf).max() < 0.02
+
+    restored = KLLSketch.from_dict(sketch.to_dict())
+    np.testing.assert_array_equal(restored.cdf(probes), sketch.cdf(probes))
@@ -0,0 +1,86 @@
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from youtube_success_ml.config import TrainingConfig
+from youtube_success_ml.data.loader import load_dataset
+from youtube_success_ml.models.supervised import train_supervised_bundle
+from youtube_success_ml.schemas import PredictionRequest
+from youtube_success_ml.services.intelligence_service import IntelligenceService
+from youtube_success_ml.services.stream_scoring import MAX_LINE_BYTES, NDJSONPredictionStream
+
+ROWS = [
+    {"uploads": 100, "category": "Music", "country": "India", "age": 3},
+    {"uploads": 900, "category": "Education", "country": "United States", "age": 7},
+    {"uploads": 40, "category": "Gaming", "country": "Brazil", "age": 1},
+]
+
+
+@pytest.fixture(scope="module")
+def service(tmp_path_factory: pytest.TempPathFactory) -> IntelligenceService:
+    model_dir: Path = tmp_path_factory.mktemp("stream")
+    bundle = train_supervised_bundle(
+        load_dataset(), config=TrainingConfig(n_estimators=5), model_dir=model_dir
+    )
+    return IntelligenceService(supervised=bundle, clustering=None, baseline=None)
+
+
+def _run(scorer: NDJSONPredictionStream, body: bytes, piece: int) -> list[dict]:
+    output = b"".join(scorer.feed(body[i : i + piece]) for i in range(0, len(body), piece))
+    output += scorer.close()
+    return [json.loads(line) for line in output.splitlines()]
+
+
+def test_stream_scores_rows_split_across_chunks(service):
+    lines = [json.dumps(row) for row in ROWS]
+    lines.insert(1, '{"uploads": -5, "category": "Music", "country": "India", "age": 3}')
+    lines.insert(3, "not json")
+    lines.insert(4, "")
+    body = ("\n".join(lines) + "\n").encode()
+
+    records = _run(NDJSONPredictionStream(service, chunk_size=2), body, piece=7)
+
+    expected = service.predict_batch([PredictionRequest(**row) for row in ROWS])["records"]
+    scored = [r for r in records if "predicted_subscribers" in r]
+    assert [r.pop("line") for r in scored] == [1, 3, 6]
+    assert scored == expected
+    errors = [r for r in records if "error" in r]
+    assert [r["line"] for r in errors] == [2, 4]
+    assert "uploads" in errors[0]["error"]
+    assert records[-1] == {"summary": {"lines": 6, "scored": 3, "errors": 2}}
+
+
+def test_stream_accepts_gzip_and_rejects_oversized_lines(service):
+    oversized = json.dumps({**ROWS[0], "category": "x" * (MAX_LINE_BYTES + 1)})
+    body = gzip.compress(
+        ("\n".join([json.dumps(ROWS[0]), oversized, json.dumps(ROWS[1])])).encode()
+    )
+
+    records = _run(NDJSONPredictionStream(service, compressed=True), body, piece=64)
+
+    assert [r.get("line") for r in records[:-1]] == [1, 2, 3]
+    assert "exceeds" in records[1]["error"]
+    assert records[-1]["summary"] == {"lines": 3, "scored": 2, "errors": 1}
+
+    truncated = _run(NDJSONPredictionStream(service, compressed=True), body[:-8], piece=64)
+    assert truncated[-2]["error"] == "truncated gzip stream"
+
+    trailing = NDJSONPredictionStream(service, compressed=True)
+    records = _run(trailing, body + b"{}", piece=len(body) + 2)
+    assert "trailing data" in records[-2]["error"] and records[-2]["line"] is None
+    assert trailing.error == records[-2]["error"]
+
+
+def test_stream_drains_gzip_output_held_back_by_the_inflate_step(service, monkeypatch):
+    # Highly compressible rows inflate to many steps from a tiny body fed in one piece.
+    monkeypatch.setattr("youtube_success_ml.services.stream_scoring._INFLATE_STEP", 256)
+    rows = [json.dumps(ROWS[i % len(ROWS)]) for i in range(400)]
+    body = gzip.compress(("\n".join(rows) + "\n").encode())
+
+    scorer = NDJSONPredictionStream(service, chunk_size=50, compressed=True)
+    records = _run(scorer, body, piece=len(body))
+
+    assert scorer.error is None
+    assert records[-1]["summary"] == {"lines": 400, "scored": 400, "errors": 0}
@@ -0,0 +1,89 @@
+import pandas as pd
+import pytest
+
+from youtube_success_ml.data.loader import (
+    iter_dataset,
+    load_dataset,
+    load_raw_dataset,
+    profile_dataset,
+)
+from youtube_success_ml.mlops.drift import (
+    BASELINE_COLUMNS,
+    build_training_baseline,
+    build_training_baseline_streaming,
+)
+from youtube_success_ml.mlops.feature_store import (
+    SNAPSHOT_COLUMNS,
+    save_feature_snapshot,
+    save_feature_snapshot_streaming,
+)
+from youtube_success_ml.mlops.quality import (
+    build_data_quality_report,
+    build_data_quality_report_streaming,
+)
+
+# Deliberately uneven so chunks see different category subsets and missing-year rows.
+CHUNKSIZE = 97
+
+
+def test_iter_dataset_chunks_concatenate_to_load_dataset():
+    profile = profile_dataset(chunksize=CHUNKSIZE)
+    chunks = list(iter_dataset(chunksize=CHUNKSIZE, profile=profile))
+
+    assert len(chunks) > 1
+    assert profile.age_median == load_dataset()["age"].median()
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), load_dataset())
+
+
+def test_streaming_reports_match_in_memory_builders(tmp_path):
+    raw, processed = load_raw_dataset(), load_dataset()
+
+    report = build_data_quality_report_streaming(chunksize=CHUNKSIZE)
+    # Few enough distinct values that the sketches are still counting exactly.
+    bounds = report.pop("error_bounds")
+    assert bounds["raw_duplicates"] == bounds["processed_duplicates"] == 0
+    assert report == build_data_quality_report(raw, processed)
+
+    expected = build_training_baseline(processed)
+    baseline = build_training_baseline_streaming(
+        iter_dataset(chunksize=CHUNKSIZE, columns=BASELINE_COLUMNS)
+    )
+    assert baseline["categorical"] == expected["categorical"]
+    for col, stats in expected["numeric"].items():
+        assert baseline["numeric"][col] == pytest.approx(stats)
+        distribution = baseline["distributions"][col]
+        assert distribution["histogram"] == expected["distributions"][col]["histogram"]
+        assert distribution["kll"]["n"] == len(processed)
+
+    save_feature_snapshot(processed, tmp_path / "full.csv")
+    save_feature_snapshot_streaming(
+        iter_dataset(chunksize=CHUNKSIZE, columns=SNAPSHOT_COLUMNS), tmp_path / "chunked.csv"
+    )
+    full = pd.read_csv(tmp_path / "full.csv").drop(columns="event_timestamp")
+    chunked = pd.read_csv(tmp_path / "chunked.csv")
+    assert chunked["event_timestamp"].nunique() == 1
+    pd.testing.assert_frame_equal(chunked.drop(columns="event_timestamp"), full)
+
+
+def test_streaming_quality_report_matches_on_chunk_dependent_dtypes(tmp_path):
+    # The fourth row duplicates the first, but its chunk reads ``population`` as float
+    # (a missing value); ``notes`` only turns to text in the last chunk, and the age of
+    # the second row is only known once the whole-file median is.
+    path = tmp_path / "channels.csv"
+    path.write_text(
+        "Youtuber,category,Country,Abbreviation,created_year,uploads,subscribers,"
+        "highest_yearly_earnings,subscribers_for_last_30_days,Population,notes\n"
+        "a,Music,India,IN,2010,10,100,5.0,1,1000,1\n"
+        "b,Games,Brazil,BR,,20,200,6.0,2,2000,1\n"
+        "c,Games,Brazil,BR,2012,30,300,7.0,3,,1\n"
+        "a,Music,India,IN,2010,10,100,5.0,1,1000,1\n"
+        "d,Music,India,IN,2014,40,400,8.0,4,4000,unknown\n",
+        encoding="latin-1",
+    )
+    raw, processed = load_raw_dataset(path), load_dataset(path)
+
+    report = build_data_quality_report_streaming(path, chunksize=2)
+    report.pop("error_bounds")
+    assert report["raw"]["duplicates"] == report["processed"]["duplicates"] == 1
+    assert "notes" not in report["processed"]["numeric_summary"]
+    assert report == build_data_quality_report(raw, processed)
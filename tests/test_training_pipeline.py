@@ -1,10 +1,34 @@
+import json
 from pathlib import Path
 
+import joblib
+import numpy as np
+import pytest
+from sklearn.compose import TransformedTargetRegressor
+from sklearn.ensemble import RandomForestRegressor
+
 from youtube_success_ml.config import REPORT_DIR, TrainingConfig
 from youtube_success_ml.data.loader import load_dataset
 from youtube_success_ml.mlops.registry import MANIFEST_PATH, REGISTRY_PATH
-from youtube_success_ml.models.clustering import train_clustering_bundle
-from youtube_success_ml.models.supervised import train_supervised_bundle
+from youtube_success_ml.models.clustering import (
+    CLUSTER_FEATURES,
+    load_clustering_bundle,
+    predict_kmeans_clusters,
+    train_clustering_bundle,
+)
+from youtube_success_ml.models.compiled import batch_predict_compiled, compile_supervised_bundle
+from youtube_success_ml.models.supervised import (
+    FEATURE_COLUMNS,
+    MULTI_OUTPUT_KEY,
+    SUPERVISED_MODES,
+    _build_base_pipeline,
+    batch_predict_from_bundle,
+    evaluate_supervised_mode,
+    load_supervised_bundle,
+    shared_preprocessor,
+    top_feature_importance,
+    train_supervised_bundle,
+)
 from youtube_success_ml.train import run_training
 
 
@@ -21,6 +45,62 @@ def test_train_supervised_bundle(tmp_path: Path):
         assert "r2" in metric
 
 
+def test_supervised_bundle_stores_one_shared_preprocessor(tmp_path: Path):
+    df = load_dataset()
+    bundle = train_supervised_bundle(df, config=TrainingConfig(n_estimators=10), model_dir=tmp_path)
+
+    assert bundle.preprocessor is not None
+    assert all(isinstance(model, RandomForestRegressor) for model in bundle.models.values())
+
+
+def test_shared_preprocessor_rejects_divergent_encoders():
+    df = load_dataset()
+    cfg = TrainingConfig(n_estimators=5)
+    regressors = {}
+    for key, rows in {"subscribers": df, "earnings": df.head(200)}.items():
+        regressor = TransformedTargetRegressor(
+            regressor=_build_base_pipeline(cfg), func=np.log1p, inverse_func=np.expm1
+        )
+        regressors[key] = regressor.fit(rows[FEATURE_COLUMNS], rows["subscribers"])
+
+    with pytest.raises(ValueError, match="differs"):
+        shared_preprocessor(regressors)
+
+
+def test_multi_output_mode_serves_all_targets(tmp_path: Path):
+    df = load_dataset()
+    cfg = TrainingConfig(n_estimators=10, supervised_mode="multi_output")
+    train_supervised_bundle(df, config=cfg, model_dir=tmp_path)
+    bundle = load_supervised_bundle(tmp_path)
+
+    assert list(bundle.models) == [MULTI_OUTPUT_KEY]
+    assert bundle.metadata["n_trees"] == 10
+    assert set(bundle.metrics) == {"subscribers", "earnings", "growth"}
+
+    payloads = df[FEATURE_COLUMNS].head(50).to_dict(orient="records")
+    records = batch_predict_from_bundle(bundle, payloads)
+    compiled = batch_predict_compiled(compile_supervised_bundle(bundle), payloads)
+    assert len(records) == 50
+    for expected, actual in zip(records, compiled, strict=True):
+        for key, value in expected.items():
+            assert value >= 0
+            assert actual[key] == pytest.approx(value, rel=1e-9, abs=1e-6)
+
+    assert len(top_feature_importance(bundle, target="growth", top_n=5)) == 5
+
+
+def test_mode_comparison_reports_holdout_metrics_without_refitting(tmp_path: Path):
+    df = load_dataset()
+    cfg = TrainingConfig(n_estimators=5, supervised_mode="multi_output")
+    bundle = train_supervised_bundle(df, config=cfg, model_dir=tmp_path)
+
+    summary = evaluate_supervised_mode(df, config=cfg, mode="multi_output")
+    assert summary["metrics"] == bundle.metrics
+    assert summary["n_trees"] == bundle.metadata["n_trees"]
+    # Fitted on the training split only, so the holdout trees are smaller than deployed ones.
+    assert summary["n_nodes"] < bundle.metadata["n_nodes"]
+
+
 def test_train_clustering_bundle(tmp_path: Path):
     df = load_dataset()
     cfg = TrainingConfig()
@@ -32,9 +112,33 @@ def test_train_clustering_bundle(tmp_path: Path):
     assert len(bundle.cluster_profiles) >= 1
 
 
+def test_folded_kmeans_assignment_matches_pipeline(tmp_path: Path):
+    df = load_dataset()
+    bundle, enriched = train_clustering_bundle(df, config=TrainingConfig(), model_dir=tmp_path)
+
+    rng = np.random.default_rng(7)
+    frame = df[CLUSTER_FEATURES].fillna(0)
+    noisy = frame * rng.uniform(0.0, 3.0, size=frame.shape)
+    for X in (frame, noisy):
+        cluster_ids, archetypes = predict_kmeans_clusters(bundle, X)
+        expected = bundle.kmeans_pipeline.predict(X)
+        assert np.array_equal(cluster_ids, expected)
+        assert archetypes == [bundle.cluster_name_map[int(c)] for c in expected]
+    assert enriched["kmeans_cluster"].tolist() == predict_kmeans_clusters(bundle, frame)[0].tolist()
+
+    # Bundles pickled before centroid folding existed are folded on load.
+    del bundle.raw_centroids, bundle.feature_weights
+    joblib.dump(bundle, tmp_path / "clustering_bundle.joblib")
+    legacy = load_clustering_bundle(tmp_path)
+    assert legacy.raw_centroids.shape == (TrainingConfig().n_clusters, len(CLUSTER_FEATURES))
+    assert np.array_equal(predict_kmeans_clusters(legacy, noisy)[0], cluster_ids)
+
+
 def test_run_training_produces_mlops_artifacts():
     run_training(run_maps=False)
     assert (REPORT_DIR / "training_metrics.json").exists()
+    metrics = json.loads((REPORT_DIR / "training_metrics.json").read_text(encoding="utf-8"))
+    assert set(metrics["supervised_mode_comparison"]) == set(SUPERVISED_MODES)
     assert (REPORT_DIR / "data_quality_report.json").exists()
     assert (REPORT_DIR / "training_baseline.json").exists()
     assert (REPORT_DIR / "feature_store_snapshot.csv").exists()
@@ -0,0 +1,195 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from youtube_success_ml import config
+from youtube_success_ml.api import dependencies
+from youtube_success_ml.api.warmup import ServiceWarmup
+from youtube_success_ml.services.intelligence_service import IntelligenceService
+from youtube_success_ml.services.prediction_cache import PredictionCache
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+@pytest.fixture(scope="module")
+def trained_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One small training run, written through the ``YTS_ARTIFACT_DIR`` override.
+
+    Path settings are fixed once imported, so training runs in a fresh interpreter.
+    """
+    artifact_dir = tmp_path_factory.mktemp("warmup-artifacts")
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(SRC_DIR), os.getenv("PYTHONPATH", "")]),
+        "YTS_ARTIFACT_DIR": str(artifact_dir),
+        "YTS_N_ESTIMATORS": "10",
+    }
+    for name in ("YTS_MODEL_DIR", "YTS_REPORT_DIR", "YTS_MAP_DIR"):
+        env.pop(name, None)
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from youtube_success_ml.train import run_training; run_training(run_maps=False)",
+        ],
+        check=True,
+        capture_output=True,
+        env=env,
+    )
+    return artifact_dir
+
+
+@pytest.fixture
+def artifacts(trained_dir: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the readiness check at the module's training run."""
+    monkeypatch.setattr(config, "ARTIFACT_DIR", trained_dir, raising=False)
+    monkeypatch.setattr(config, "MODEL_DIR", trained_dir / "models", raising=False)
+    monkeypatch.setattr(config, "REPORT_DIR", trained_dir / "reports", raising=False)
+    return trained_dir
+
+
+def _load_service(artifact_dir: Path) -> IntelligenceService:
+    return IntelligenceService.from_artifacts(
+        model_dir=artifact_dir / "models", report_dir=artifact_dir / "reports"
+    )
+
+
+def test_service_warm_up_covers_every_path_without_touching_cache_or_drift(trained_dir):
+    service = _load_service(trained_dir)
+    service.cache = PredictionCache(max_size=64)
+
+    timings = service.warm_up()
+
+    assert set(timings) == {
+        "predict",
+        "batch",
+        "columnar",
+        "simulate",
+        "recommendation",
+        "cluster",
+    }
+    assert all(seconds >= 0 for seconds in timings.values())
+    assert len(service.cache) == 0
+    assert service.drift_monitor is None or service.drift_monitor.observed_total == 0
+    assert "upload_breakpoints" in service.__dict__
+
+
+def test_service_warmup_states_and_retry_after_failure():
+    attempts = []
+
+    class FakeService:
+        def warm_up(self):
+            return {"predict": 0.001}
+
+    def load():
+        attempts.append(None)
+        if len(attempts) == 1:
+            raise FileNotFoundError("bundle missing")
+        return FakeService()
+
+    warmup = ServiceWarmup(load)
+    assert warmup.state == "idle"
+    assert warmup.start()
+    assert not warmup.wait(timeout=5)
+    assert warmup.status()["state"] == "failed"
+    assert warmup.error == "bundle missing"
+
+    assert warmup.start()
+    assert warmup.wait(timeout=5)
+    assert not warmup.start()
+    status = warmup.status()
+    assert status["paths"] == {"predict": 0.001}
+    assert status["load_seconds"] >= 0 and status["warmup_seconds"] >= 0
+    assert "service_warmup_ready 1" in warmup.render_metrics()
+
+
+def test_concurrent_service_loads_share_one_instance(monkeypatch):
+    loads = []
+
+    def from_artifacts():
+        loads.append(None)
+        time.sleep(0.2)
+        return object()
+
+    monkeypatch.setattr(
+        dependencies,
+        "intelligence_service",
+        SimpleNamespace(IntelligenceService=SimpleNamespace(from_artifacts=from_artifacts)),
+    )
+    monkeypatch.setattr(dependencies, "_service", None)
+    warmup = ServiceWarmup(dependencies.get_service)
+    warmup.start()
+    services = []
+    threads = [
+        threading.Thread(target=lambda: services.append(dependencies.get_service()))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    warmup.wait(timeout=5)
+
+    assert len(loads) == 1
+    assert len({id(service) for service in services}) == 1
+
+
+def test_fastapi_ready_is_gated_on_startup_warmup(artifacts, monkeypatch):
+    from youtube_success_ml.api.fastapi_app import app
+
+    release = threading.Event()
+
+    def slow_load():
+        release.wait(timeout=30)
+        return _load_service(artifacts)
+
+    warmup = ServiceWarmup(slow_load)
+    monkeypatch.setattr(dependencies, "_service_warmup", warmup)
+
+    with TestClient(app) as client:
+        assert warmup.state == "loading"
+        pending = client.get("/ready")
+        assert pending.status_code == 503
+        assert pending.text == "not_ready warmup=loading\n"
+
+        release.set()
+        assert warmup.wait(timeout=60)
+        ready = client.get("/ready")
+        assert ready.status_code == 200
+        assert ready.text.startswith("ready load_seconds=")
+        assert "warmup_seconds=" in ready.text
+        assert "service_warmup_ready 1" in client.get("/metrics").text
+
+
+def test_flask_ready_starts_warmup_and_waits_for_it(artifacts, monkeypatch):
+    from youtube_success_ml.api import flask_app
+
+    release = threading.Event()
+
+    def slow_load():
+        release.wait(timeout=30)
+        return _load_service(artifacts)
+
+    warmup = ServiceWarmup(slow_load)
+    monkeypatch.setattr(flask_app, "warmup", warmup)
+    monkeypatch.setattr(flask_app, "WARMUP_ENABLED", True)
+    client = flask_app.app.test_client()
+
+    # Under a WSGI server nothing calls start(); the first request must, and an idle or
+    # running warm-up is not ready.
+    pending = client.get("/ready")
+    assert pending.status_code == 503
+    assert pending.get_json()["warmup"]["state"] == "loading"
+
+    release.set()
+    assert warmup.wait(timeout=60)
+    body = client.get("/ready").get_json()
+    assert body["status"] == "ready"
+    assert set(body["warmup"]["paths"]) >= {"predict", "batch", "simulate", "cluster"}